@@ -1,118 +1,65 @@
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+import time
+
+# Cold start ölçümü modül yüklenmeden önce başlar
+_BOOT_STARTED = time.perf_counter()
+
 import sys
 import os
-from typing import Dict, Any
-from pydantic import BaseModel
 
-app = FastAPI(
-    title="AI Ruleset Generator API",
-    description="API for generating project rulesets using AI",
-    version="1.0.0"
-)
+# Proje kökünü import yoluna bir kez ekle (her istekte değil)
+project_root = os.path.join(os.path.dirname(__file__), '..')
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+from fastapi import Request
+from main import app
 
-# Request models
-class RulesetRequest(BaseModel):
-    project_type: str = "web"
-    language: str = "javascript"
-    description: str = ""
+# Yalnızca modül yükleme süresi: provider'lar (ve SDK'ları) ilk kullanan istekte kurulur,
+# bu süre init'e değil o isteğin X-Invocation-Duration-Ms değerine dahildir; sıcak container'da paylaşılır
+_INIT_DURATION_MS = (time.perf_counter() - _BOOT_STARTED) * 1000
 
-@app.get("/")
-async def home():
-    return {
-        "message": "AI Ruleset Generator API is working!", 
-        "status": "ok",
-        "version": "1.0.0"
-    }
+_invocation_stats = {
+    "cold": {"count": 0, "total_ms": 0.0},
+    "warm": {"count": 0, "total_ms": 0.0}
+}
+_is_cold = True
 
-@app.get("/health")
-async def health():
-    return {
-        "status": "healthy", 
-        "version": "1.0.0"
-    }
+@app.middleware("http")
+async def measure_invocation(request: Request, call_next):
+    """Cold ve warm çağrı sürelerini ayrı ayrı ölç"""
+    global _is_cold
+    kind = "cold" if _is_cold else "warm"
+    _is_cold = False
+    
+    started = time.perf_counter()
+    response = await call_next(request)
+    duration_ms = (time.perf_counter() - started) * 1000
+    
+    _invocation_stats[kind]["count"] += 1
+    _invocation_stats[kind]["total_ms"] += duration_ms
+    
+    response.headers["X-Invocation"] = kind
+    response.headers["X-Invocation-Duration-Ms"] = f"{duration_ms:.1f}"
+    if kind == "cold":
+        response.headers["X-Cold-Start-Init-Ms"] = f"{_INIT_DURATION_MS:.1f}"
+    return response
 
 @app.get("/test")
 async def test():
     return {
         "test": "successful",
-        "environment": "vercel", 
+        "environment": "vercel",
         "python_version": sys.version,
-        "current_dir": os.getcwd()
-    }
-
-@app.post("/generate-ruleset")
-async def generate_ruleset(request_data: RulesetRequest):
-    try:
-        project_type = request_data.project_type
-        language = request_data.language
-        description = request_data.description
-        
-        # Try to use AI service if available
-        try:
-            # Add project root to path for imports
-            project_root = os.path.join(os.path.dirname(__file__), '..')
-            if project_root not in sys.path:
-                sys.path.insert(0, project_root)
-            
-            from app.services.ai_service import AIService
-            
-            ai_service = AIService()
-            result = ai_service.generate_simple_ruleset(
-                project_type=project_type,
-                language=language,
-                description=description
-            )
-            
-            return {"ruleset": result, "source": "AI Generated"}
-            
-        except Exception as ai_error:
-            # Fallback to basic ruleset if AI fails
-            basic_ruleset = {
-                "project_type": project_type,
-                "language": language,
-                "description": description,
-                "rules": [
-                    f"Use {language} best practices",
-                    "Implement consistent code formatting",
-                    "Write meaningful variable and function names",
-                    "Add comprehensive error handling",
-                    "Include unit tests for all functions",
-                    "Document your code with comments",
-                    "Follow security best practices",
-                    "Optimize for performance"
-                ],
-                "tools": _get_tools_for_language(language),
-                "note": f"Basic ruleset for {project_type} project. AI service unavailable: {str(ai_error)}"
+        "current_dir": os.getcwd(),
+        "init_duration_ms": round(_INIT_DURATION_MS, 1),
+        "invocations": {
+            kind: {
+                "count": stats["count"],
+                "avg_ms": round(stats["total_ms"] / stats["count"], 1) if stats["count"] else None
             }
-            
-            return {"ruleset": basic_ruleset, "source": "Fallback Template"}
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-def _get_tools_for_language(language):
-    """Get recommended tools based on programming language"""
-    tools_map = {
-        'javascript': ['ESLint', 'Prettier', 'Jest', 'Webpack'],
-        'typescript': ['TSLint', 'Prettier', 'Jest', 'TypeScript Compiler'],
-        'python': ['Black', 'Flake8', 'pytest', 'mypy'],
-        'java': ['Checkstyle', 'PMD', 'JUnit', 'Maven/Gradle'],
-        'react': ['ESLint', 'Prettier', 'Jest', 'React Testing Library'],
-        'vue': ['ESLint', 'Prettier', 'Vue Test Utils', 'Vite'],
-        'angular': ['TSLint', 'Prettier', 'Jasmine', 'Angular CLI']
+            for kind, stats in _invocation_stats.items()
+        }
     }
-    return tools_map.get(language.lower(), ['ESLint', 'Prettier', 'Jest'])
 
 # Vercel handler - Bu çok önemli!
 handler = app
@@ -0,0 +1,110 @@
+"""
+Yanıt sıkıştırma (brotli/gzip) middleware'i ve Accept-Encoding negotiation
+"""
+import gzip
+from typing import Iterable, Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli opsiyonel; yoksa yalnızca gzip sunulur
+    brotli = None
+
+# Tercih sırası: brotli aynı seviyede gzip'ten daha küçük çıktı üretir
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+def negotiate_encoding(accept_encoding: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """İstemcinin kabul ettiği (q=0 olmayan) en iyi encoding'i seç"""
+    accepted = set()
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    for encoding in available:
+        if encoding in accepted:
+            return encoding
+    return None
+
+def is_compressible(content_type: str) -> bool:
+    """Metin tabanlı içerik türleri sıkıştırılır (görseller vb. zaten sıkıştırılmış)"""
+    content_type = content_type.lower()
+    return (
+        content_type.startswith("text/")
+        or "json" in content_type
+        or "xml" in content_type
+        or "javascript" in content_type
+    )
+
+class CompressionMiddleware:
+    """minimum_size'dan büyük tek parça yanıtları brotli veya gzip ile sıkıştır
+    
+    Streaming yanıtlar (SSE, NDJSON) parça gecikmesi artmasın diye olduğu gibi geçer;
+    zaten Content-Encoding taşıyan yanıtlara (ör. ön-sıkıştırılmış katalog) dokunulmaz.
+    """
+    
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"), SUPPORTED_ENCODINGS)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        await self.app(scope, receive, _CompressionResponder(self, encoding, send).send)
+    
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+class _CompressionResponder:
+    """Başlıkları ilk body parçası gelene kadar tutar, sonra sıkıştırıp sıkıştırmamaya karar verir"""
+    
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Optional[Message] = None
+        self._decided = False
+    
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if self._decided or message["type"] != "http.response.body":
+            await self._send(message)
+            return
+        
+        self._decided = True
+        start = self._start
+        headers = MutableHeaders(raw=start["headers"])
+        body = message.get("body", b"")
+        
+        # Streaming yanıtlar (SSE, NDJSON) parça gecikmesi artmasın diye olduğu gibi geçer;
+        # zaten Content-Encoding taşıyanlara (ör. ön-sıkıştırılmış katalog) dokunulmaz
+        if (
+            message.get("more_body", False)
+            or "content-encoding" in headers
+            or len(body) < self.middleware.minimum_size
+            or not is_compressible(headers.get("content-type", ""))
+        ):
+            await self._send(start)
+            await self._send(message)
+            return
+        
+        compressed = self.middleware.compress(body, self.encoding)
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": compressed})
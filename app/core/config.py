@@ -16,9 +16,11 @@ class Settings:
     VERSION: str = "1.0.0"
     
     # Server Ayarları
-    HOST: str = "127.0.0.1"
-    PORT: int = 8001
-    DEBUG: bool = True
+    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")  # "development", "production"
+    HOST: str = os.getenv("HOST", "127.0.0.1" if ENVIRONMENT == "development" else "0.0.0.0")
+    PORT: int = int(os.getenv("PORT", "8001"))
+    # Reloader yalnızca development'ta varsayılan olarak açık
+    DEBUG: bool = os.getenv("DEBUG", "true" if ENVIRONMENT == "development" else "false").lower() == "true"
     
     # CORS Ayarları
     ALLOWED_ORIGINS: list = [
@@ -33,21 +35,173 @@ class Settings:
     # AI Provider Ayarları
     AI_PROVIDER: str = os.getenv("AI_PROVIDER", "gemini")
     
+    # Failover havuzuna alınacak provider'lar (yalnızca API key'i olanlar kullanılır)
+    AI_PROVIDER_POOL: str = os.getenv("AI_PROVIDER_POOL", "gemini,openai")
+    
+    # Provider routing / circuit breaker ayarları
+    PROVIDER_TIMEOUT: float = float(os.getenv("PROVIDER_TIMEOUT", "90"))
+    PROVIDER_EWMA_ALPHA: float = float(os.getenv("PROVIDER_EWMA_ALPHA", "0.2"))
+    PROVIDER_FAILURE_THRESHOLD: int = int(os.getenv("PROVIDER_FAILURE_THRESHOLD", "3"))
+    PROVIDER_COOLDOWN: float = float(os.getenv("PROVIDER_COOLDOWN", "30"))
+    
+    # Retry ve Hedge Ayarları (provider başına <PROVIDER>_MAX_RETRIES / <PROVIDER>_HEDGE ile ezilebilir)
+    PROVIDER_MAX_RETRIES: int = int(os.getenv("PROVIDER_MAX_RETRIES", "2"))
+    PROVIDER_BACKOFF_BASE: float = float(os.getenv("PROVIDER_BACKOFF_BASE", "0.5"))
+    PROVIDER_BACKOFF_MAX: float = float(os.getenv("PROVIDER_BACKOFF_MAX", "8"))
+    PROVIDER_RETRY_AFTER_MAX: float = float(os.getenv("PROVIDER_RETRY_AFTER_MAX", "30"))  # Daha uzun Retry-After'da failover
+    PROVIDER_HEDGE: bool = os.getenv("PROVIDER_HEDGE", "false").lower() == "true"
+    PROVIDER_HEDGE_QUANTILE: float = float(os.getenv("PROVIDER_HEDGE_QUANTILE", "0.95"))
+    PROVIDER_HEDGE_MIN_DELAY: float = float(os.getenv("PROVIDER_HEDGE_MIN_DELAY", "1.0"))
+    PROVIDER_HEDGE_MIN_SAMPLES: int = int(os.getenv("PROVIDER_HEDGE_MIN_SAMPLES", "20"))
+    
+    # Provider başına eşzamanlı upstream istek limiti
+    AI_MAX_CONCURRENCY: int = int(os.getenv("AI_MAX_CONCURRENCY", "32"))
+    
+    # Tek bir üretim isteğinin en fazla bekleyeceği süre (saniye)
+    GENERATION_TIMEOUT: float = float(os.getenv("GENERATION_TIMEOUT", "120"))
+    
+    # Production Sunucu Ayarları (gunicorn.conf.py ve python main.py)
+    WORKERS: int = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+    SERVER_LOOP: str = os.getenv("SERVER_LOOP", "auto")  # "auto" (uvloop kuruluysa), "uvloop", "asyncio"
+    SERVER_HTTP: str = os.getenv("SERVER_HTTP", "auto")  # "auto" (httptools kuruluysa), "httptools", "h11"
+    SERVER_BACKLOG: int = int(os.getenv("SERVER_BACKLOG", "2048"))
+    # Load balancer idle timeout'undan (genelde 60s) uzun olmalı; yoksa LB kapanmış bağlantıya istek gönderir
+    SERVER_KEEP_ALIVE: int = int(os.getenv("SERVER_KEEP_ALIVE", "75"))
+    # Kapanışta devam eden üretimlerin bitmesi için beklenen süre
+    SERVER_GRACEFUL_TIMEOUT: int = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", str(int(GENERATION_TIMEOUT) + 10)))
+    SERVER_MAX_REQUESTS: int = int(os.getenv("SERVER_MAX_REQUESTS", "0"))  # 0: worker'lar yeniden başlatılmaz
+    # Provider SDK'larını worker'lar fork edilmeden önce master süreçte yükle
+    PRELOAD_PROVIDERS: bool = os.getenv("PRELOAD_PROVIDERS", "true").lower() == "true"
+    
+    # Batch Ayarları
+    BATCH_MAX_ITEMS: int = int(os.getenv("BATCH_MAX_ITEMS", "100"))
+    BATCH_MAX_CONCURRENCY: int = int(os.getenv("BATCH_MAX_CONCURRENCY", "8"))
+    
+    # Üretim stratejisi ("single": tek prompt, "sections": bölümler paralel üretilip sırayla birleştirilir)
+    GENERATION_STRATEGY: str = os.getenv("GENERATION_STRATEGY", "single")
+    SECTION_MAX_CONCURRENCY: int = int(os.getenv("SECTION_MAX_CONCURRENCY", "12"))
+    SECTION_MIN_OUTPUT_TOKENS: int = int(os.getenv("SECTION_MIN_OUTPUT_TOKENS", "400"))
+    
+    # Asenkron Job Ayarları
+    JOB_STORE_BACKEND: str = os.getenv("JOB_STORE_BACKEND", "memory")  # "memory", "sqlite"
+    JOB_STORE_PATH: str = os.getenv("JOB_STORE_PATH", "jobs.db")
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "4"))
+    JOB_QUEUE_MAX_SIZE: int = int(os.getenv("JOB_QUEUE_MAX_SIZE", "100"))
+    JOB_RESULT_TTL: int = int(os.getenv("JOB_RESULT_TTL", "3600"))
+    JOB_MAX_WAIT: float = float(os.getenv("JOB_MAX_WAIT", "30"))
+    # Çalışan job'un updated_at'i bu aralıkla yenilenir; JOB_STALE_AFTER boyunca yenilenmeyen
+    # running job (ör. process'i ölmüş) açılan bir worker tarafından yeniden kuyruğa alınır
+    JOB_HEARTBEAT_INTERVAL: float = float(os.getenv("JOB_HEARTBEAT_INTERVAL", "10"))
+    JOB_STALE_AFTER: float = float(os.getenv("JOB_STALE_AFTER", "60"))
+    JOB_RETRY_AFTER: int = int(os.getenv("JOB_RETRY_AFTER", "5"))
+    
+    # Rate Limiting Ayarları (istemci başına token bucket)
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory")  # "memory", "sqlite" (worker'lar arası paylaşımlı)
+    RATE_LIMIT_PATH: str = os.getenv("RATE_LIMIT_PATH", "rate_limit.db")
+    RATE_LIMIT_PER_MINUTE: float = float(os.getenv("RATE_LIMIT_PER_MINUTE", "30"))
+    RATE_LIMIT_BURST: int = int(os.getenv("RATE_LIMIT_BURST", "10"))
+    RATE_LIMIT_KEY_HEADER: str = os.getenv("RATE_LIMIT_KEY_HEADER", "X-Client-Key")
+    # Virgülle ayrılmış tanımlı istemci anahtarları; listede olmayan header değeri yok sayılır, IP kullanılır
+    RATE_LIMIT_CLIENT_KEYS: str = os.getenv("RATE_LIMIT_CLIENT_KEYS", "")
+    RATE_LIMIT_TRUST_FORWARDED: bool = os.getenv("RATE_LIMIT_TRUST_FORWARDED", "false").lower() == "true"
+    RATE_LIMIT_MAX_CLIENTS: int = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "10000"))
+    
+    # Admission Control: worker başına eşzamanlı upstream üretim sınırı (aşılırsa 503)
+    GENERATION_MAX_IN_FLIGHT: int = int(os.getenv("GENERATION_MAX_IN_FLIGHT", "16"))
+    GENERATION_RETRY_AFTER: int = int(os.getenv("GENERATION_RETRY_AFTER", "2"))
+    
+    # Yanıt Sıkıştırma Ayarları (brotli kuruluysa br, değilse gzip)
+    COMPRESSION_ENABLED: bool = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+    
+    # Katalog endpoint'leri için Cache-Control max-age (saniye)
+    CATALOG_MAX_AGE: int = int(os.getenv("CATALOG_MAX_AGE", "3600"))
+    
+    # Health Check Ayarları
+    HEALTH_CHECK_INTERVAL: float = float(os.getenv("HEALTH_CHECK_INTERVAL", "30"))
+    HEALTH_CHECK_DEEP: bool = os.getenv("HEALTH_CHECK_DEEP", "true").lower() == "true"
+    
+    # Token Bütçesi Ayarları
+    TOKEN_CHARS_PER_TOKEN: float = float(os.getenv("TOKEN_CHARS_PER_TOKEN", "4"))
+    TOKEN_BUDGET_FRONTEND: int = int(os.getenv("TOKEN_BUDGET_FRONTEND", "3000"))
+    TOKEN_BUDGET_BACKEND: int = int(os.getenv("TOKEN_BUDGET_BACKEND", "3000"))
+    TOKEN_BUDGET_FULLSTACK: int = int(os.getenv("TOKEN_BUDGET_FULLSTACK", "4000"))
+    TOKEN_BUDGET_MAX_OUTPUT: int = int(os.getenv("TOKEN_BUDGET_MAX_OUTPUT", "8000"))
+    TOKEN_BUDGET_MAX_PROMPT: int = int(os.getenv("TOKEN_BUDGET_MAX_PROMPT", "3000"))
+    TOKEN_BUDGET_OVERFLOW: str = os.getenv("TOKEN_BUDGET_OVERFLOW", "trim")  # "trim", "reject"
+    NOTES_MAX_CHARS: int = int(os.getenv("NOTES_MAX_CHARS", "2000"))
+    REQUIREMENTS_MAX_ITEMS: int = int(os.getenv("REQUIREMENTS_MAX_ITEMS", "20"))
+    REQUIREMENT_MAX_CHARS: int = int(os.getenv("REQUIREMENT_MAX_CHARS", "200"))
+    
+    # Render edilmiş prompt memoization boyutu
+    PROMPT_CACHE_SIZE: int = int(os.getenv("PROMPT_CACHE_SIZE", "1024"))
+    
+    # Ruleset Cache Ayarları
+    RULESET_CACHE_ENABLED: bool = os.getenv("RULESET_CACHE_ENABLED", "true").lower() == "true"
+    RULESET_CACHE_BACKEND: str = os.getenv("RULESET_CACHE_BACKEND", "memory")  # "memory", "sqlite"
+    RULESET_CACHE_TTL: int = int(os.getenv("RULESET_CACHE_TTL", "86400"))
+    RULESET_CACHE_MAX_ENTRIES: int = int(os.getenv("RULESET_CACHE_MAX_ENTRIES", "1000"))
+    RULESET_CACHE_PATH: str = os.getenv("RULESET_CACHE_PATH", "ruleset_cache.db")
+    
+    # Üretim Geçmişi Ayarları (sqlite: WAL modunda kalıcı, memory: process içi)
+    HISTORY_ENABLED: bool = os.getenv("HISTORY_ENABLED", "true").lower() == "true"
+    HISTORY_BACKEND: str = os.getenv("HISTORY_BACKEND", "sqlite")  # "memory", "sqlite"
+    HISTORY_PATH: str = os.getenv("HISTORY_PATH", "history.db")
+    HISTORY_MAX_ENTRIES: int = int(os.getenv("HISTORY_MAX_ENTRIES", "100000"))
+    HISTORY_BATCH_SIZE: int = int(os.getenv("HISTORY_BATCH_SIZE", "50"))
+    HISTORY_FLUSH_INTERVAL: float = float(os.getenv("HISTORY_FLUSH_INTERVAL", "1.0"))
+    HISTORY_QUEUE_SIZE: int = int(os.getenv("HISTORY_QUEUE_SIZE", "10000"))
+    HISTORY_PAGE_SIZE: int = int(os.getenv("HISTORY_PAGE_SIZE", "20"))
+    HISTORY_MAX_PAGE_SIZE: int = int(os.getenv("HISTORY_MAX_PAGE_SIZE", "100"))
+    # Başlangıçta son üretimlerle ruleset cache'ini doldur
+    HISTORY_REHYDRATE: bool = os.getenv("HISTORY_REHYDRATE", "true").lower() == "true"
+    
+    # Benzer spec yeniden kullanımı ("off", "opt_in": yalnızca reuse=similar, "auto": reuse=exact değilse)
+    SIMILARITY_REUSE: str = os.getenv("SIMILARITY_REUSE", "opt_in")
+    SIMILARITY_MAX_DISTANCE: float = float(os.getenv("SIMILARITY_MAX_DISTANCE", "0.1"))
+    SIMILARITY_MAX_ENTRIES: int = int(os.getenv("SIMILARITY_MAX_ENTRIES", "5000"))
+    SIMILARITY_SKETCH_SIZE: int = int(os.getenv("SIMILARITY_SKETCH_SIZE", "64"))
+    SIMILARITY_SHINGLE_SIZE: int = int(os.getenv("SIMILARITY_SHINGLE_SIZE", "5"))
+    
     # Gemini AI Ayarları
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
     GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+    GEMINI_MAX_CONCURRENCY: int = int(os.getenv("GEMINI_MAX_CONCURRENCY", str(AI_MAX_CONCURRENCY)))
+    GEMINI_MAX_RETRIES: int = int(os.getenv("GEMINI_MAX_RETRIES", str(PROVIDER_MAX_RETRIES)))
+    GEMINI_HEDGE: bool = os.getenv("GEMINI_HEDGE", str(PROVIDER_HEDGE)).lower() == "true"
     
     # OpenAI Ayarları
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
+    OPENAI_MAX_CONCURRENCY: int = int(os.getenv("OPENAI_MAX_CONCURRENCY", str(AI_MAX_CONCURRENCY)))
+    OPENAI_MAX_RETRIES: int = int(os.getenv("OPENAI_MAX_RETRIES", str(PROVIDER_MAX_RETRIES)))
+    OPENAI_HEDGE: bool = os.getenv("OPENAI_HEDGE", str(PROVIDER_HEDGE)).lower() == "true"
     
     # Ollama Ayarları
     OLLAMA_BASE_URL: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     OLLAMA_MODEL: str = os.getenv("OLLAMA_MODEL", "llama3.2")
+    OLLAMA_KEEP_ALIVE: str = os.getenv("OLLAMA_KEEP_ALIVE", "30m")  # Model bellekte ne kadar kalsın
+    OLLAMA_TIMEOUT: float = float(os.getenv("OLLAMA_TIMEOUT", "300"))
+    OLLAMA_MAX_CONCURRENCY: int = int(os.getenv("OLLAMA_MAX_CONCURRENCY", str(AI_MAX_CONCURRENCY)))
+    OLLAMA_MAX_RETRIES: int = int(os.getenv("OLLAMA_MAX_RETRIES", str(PROVIDER_MAX_RETRIES)))
+    OLLAMA_HEDGE: bool = os.getenv("OLLAMA_HEDGE", str(PROVIDER_HEDGE)).lower() == "true"
+    OLLAMA_WARMUP: bool = os.getenv("OLLAMA_WARMUP", "true").lower() == "true"
     
     # Hugging Face Ayarları
     HUGGINGFACE_API_KEY: str = os.getenv("HUGGINGFACE_API_KEY", "")
     HUGGINGFACE_MODEL: str = os.getenv("HUGGINGFACE_MODEL", "microsoft/DialoGPT-medium")
+    HUGGINGFACE_BASE_URL: str = os.getenv("HUGGINGFACE_BASE_URL", "")  # TGI veya OpenAI-uyumlu sunucu
+    HUGGINGFACE_API_STYLE: str = os.getenv("HUGGINGFACE_API_STYLE", "tgi")  # "tgi", "openai"
+    HUGGINGFACE_MAX_NEW_TOKENS: int = int(os.getenv("HUGGINGFACE_MAX_NEW_TOKENS", "4000"))
+    HUGGINGFACE_TIMEOUT: float = float(os.getenv("HUGGINGFACE_TIMEOUT", "300"))
+    HUGGINGFACE_MAX_CONCURRENCY: int = int(os.getenv("HUGGINGFACE_MAX_CONCURRENCY", str(AI_MAX_CONCURRENCY)))
+    HUGGINGFACE_MAX_RETRIES: int = int(os.getenv("HUGGINGFACE_MAX_RETRIES", str(PROVIDER_MAX_RETRIES)))
+    HUGGINGFACE_HEDGE: bool = os.getenv("HUGGINGFACE_HEDGE", str(PROVIDER_HEDGE)).lower() == "true"
+    HUGGINGFACE_BATCH_SIZE: int = int(os.getenv("HUGGINGFACE_BATCH_SIZE", "8"))  # Yalnızca "openai" stilinde
+    HUGGINGFACE_BATCH_WINDOW_MS: float = float(os.getenv("HUGGINGFACE_BATCH_WINDOW_MS", "20"))
 
 # Global settings instance
 settings = Settings()
@@ -0,0 +1,39 @@
+"""
+Route şablonu başına istek sayısı ve gecikme toplayan saf ASGI middleware'i
+"""
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.services.metrics_service import http_request_duration_seconds, http_requests_total
+
+class MetricsMiddleware:
+    """http_requests_total ve http_request_duration_seconds metriklerini kaydet
+    
+    BaseHTTPMiddleware'in aksine yanıtı ara task ve stream üzerinden aktarmaz; send
+    yalnızca status kodunu okumak için sarılır. Süre yanıt gövdesi gönderilene kadar ölçülür.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.perf_counter()
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Path yerine route şablonu: /jobs/{job_id} tek seri; eşleşmeyenler tek etikette toplanır.
+            # Router eşleşen route'u aynı scope sözlüğüne yazar
+            route_path = getattr(scope.get("route"), "path", "unmatched")
+            http_request_duration_seconds.observe(time.perf_counter() - started, route_path, scope["method"])
+            http_requests_total.inc(route_path, scope["method"], str(status_code))
@@ -0,0 +1,25 @@
+"""
+Hızlı JSON serialize (orjson varsa) ve response sınıfı
+"""
+import json
+from typing import Any
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson opsiyonel; yoksa standart json kullanılır
+    orjson = None
+
+def dumps(content: Any) -> bytes:
+    """JSONResponse ile aynı çıktıyı (compact, UTF-8) daha hızlı üret"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    """Büyük ruleset ve katalog yanıtları için orjson tabanlı JSONResponse"""
+    
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
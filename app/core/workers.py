@@ -0,0 +1,15 @@
+"""
+Gunicorn için uvicorn worker'ı (yalnızca gunicorn altında import edilir)
+"""
+from uvicorn.workers import UvicornWorker
+from app.core.config import settings
+
+class RulesetUvicornWorker(UvicornWorker):
+    """Event loop ve HTTP parser'ı ayarlardan seçen uvicorn worker'ı"""
+    
+    # Keep-alive (gunicorn keepalive) ve graceful timeout gunicorn.conf.py'den gelir
+    CONFIG_KWARGS = {
+        "loop": settings.SERVER_LOOP,
+        "http": settings.SERVER_HTTP,
+        "timeout_graceful_shutdown": settings.SERVER_GRACEFUL_TIMEOUT
+    }
@@ -34,18 +34,72 @@ class ProjectInfo(BaseModel):
     deployment_platform: Optional[str] = None
     additional_requirements: Optional[List[str]] = []
     notes: Optional[str] = None
+    
+    # Üretim seçenekleri
+    max_output_tokens: Optional[int] = None  # Kategori varsayılanını ezer (TOKEN_BUDGET_MAX_OUTPUT ile sınırlı)
 
 class RulesetResponse(BaseModel):
     """Ruleset yanıt modeli"""
     markdown: str
     json_data: Dict[str, Any]
 
+class BatchRulesetRequest(BaseModel):
+    """Toplu ruleset isteği modeli"""
+    items: List[ProjectInfo]
+    concurrency: Optional[int] = None  # BATCH_MAX_CONCURRENCY ile sınırlandırılır
+
+class BatchItemResult(BaseModel):
+    """Toplu istekteki tek bir öğenin sonucu"""
+    index: int
+    status: str  # "ok", "error"
+    markdown: Optional[str] = None
+    json_data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+class BatchRulesetResponse(BaseModel):
+    """Toplu ruleset yanıt modeli"""
+    results: List[BatchItemResult]
+    total: int
+    unique: int
+    succeeded: int
+    failed: int
+
+class JobResponse(BaseModel):
+    """Asenkron job yanıt modeli"""
+    job_id: str
+    status: str  # "queued", "running", "succeeded", "failed"
+    created_at: str
+    updated_at: str
+    result: Optional[RulesetResponse] = None
+    error: Optional[str] = None
+
+class HistoryEntry(BaseModel):
+    """Üretim geçmişi kaydı (markdown yalnızca tekil kayıt isteğinde döner)"""
+    id: str
+    spec_hash: str
+    category: str
+    frontend_framework: str
+    backend_framework: str
+    ai_provider: str
+    model: str
+    strategy: str  # "single", "sections"
+    created_at: str
+    project_info: Dict[str, Any]
+    markdown: Optional[str] = None
+
+class HistoryListResponse(BaseModel):
+    """Cursor ile sayfalanan geçmiş listesi"""
+    items: List[HistoryEntry]
+    next_cursor: Optional[str] = None  # Sonraki sayfa için ?cursor= değeri, son sayfada None
+
 class HealthResponse(BaseModel):
     """Sağlık kontrolü yanıt modeli"""
     status: str
     ai_provider: str
     ai_available: bool
     message: Optional[str] = None
+    checked_at: Optional[str] = None
+    providers: Optional[Dict[str, Any]] = None
 
 class ProjectTypesResponse(BaseModel):
     """Proje türleri yanıt modeli"""
@@ -1,21 +1,140 @@
 """
 Ana API endpoint'leri
 """
-from fastapi import APIRouter, HTTPException
+from typing import AsyncIterator, Literal, Optional
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from app.models.schemas import (
     ProjectInfo, 
     RulesetResponse, 
     HealthResponse,
     ProjectTypesResponse,
-    FrameworksResponse
+    FrameworksResponse,
+    BatchRulesetRequest,
+    BatchRulesetResponse,
+    JobResponse,
+    HistoryEntry,
+    HistoryListResponse
 )
-from app.services.ai_service import ai_service
+from app.services.ai_service import ai_service, ProviderResult
+from app.services.ai_provider import ProviderError, ProviderTimeout
+from app.services.cache_service import ruleset_cache
+from app.services.coalescing_service import request_coalescer
+from app.services.health_service import health_monitor
+from app.services.generation_service import MatchType, generation_service
+from app.services.job_service import job_queue, QueueFullError
+from app.services.catalog_service import CATALOG
 from app.services.prompt_service import PromptService
-import json
+from app.services.token_budget import TokenBudgetExceeded
+from app.services.similarity_service import similarity_index
+from app.services.history_service import history_recorder
+from app.services.rate_limit_service import (
+    rate_limiter,
+    admission_controller,
+    RateLimitExceeded,
+    OverCapacityError,
+    retry_after_header
+)
+from app.services import metrics_service
+from app.services.metrics_service import CallbackMetric, generation_stage_duration_seconds, generations_in_flight
+from app.core.config import settings
+from app.core.responses import FastJSONResponse, dumps
+import asyncio
+import time
 from datetime import datetime
 
 router = APIRouter()
 
+# Accept ile seçilebilen, markdown'ı json_data içinde tekrarlamayan yanıt türü
+COMPACT_MEDIA_TYPE = "application/vnd.ruleset.compact+json"
+ResponseMode = Optional[Literal["full", "compact"]]
+# reuse=similar: exact cache ıskalanırsa SIMILARITY_MAX_DISTANCE içindeki en yakın spec'in ruleset'i döner
+ReuseMode = Optional[Literal["exact", "similar"]]
+# strategy=sections: bölümler paralel üretilip sırayla birleştirilir (varsayılan GENERATION_STRATEGY)
+Strategy = Optional[Literal["single", "sections"]]
+
+# Diğer servislerin sayaçlarını /metrics çıktısına render anında ekle
+for _name, _doc, _callback, _type in (
+    ("ruleset_cache_hits_total", "Ruleset cache isabetleri", lambda: ruleset_cache.hits, "counter"),
+    ("ruleset_cache_misses_total", "Ruleset cache ıskalamaları", lambda: ruleset_cache.misses, "counter"),
+    ("ruleset_cache_entries", "Ruleset cache kayıt sayısı", lambda: ruleset_cache.backend.size(), "gauge"),
+    ("coalescing_deduplicated_total", "Birleştirilen eşzamanlı istekler", lambda: request_coalescer.deduplicated, "counter"),
+    ("job_queue_depth", "Kuyrukta bekleyen job sayısı", lambda: job_queue.stats()["queued"], "gauge"),
+    ("rate_limit_rejections_total", "Rate limit ile reddedilen istekler", lambda: rate_limiter.rejected, "counter"),
+    ("admission_rejections_total", "Kapasite dolu olduğu için reddedilen üretimler", lambda: admission_controller.rejected, "counter"),
+    ("similarity_matches_total", "Benzer spec ile cache'ten dönen istekler", lambda: similarity_index.matches, "counter")
+):
+    metrics_service.registry.register(CallbackMetric(_name, _doc, _callback, metric_type=_type))
+
+def _catalog_response(request: Request, name: str) -> Response:
+    """Önceden serialize edilmiş katalogu ETag/Cache-Control/304 desteğiyle döndür"""
+    entry = CATALOG[name]
+    encoding = entry.negotiate(request.headers.get("accept-encoding"))
+    headers = {
+        "ETag": entry.etag_for(encoding),
+        "Cache-Control": f"public, max-age={settings.CATALOG_MAX_AGE}",
+        "Vary": "Accept-Encoding"
+    }
+    
+    # Aynı içeriğin başka bir coding'i için saklanan ETag de geçerlidir; 304 seçilen varyantın ETag'ini taşır
+    if entry.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        return Response(content=entry.encoded[encoding], media_type="application/json", headers=headers)
+    
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+async def _check_rate_limit(request: Request, cost: int = 1) -> None:
+    """İstemcinin bucket'ı boşsa 429 + Retry-After döndür"""
+    try:
+        await rate_limiter.check(request, cost)
+    except RateLimitExceeded as e:
+        raise HTTPException(
+            status_code=429,
+            detail="Rate limit exceeded, try again later",
+            headers=retry_after_header(e.retry_after)
+        )
+
+def _over_capacity() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Too many generations in flight, try again later",
+        headers=retry_after_header(settings.GENERATION_RETRY_AFTER)
+    )
+
+def _include_content(request: Request, mode: ResponseMode) -> bool:
+    """mode=compact veya Accept: application/vnd.ruleset.compact+json ise ruleset_content çıkarılır"""
+    if mode is not None:
+        return mode == "full"
+    return COMPACT_MEDIA_TYPE not in request.headers.get("accept", "")
+
+def _json_response(content: dict, request: Request, include_content: bool) -> FastJSONResponse:
+    """orjson ile serialize et; compact Accept ile istendiyse aynı media type ile dön"""
+    media_type = COMPACT_MEDIA_TYPE if not include_content and COMPACT_MEDIA_TYPE in request.headers.get("accept", "") else None
+    with generation_stage_duration_seconds.time("json_encode"):
+        return FastJSONResponse(content=content, media_type=media_type, headers={"Vary": "Accept"})
+
+def _sse_event(event: str, data: dict) -> str:
+    """Server-Sent Event formatında tek bir olay üret"""
+    return f"event: {event}\ndata: {dumps(data).decode('utf-8')}\n\n"
+
+async def _with_deadline(events: AsyncIterator[str], timeout: float) -> AsyncIterator[str]:
+    """Olay akışını toplam timeout ile sınırla; süre dolarsa error olayı gönder (iptal slot'u serbest bırakır)"""
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(events.__anext__(), max(deadline - time.monotonic(), 0))
+            except StopAsyncIteration:
+                return
+            yield event
+    except asyncio.TimeoutError:
+        yield _sse_event("error", {"detail": "Ruleset generation timed out"})
+    finally:
+        await events.aclose()
+
 @router.get("/", response_model=dict)
 async def root():
     """Ana sayfa"""
@@ -26,18 +145,32 @@ async def root():
         "timestamp": datetime.now().isoformat()
     }
 
+@router.get("/health/live")
+async def liveness_check():
+    """Liveness kontrolü - upstream çağrısı yapmaz"""
+    return {"status": "alive", "timestamp": datetime.now().isoformat()}
+
 @router.get("/health", response_model=HealthResponse)
 @router.options("/health")
-async def health_check():
-    """Sağlık kontrolü"""
+async def health_check(deep: bool = False):
+    """Sağlık kontrolü - readiness bellekten servis edilir, deep=true canlı metadata kontrolü yapar"""
     try:
-        health_data = await ai_service.check_health()
+        if deep:
+            health_data = await ai_service.check_health(deep=True)
+            health_data["checked_at"] = datetime.now().isoformat()
+        else:
+            health_data = await health_monitor.get()
         
         return HealthResponse(
             status="healthy" if health_data.get("available", False) else "unhealthy",
             ai_provider=ai_service.provider_name,
             ai_available=health_data.get("available", False),
-            message=health_data.get("error") if not health_data.get("available", False) else "All systems operational"
+            message=health_data.get("error") if not health_data.get("available", False) else "All systems operational",
+            checked_at=health_data.get("checked_at"),
+            providers={
+                name: {**health_data.get("providers", {}).get(name, {}), **stats}
+                for name, stats in ai_service.provider_stats().items()
+            }
         )
     except Exception as e:
         return HealthResponse(
@@ -47,122 +180,314 @@ async def health_check():
             message=f"Health check failed: {str(e)}"
         )
 
-@router.post("/generate-ruleset", response_model=RulesetResponse)
-async def generate_ruleset(project_info: ProjectInfo):
-    """Ruleset üret"""
+@router.post("/generate-ruleset", response_model=RulesetResponse, response_class=FastJSONResponse)
+async def generate_ruleset(
+    project_info: ProjectInfo,
+    request: Request,
+    mode: ResponseMode = None,
+    reuse: ReuseMode = None,
+    strategy: Strategy = None
+):
+    """Ruleset üret (mode=compact: markdown tekrarlanmaz, reuse=similar: benzer spec'in ruleset'i kullanılabilir)"""
+    await _check_rate_limit(request)
+    include_content = _include_content(request, mode)
     try:
-        # Prompt üret
-        prompt = PromptService.generate_ruleset_prompt(project_info)
-        
-        # AI ile içerik üret
-        markdown_content = await ai_service.generate_ruleset(prompt)
+        # Kapasite doluysa timeout'a kadar beklemek yerine hemen 503 dön
+        result = await generation_service.generate(
+            project_info, wait_for_slot=False, reuse=reuse, strategy=strategy
+        )
         
         # JSON formatında da hazırla
-        json_data = {
-            "project_info": project_info.dict(),
-            "generated_at": datetime.now().isoformat(),
-            "ai_provider": ai_service.provider_name,
-            "ruleset_content": markdown_content
-        }
-        
-        return RulesetResponse(
-            markdown=markdown_content,
-            json_data=json_data
+        json_data = generation_service.build_json_data(
+            project_info,
+            result.markdown,
+            result.cache_hit,
+            include_content=include_content,
+            match_distance=result.match_distance,
+            sections=result.sections,
+            ai_provider=result.ai_provider,
+            match_type=result.match_type
         )
         
+        # RulesetResponse şeması yalnızca dokümantasyon için; içerik doğrudan serialize edilir
+        return _json_response({"markdown": result.markdown, "json_data": json_data}, request, include_content)
+    
+    except TokenBudgetExceeded as e:
+        raise HTTPException(status_code=422, detail=f"Token budget exceeded: {str(e)}")
+    except OverCapacityError:
+        raise _over_capacity()
+    except (asyncio.TimeoutError, ProviderTimeout):
+        raise HTTPException(status_code=504, detail="Ruleset generation timed out")
+    except ProviderError as e:
+        if not e.retryable:
+            raise HTTPException(status_code=500, detail=f"Ruleset generation failed: {str(e)}")
+        # Upstream kota/geçici hata: istemci Retry-After sonrası tekrar deneyebilir
+        raise HTTPException(
+            status_code=503,
+            detail=f"AI provider temporarily unavailable: {str(e)}",
+            headers=retry_after_header(e.retry_after or settings.GENERATION_RETRY_AFTER)
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Ruleset generation failed: {str(e)}")
 
+@router.post("/generate-ruleset/batch", response_model=BatchRulesetResponse, response_class=FastJSONResponse)
+async def generate_ruleset_batch(
+    batch: BatchRulesetRequest,
+    request: Request,
+    stream: bool = False,
+    mode: ResponseMode = None,
+    reuse: ReuseMode = None,
+    strategy: Strategy = None
+):
+    """Birden fazla ProjectInfo için ruleset üret (stream=true: tamamlanma sırasıyla NDJSON)"""
+    # Her öğe bir token harcar; burst'ten büyük batch tek seferde ödenemeyeceği için reddedilir
+    max_items = min(settings.BATCH_MAX_ITEMS, rate_limiter.max_cost() or settings.BATCH_MAX_ITEMS)
+    if len(batch.items) > max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch size exceeds limit of {max_items} items"
+        )
+    # Batch öğeleri admission slot'u için sırada bekler
+    await _check_rate_limit(request, cost=len(batch.items))
+    
+    include_content = _include_content(request, mode)
+    results = generation_service.generate_batch(
+        batch.items, batch.concurrency, include_content=include_content, reuse=reuse, strategy=strategy
+    )
+    
+    if stream:
+        async def ndjson_stream():
+            async for result in results:
+                yield dumps(result) + b"\n"
+        
+        return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
+    
+    collected = sorted([result async for result in results], key=lambda r: r["index"])
+    succeeded = sum(1 for result in collected if result["status"] == "ok")
+    
+    response = BatchRulesetResponse(
+        results=collected,
+        total=len(batch.items),
+        unique=len({generation_service.spec_key(item) for item in batch.items}),
+        succeeded=succeeded,
+        failed=len(collected) - succeeded
+    )
+    return _json_response(response.model_dump(), request, include_content)
+
+@router.post("/generate-ruleset/stream")
+async def generate_ruleset_stream(
+    project_info: ProjectInfo,
+    request: Request,
+    mode: ResponseMode = None,
+    reuse: ReuseMode = None,
+    strategy: Strategy = None
+):
+    """Ruleset'i Server-Sent Events olarak parça parça üret (mode=compact: summary içerik tekrarlamaz)"""
+    await _check_rate_limit(request)
+    include_content = _include_content(request, mode)
+    try:
+        budgeted_info, prompt, max_tokens = generation_service.prepare(project_info)
+    except TokenBudgetExceeded as e:
+        raise HTTPException(status_code=422, detail=f"Token budget exceeded: {str(e)}")
+    provider_name, model_name = ai_service.provider_name, ai_service.model_name
+    cache_key = generation_service.spec_key(budgeted_info, provider_name, model_name)
+    use_sections = generation_service.use_sections(strategy)
+    
+    # Stream başladıktan sonra status değiştirilemez; kapasite dolu ise 503'ü şimdi dön
+    # (bölüm bazlı üretimde cache durumu bölüm başına bilinir, kapasite hatası error olayıyla döner)
+    cached = None if use_sections else await generation_service.lookup(budgeted_info, cache_key, reuse)
+    if cached is None and not use_sections and not admission_controller.has_capacity():
+        admission_controller.rejected += 1
+        raise _over_capacity()
+    
+    async def event_stream():
+        try:
+            markdown_content, match_distance, match_type = cached if cached is not None else (None, None, MatchType.NONE)
+            cache_hit = cached is not None
+            sections = None
+            ai_provider = provider_name
+            
+            if use_sections:
+                # Bölümler paralel üretilir, doküman sırası bozulmadan hazır oldukça gönderilir
+                parts = []
+                cached_sections = 0
+                yield _sse_event("chunk", {"content": PromptService.ruleset_title(budgeted_info)})
+                async for result, section_hit in generation_service.iter_sections(budgeted_info, wait_for_slot=False):
+                    parts.append(result)
+                    cached_sections += section_hit
+                    yield _sse_event("chunk", {"content": "\n\n" + result.content.strip()})
+                markdown_content = PromptService.assemble_sections(budgeted_info, [part.content for part in parts])
+                cache_hit = cached_sections == len(parts)
+                match_distance = 0.0 if cache_hit else None
+                match_type = MatchType.EXACT if cache_hit else MatchType.NONE
+                ai_provider, served_model = generation_service.served_by(parts)
+                if not cache_hit:
+                    generation_service.record_sections(
+                        budgeted_info, ProviderResult(markdown_content, ai_provider, served_model)
+                    )
+                sections = {"total": len(parts), "cached": cached_sections}
+            elif cache_hit:
+                yield _sse_event("chunk", {"content": markdown_content})
+            else:
+                chunks = []
+                async with admission_controller.slot():
+                    with generations_in_flight.track("stream"), generation_stage_duration_seconds.time("provider_call"):
+                        async for chunk in ai_service.generate_ruleset_stream(prompt, max_tokens=max_tokens):
+                            chunks.append(chunk)
+                            yield _sse_event("chunk", {"content": chunk.content})
+                # Failover yalnızca ilk parçadan önce olur; tüm parçalar aynı provider'dandır
+                served = chunks[0] if chunks else ProviderResult("", provider_name, model_name)
+                markdown_content = "".join(chunk.content for chunk in chunks)
+                ai_provider = served.provider_name
+                await generation_service.store(budgeted_info, served._replace(content=markdown_content))
+            
+            # Son olay: /generate-ruleset ile aynı json_data
+            yield _sse_event("summary", generation_service.build_json_data(
+                project_info,
+                markdown_content,
+                cache_hit,
+                include_content=include_content,
+                match_distance=match_distance,
+                sections=sections,
+                ai_provider=ai_provider,
+                match_type=match_type
+            ))
+        except OverCapacityError:
+            yield _sse_event("error", {"detail": "Too many generations in flight, try again later"})
+        except ProviderTimeout:
+            yield _sse_event("error", {"detail": "Ruleset generation timed out"})
+        except Exception as e:
+            yield _sse_event("error", {"detail": f"Ruleset generation failed: {str(e)}"})
+    
+    return StreamingResponse(
+        _with_deadline(event_stream(), settings.GENERATION_TIMEOUT),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _job_response(job: dict) -> JobResponse:
+    """Store kaydını JobResponse'a dönüştür"""
+    return JobResponse(
+        job_id=job["id"],
+        status=job["status"],
+        created_at=datetime.fromtimestamp(job["created_at"]).isoformat(),
+        updated_at=datetime.fromtimestamp(job["updated_at"]).isoformat(),
+        result=job["result"],
+        error=job["error"]
+    )
+
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+async def create_job(project_info: ProjectInfo, request: Request):
+    """Ruleset üretimini arka plan job'u olarak başlat"""
+    await _check_rate_limit(request)
+    try:
+        # Bütçe aşımını kuyruğa almadan önce reddet
+        generation_service.prepare(project_info)
+        job = await job_queue.submit(project_info)
+    except TokenBudgetExceeded as e:
+        raise HTTPException(status_code=422, detail=f"Token budget exceeded: {str(e)}")
+    except QueueFullError:
+        raise HTTPException(
+            status_code=429,
+            detail="Job queue is full, try again later",
+            headers={"Retry-After": str(settings.JOB_RETRY_AFTER)}
+        )
+    
+    return _job_response(job)
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, wait: float = 0):
+    """Job durumunu getir (wait > 0: job bitene kadar en fazla wait saniye bekle)"""
+    job = await job_queue.get(job_id, wait=wait)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return _job_response(job)
+
+@router.get("/metrics")
+async def get_metrics():
+    """Prometheus text formatında metrikler"""
+    return Response(
+        content=metrics_service.registry.render(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+def _history_entry(entry: dict) -> HistoryEntry:
+    """Store kaydını HistoryEntry'ye dönüştür"""
+    return HistoryEntry(
+        **{key: value for key, value in entry.items() if key not in ("seq", "created_at")},
+        created_at=datetime.fromtimestamp(entry["created_at"]).isoformat()
+    )
+
+@router.get("/history", response_model=HistoryListResponse)
+async def list_history(
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    category: Optional[str] = None,
+    framework: Optional[str] = None,
+    spec_hash: Optional[str] = None
+):
+    """Üretim geçmişini yeniden eskiye listele (cursor: önceki yanıtın next_cursor değeri)"""
+    limit = max(1, min(limit or settings.HISTORY_PAGE_SIZE, settings.HISTORY_MAX_PAGE_SIZE))
+    try:
+        before = int(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    # Bir fazla kayıt: sonraki sayfa olup olmadığını ek sorgu olmadan anla
+    entries = await history_recorder.store.list(
+        limit + 1,
+        before=before,
+        category=category.strip().casefold() if category else None,
+        framework=framework.strip().casefold() if framework else None,
+        spec_hash=spec_hash
+    )
+    items = entries[:limit]
+    return HistoryListResponse(
+        items=[_history_entry(entry) for entry in items],
+        next_cursor=str(items[-1]["seq"]) if len(entries) > limit else None
+    )
+
+@router.get("/history/stats")
+async def get_history_stats():
+    """Geçmiş store ve yazma kuyruğu istatistikleri"""
+    return history_recorder.stats()
+
+@router.get("/history/{entry_id}", response_model=HistoryEntry)
+async def get_history_entry(entry_id: str):
+    """Geçmiş kaydını markdown ile birlikte getir"""
+    entry = await history_recorder.store.get(entry_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="History entry not found")
+    return _history_entry(entry)
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """Ruleset cache istatistiklerini getir"""
+    return {**ruleset_cache.stats(), "similarity": similarity_index.stats()}
+
+@router.get("/rate-limit/stats")
+async def get_rate_limit_stats():
+    """Rate limit ve admission control istatistiklerini getir"""
+    return {**rate_limiter.stats(), "admission": admission_controller.stats()}
+
+@router.get("/coalescing/stats")
+async def get_coalescing_stats():
+    """Birleştirilen (deduplicate edilen) istek istatistiklerini getir"""
+    return request_coalescer.stats()
+
 @router.get("/project-types", response_model=ProjectTypesResponse)
-async def get_project_types():
+async def get_project_types(request: Request):
     """Mevcut proje türlerini getir"""
-    project_types = [
-        "Web Application",
-        "Mobile Application", 
-        "Desktop Application",
-        "API/Microservice",
-        "Library/Package",
-        "CLI Tool",
-        "E-commerce Platform",
-        "Content Management System",
-        "Dashboard/Admin Panel",
-        "Real-time Application",
-        "Machine Learning Project",
-        "Blockchain Application",
-        "IoT Application",
-        "Game Development",
-        "Other"
-    ]
-    
-    return ProjectTypesResponse(project_types=project_types)
+    return _catalog_response(request, "project_types")
 
 @router.get("/frameworks", response_model=FrameworksResponse)
-async def get_frameworks():
+async def get_frameworks(request: Request):
     """Mevcut framework'leri getir"""
-    frameworks = {
-        "frontend": [
-            "React", "Vue.js", "Angular", "Svelte", "Next.js", "Nuxt.js", 
-            "Vanilla JavaScript", "jQuery", "Alpine.js", "Lit", "Other"
-        ],
-        "backend": [
-            "Node.js/Express", "Node.js/Fastify", "Python/Django", "Python/FastAPI", 
-            "Python/Flask", "Java/Spring", "C#/.NET", "PHP/Laravel", "PHP/Symfony", 
-            "Ruby on Rails", "Go/Gin", "Go/Echo", "Rust/Actix", "Other"
-        ],
-        "mobile": [
-            "React Native", "Flutter", "Swift/iOS", "Kotlin/Android", 
-            "Xamarin", "Ionic", "Cordova/PhoneGap", "Other"
-        ],
-        "database": [
-            "PostgreSQL", "MySQL", "MongoDB", "SQLite", "Redis", 
-            "Cassandra", "DynamoDB", "Firebase", "Supabase", "Other"
-        ]
-    }
-    
-    return FrameworksResponse(frameworks=frameworks)
+    return _catalog_response(request, "frameworks")
 
 @router.get("/project-categories")
 @router.options("/project-categories")
-async def get_project_categories():
+async def get_project_categories(request: Request):
     """Proje kategorilerini döndür"""
-    return {
-        "categories": ['frontend', 'backend', 'fullstack', 'mobile'],
-        "frontend_options": {
-            "frameworks": ['React', 'Vue.js', 'Angular', 'Svelte', 'Next.js', 'Nuxt.js', 'SvelteKit'],
-            "styling_approaches": ['CSS', 'SCSS/SASS', 'Styled Components', 'Tailwind CSS', 'Emotion', 'CSS Modules'],
-            "state_management": ['useState', 'Zustand', 'Redux Toolkit', 'TanStack Query', 'Jotai', 'Valtio'],
-            "http_clients": ['Fetch API', 'Axios', 'TanStack Query', 'SWR', 'Apollo Client'],
-            "ui_libraries": ['None', 'Material-UI', 'Ant Design', 'Chakra UI', 'Mantine', 'React Bootstrap'],
-            "build_tools": ['Vite', 'Webpack', 'Next.js', 'Create React App', 'Parcel', 'Rollup'],
-            "testing_frameworks": ['Jest', 'Vitest', 'Cypress', 'Playwright', 'Testing Library']
-        },
-        "backend_options": {
-            "languages": ['Python', 'JavaScript/Node.js', 'Java', 'C#', 'Go', 'Rust', 'PHP'],
-            "frameworks": ['FastAPI', 'Django', 'Express.js', 'Spring Boot', 'ASP.NET Core', 'Gin', 'Laravel'],
-            "databases": ['PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'SQLite', 'Cassandra', 'DynamoDB'],
-            "auth_methods": ['JWT', 'Session-based', 'OAuth 2.0', 'Auth0', 'Firebase Auth', 'Supabase Auth'],
-            "api_styles": ['REST', 'GraphQL', 'gRPC', 'tRPC'],
-            "orm_tools": ['Prisma', 'TypeORM', 'Sequelize', 'SQLAlchemy', 'Mongoose', 'Drizzle']
-        },
-        "fullstack_options": {
-            "frameworks": ['Next.js', 'Nuxt.js', 'SvelteKit', 'Remix', 'T3 Stack', 'MEAN', 'MERN'],
-            "meta_frameworks": ['Next.js', 'Nuxt.js', 'SvelteKit', 'Remix', 'Astro'],
-            "deployment_platforms": ['Vercel', 'Netlify', 'AWS', 'Railway', 'Render', 'Heroku'],
-            "databases": ['PostgreSQL', 'MySQL', 'MongoDB', 'Supabase', 'PlanetScale', 'Firebase']
-        },
-        "mobile_options": {
-            "frameworks": ['React Native', 'Flutter', 'Ionic', 'Xamarin', 'Cordova/PhoneGap'],
-            "native_languages": ['Swift/iOS', 'Kotlin/Android', 'Java/Android', 'Objective-C'],
-            "state_management": ['Redux', 'MobX', 'Provider', 'Riverpod', 'Bloc'],
-            "navigation": ['React Navigation', 'Navigator', 'GoRouter', 'AutoRoute'],
-            "ui_libraries": ['NativeBase', 'React Native Elements', 'Tamagui', 'Gluestack'],
-            "backends": ['Firebase', 'Supabase', 'AWS Amplify', 'Custom API']
-        },
-        "common_options": {
-            "project_types": ['Web Application', 'Mobile App', 'API/Microservice', 'CLI Tool', 'Desktop App', 'Library'],
-            "deployment_platforms": ['AWS', 'Vercel', 'Netlify', 'Heroku', 'Railway', 'Render', 'DigitalOcean'],
-            "code_styles": ['Standard', 'Prettier', 'ESLint', 'Airbnb', 'Google', 'TypeScript'],
-            "version_control": ['Git', 'GitHub', 'GitLab', 'Bitbucket'],
-            "ci_cd": ['GitHub Actions', 'GitLab CI', 'Jenkins', 'CircleCI', 'Travis CI']
-        }
-    }
+    return _catalog_response(request, "project_categories")
@@ -1,20 +1,145 @@
 """
 AI provider base class
 """
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Dict, Any, AsyncIterator, Callable, Optional
+from app.services.retry_policy import RetryPolicy
+
+class ProviderError(Exception):
+    """Provider hatalarının base class'ı"""
+    
+    kind = "fatal"  # Metrik etiketi
+    retryable = False  # Aynı provider'da tekrar denenebilir mi
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class ProviderRateLimited(ProviderError):
+    """429 / kota aşımı - Retry-After'a uyularak tekrar denenir"""
+    kind = "rate_limited"
+    retryable = True
+
+class ProviderTimeout(ProviderError):
+    """Upstream zaman aşımı"""
+    kind = "timeout"
+    retryable = True
+
+class ProviderTransient(ProviderError):
+    """5xx ve bağlantı hataları"""
+    kind = "transient"
+    retryable = True
+
+class ProviderFatal(ProviderError):
+    """Tekrar denemenin anlamı olmayan hatalar (kimlik doğrulama, geçersiz istek, eksik ayar)"""
+    pass
+
+TIMEOUT_STATUS_CODES = {408, 504}
+TRANSIENT_STATUS_CODES = {409, 425, 500, 502, 503, 520, 522, 524, 529}
+TRANSIENT_ERROR_NAMES = {"ReadError", "WriteError", "NetworkError", "RemoteProtocolError", "ServiceUnavailable"}
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header'ını (saniye veya HTTP tarihi) saniyeye çevir"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """SDK'lardan HTTP durum kodunu çıkar (openai: status_code, google: code, httpx: response)"""
+    for attr in ("status_code", "code"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(error, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+def classify_error(error: BaseException, message: str) -> ProviderError:
+    """SDK/HTTP hatasını rate_limited / timeout / transient / fatal olarak sınıflandır"""
+    if isinstance(error, ProviderError):
+        return error
+    
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    retry_after = parse_retry_after(headers.get("retry-after"))
+    status = _status_code(error)
+    
+    if status == 429:
+        return ProviderRateLimited(message, retry_after)
+    if status in TIMEOUT_STATUS_CODES:
+        return ProviderTimeout(message, retry_after)
+    if status in TRANSIENT_STATUS_CODES:
+        return ProviderTransient(message, retry_after)
+    if status is not None:
+        return ProviderFatal(message)
+    
+    # Durum kodu olmayan hatalar: zaman aşımı ve bağlantı hataları tekrar denenebilir
+    name = type(error).__name__
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)) or "Timeout" in name or "DeadlineExceeded" in name:
+        return ProviderTimeout(message)
+    if isinstance(error, ConnectionError) or "Connect" in name or name in TRANSIENT_ERROR_NAMES:
+        return ProviderTransient(message)
+    return ProviderFatal(message)
 
 class AIProvider(ABC):
     """AI provider için base class"""
     
+    def __init__(self, max_concurrency: int = 32, retry_policy: Optional[RetryPolicy] = None):
+        # Aynı anda upstream'e gidebilecek istek sayısı
+        self.max_concurrency = max(1, max_concurrency)
+        # Retry/hedge ayarları provider başına (varsayılan: PROVIDER_* ayarları)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    @property
+    def concurrency_limit(self) -> asyncio.Semaphore:
+        """Provider başına eşzamanlılık sınırı"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    async def run_blocking(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Async client'ı olmayan SDK çağrılarını sınırlı bir thread pool'da çalıştır"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix=f"{self.provider_name}-provider"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+    
     @abstractmethod
-    async def generate_content(self, prompt: str) -> str:
-        """İçerik üret"""
+    async def generate_content(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+        """İçerik üret (max_tokens: çıktı token limiti, None ise provider varsayılanı)"""
+        pass
+    
+    async def generate_content_stream(self, prompt: str, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        """İçeriği parça parça üret (streaming desteği olmayan provider'lar tek parça döner)"""
+        yield await self.generate_content(prompt, max_tokens=max_tokens)
+    
+    async def warm_up(self) -> None:
+        """Başlangıçta modeli hazırla (varsayılan: bir şey yapma)"""
+        pass
+    
+    async def close(self) -> None:
+        """Bağlantıları kapat (varsayılan: bir şey yapma)"""
         pass
     
     @abstractmethod
-    async def check_health(self) -> Dict[str, Any]:
-        """Sağlık kontrolü"""
+    async def check_health(self, deep: bool = False) -> Dict[str, Any]:
+        """Sağlık kontrolü (deep=False upstream'e gitmez, deep=True en ucuz metadata çağrısını yapar)"""
         pass
     
     @property
@@ -22,3 +147,13 @@ class AIProvider(ABC):
     def provider_name(self) -> str:
         """Provider adı"""
         pass
+    
+    @property
+    def is_configured(self) -> bool:
+        """Provider kullanılabilir kimlik bilgilerine sahip mi"""
+        return True
+    
+    @property
+    def model_name(self) -> str:
+        """Kullanılan model adı"""
+        return "default"
@@ -1,51 +1,343 @@
 """
 AI service factory ve manager
 """
-from typing import Optional
-from app.services.ai_provider import AIProvider
-from app.services.gemini_provider import GeminiProvider
-from app.services.openai_provider import OpenAIProvider
+import asyncio
+import importlib
+import time
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Tuple, Type
+from app.services.ai_provider import (
+    AIProvider,
+    ProviderError,
+    ProviderRateLimited,
+    ProviderTimeout,
+    ProviderTransient,
+    ProviderFatal,
+    classify_error
+)
+from app.services.provider_stats import ProviderStats
+from app.services.metrics_service import (
+    provider_errors_total,
+    provider_hedges_total,
+    provider_requests_total,
+    provider_retries_total
+)
 from app.core.config import settings
 
+class ProviderSpec(NamedTuple):
+    """Provider registry kaydı"""
+    module: str
+    class_name: str
+    required_setting: str  # Boşsa provider yapılandırılmamış sayılır
+
+# Desteklenen provider'lar - modülleri (ve SDK'ları) yalnızca ilk kullanımda import edilir
+PROVIDER_REGISTRY: Dict[str, ProviderSpec] = {
+    "gemini": ProviderSpec("app.services.gemini_provider", "GeminiProvider", "GEMINI_API_KEY"),
+    "openai": ProviderSpec("app.services.openai_provider", "OpenAIProvider", "OPENAI_API_KEY"),
+    "ollama": ProviderSpec("app.services.ollama_provider", "OllamaProvider", "OLLAMA_BASE_URL"),
+    "huggingface": ProviderSpec("app.services.huggingface_provider", "HuggingFaceProvider", "HUGGINGFACE_BASE_URL")
+}
+
+class ProviderResult(NamedTuple):
+    """Üretilen içerik (streaming'de tek parça) ve çağrıya gerçekten hizmet eden provider/model"""
+    content: str
+    provider_name: str
+    model_name: str
+
+def is_provider_configured(name: str) -> bool:
+    """SDK'yı import etmeden provider'ın yapılandırılıp yapılandırılmadığını kontrol et"""
+    return bool(getattr(settings, PROVIDER_REGISTRY[name].required_setting, ""))
+
+def load_provider_class(name: str) -> Type[AIProvider]:
+    """Provider sınıfını (ve SDK'sını) ilk kullanımda yükle"""
+    spec = PROVIDER_REGISTRY[name]
+    module = importlib.import_module(spec.module)
+    return getattr(module, spec.class_name)
+
+def combine_errors(errors: List[ProviderError]) -> ProviderError:
+    """Tüm provider'lar başarısız olduğunda hataları tek bir tipli hataya indir"""
+    message = "; ".join(str(error) for error in errors)
+    if all(isinstance(error, ProviderRateLimited) for error in errors):
+        retry_afters = [error.retry_after for error in errors if error.retry_after is not None]
+        return ProviderRateLimited(message, min(retry_afters) if retry_afters else None)
+    if all(isinstance(error, ProviderTimeout) for error in errors):
+        return ProviderTimeout(message)
+    if all(error.retryable for error in errors):
+        return ProviderTransient(message)
+    return ProviderFatal(message)
+
 class AIService:
-    """AI service manager"""
+    """AI service manager - yapılandırılmış provider'lar arasında failover yapan havuz"""
     
     def __init__(self):
-        self.provider: Optional[AIProvider] = None
-        self._initialize_provider()
+        # Provider'lar ilk kullanımda kurulur; import sırasında SDK yüklenmez
+        self._providers: Optional[List[AIProvider]] = None
+        self.stats: Dict[str, ProviderStats] = {}
+    
+    @property
+    def providers(self) -> List[AIProvider]:
+        """Havuzdaki provider'lar (ilk erişimde başlatılır)"""
+        if self._providers is None:
+            self._initialize_provider()
+        return self._providers
+    
+    def initialize(self) -> None:
+        """Provider'ları önceden başlat (ör. worker fork'undan önce)"""
+        _ = self.providers
     
     def _initialize_provider(self):
-        """Provider'ı başlat"""
+        """Provider'ları başlat - AI_PROVIDER birincil, diğer yapılandırılmış olanlar yedek"""
         provider_name = settings.AI_PROVIDER.lower()
         
-        if provider_name == "gemini":
-            self.provider = GeminiProvider()
-        elif provider_name == "openai":
-            self.provider = OpenAIProvider()
-        else:
+        if provider_name not in PROVIDER_REGISTRY:
             raise ValueError(f"Desteklenmeyen AI provider: {provider_name}")
+        
+        names = [provider_name] + [
+            name.strip().lower() for name in settings.AI_PROVIDER_POOL.split(",")
+            if name.strip().lower() in PROVIDER_REGISTRY and name.strip().lower() != provider_name
+        ]
+        
+        providers = []
+        for name in names:
+            # Birincil provider yapılandırılmamış olsa da hata mesajı için havuzda kalır
+            if not is_provider_configured(name) and name != provider_name:
+                continue
+            providers.append(load_provider_class(name)())
+            self.stats[name] = ProviderStats(
+                settings.PROVIDER_EWMA_ALPHA,
+                settings.PROVIDER_FAILURE_THRESHOLD,
+                settings.PROVIDER_COOLDOWN,
+                failure_latency=settings.PROVIDER_TIMEOUT
+            )
+        
+        # Yapılandırılmış bir yedek varsa yapılandırılmamış birincili öne koyma
+        providers.sort(key=lambda p: not p.is_configured)
+        self._providers = providers
+    
+    @property
+    def provider(self) -> Optional[AIProvider]:
+        """Şu an tercih edilen provider"""
+        candidates = self._candidates()
+        if candidates:
+            return candidates[0]
+        return self.providers[0] if self.providers else None
+    
+    def _candidates(self) -> List[AIProvider]:
+        """Circuit'i kapalı olan provider'ları gecikme/hata skoruna göre sırala"""
+        available = [p for p in self.providers if self.stats[p.provider_name].is_available()]
+        return sorted(available, key=lambda p: self.stats[p.provider_name].score())
+    
+    async def _hedged(self, provider: AIProvider, prompt: str, max_tokens: Optional[int], delay: float) -> str:
+        """İlk deneme delay içinde bitmezse ikinci bir deneme gönder, önce başarılı olanı al"""
+        primary = asyncio.ensure_future(provider.generate_content(prompt, max_tokens=max_tokens))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                tasks.append(asyncio.ensure_future(provider.generate_content(prompt, max_tokens=max_tokens)))
+                provider_hedges_total.inc(provider.provider_name, "fired")
+            
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if len(tasks) > 1:
+                            provider_hedges_total.inc(
+                                provider.provider_name, "primary_won" if task is primary else "hedge_won"
+                            )
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def _call_with_retries(
+        self,
+        provider: AIProvider,
+        stats: ProviderStats,
+        prompt: str,
+        max_tokens: Optional[int]
+    ) -> Tuple[str, float]:
+        """Tek provider'da retry/hedge politikasıyla üret, (içerik, son denemenin gecikmesi) döndür"""
+        policy = provider.retry_policy
+        attempt = 0
+        while True:
+            attempt += 1
+            hedge_delay = policy.hedge_delay(
+                stats.latency_quantile(policy.hedge_quantile, policy.hedge_min_samples)
+            )
+            started = time.monotonic()
+            try:
+                if hedge_delay is None:
+                    content = await provider.generate_content(prompt, max_tokens=max_tokens)
+                else:
+                    content = await self._hedged(provider, prompt, max_tokens, hedge_delay)
+                return content, time.monotonic() - started
+            except Exception as e:
+                error = classify_error(e, str(e))
+                delay = policy.backoff(attempt, error.retry_after) if error.retryable else None
+                if delay is None:
+                    if error is e:
+                        raise
+                    raise error from e
+                provider_retries_total.inc(provider.provider_name, error.kind)
+                await asyncio.sleep(delay)
     
-    async def generate_ruleset(self, prompt: str) -> str:
-        """Ruleset üret"""
-        if not self.provider:
-            raise Exception("AI provider başlatılamadı")
+    async def generate_ruleset(self, prompt: str, max_tokens: Optional[int] = None) -> ProviderResult:
+        """Ruleset üret - geçici hatalarda aynı provider'da tekrar dene, sonra sıradaki provider'a geç"""
+        if not self.providers:
+            raise ProviderFatal("AI provider başlatılamadı")
         
-        return await self.provider.generate_content(prompt)
+        errors: List[ProviderError] = []
+        for provider in self._candidates():
+            stats = self.stats[provider.provider_name]
+            if not stats.allow_request():
+                continue
+            
+            started = time.monotonic()
+            try:
+                # Retry'ler ve backoff provider başına PROVIDER_TIMEOUT içinde kalır
+                content, latency = await asyncio.wait_for(
+                    self._call_with_retries(provider, stats, prompt, max_tokens), settings.PROVIDER_TIMEOUT
+                )
+            except asyncio.CancelledError:
+                stats.release()
+                raise
+            except asyncio.TimeoutError:
+                error = ProviderTimeout(f"{provider.provider_name}: timeout")
+            except ProviderError as e:
+                error = e
+            else:
+                stats.record_success(latency)
+                provider_requests_total.inc(provider.provider_name, "success")
+                return ProviderResult(content, provider.provider_name, provider.model_name)
+            
+            stats.record_failure(time.monotonic() - started)
+            provider_requests_total.inc(provider.provider_name, "error")
+            provider_errors_total.inc(provider.provider_name, error.kind)
+            errors.append(error)
+        
+        if not errors:
+            raise ProviderTransient("Kullanılabilir AI provider yok (tüm circuit'ler açık)")
+        raise combine_errors(errors)
     
-    async def check_health(self):
-        """Sağlık kontrolü"""
-        if not self.provider:
+    async def generate_ruleset_stream(self, prompt: str, max_tokens: Optional[int] = None) -> AsyncIterator[ProviderResult]:
+        """Ruleset'i parça parça üret - ilk parça gelmeden önceki hatalarda tekrar dener ve failover yapar"""
+        if not self.providers:
+            raise ProviderFatal("AI provider başlatılamadı")
+        
+        errors: List[ProviderError] = []
+        for provider in self._candidates():
+            stats = self.stats[provider.provider_name]
+            if not stats.allow_request():
+                continue
+            
+            attempt = 0
+            while True:
+                attempt += 1
+                started = time.monotonic()
+                emitted = False
+                stream = provider.generate_content_stream(prompt, max_tokens=max_tokens)
+                try:
+                    while True:
+                        # İlk parça ve parçalar arası bekleme PROVIDER_TIMEOUT ile sınırlı (asılı upstream slot tutmaz)
+                        try:
+                            chunk = await asyncio.wait_for(stream.__anext__(), settings.PROVIDER_TIMEOUT)
+                        except StopAsyncIteration:
+                            break
+                        except asyncio.TimeoutError:
+                            raise ProviderTimeout(f"{provider.provider_name}: stream timeout")
+                        emitted = True
+                        yield ProviderResult(chunk, provider.provider_name, provider.model_name)
+                except (asyncio.CancelledError, GeneratorExit):
+                    stats.release()
+                    raise
+                except Exception as e:
+                    error = classify_error(e, str(e))
+                    # İstemciye parça gittiyse tekrar deneme içeriği çoğaltır
+                    if not emitted and error.retryable:
+                        delay = provider.retry_policy.backoff(attempt, error.retry_after)
+                        if delay is not None:
+                            provider_retries_total.inc(provider.provider_name, error.kind)
+                            await asyncio.sleep(delay)
+                            continue
+                    stats.record_failure(time.monotonic() - started)
+                    provider_requests_total.inc(provider.provider_name, "error")
+                    provider_errors_total.inc(provider.provider_name, error.kind)
+                    if emitted:
+                        if error is e:
+                            raise
+                        raise error from e
+                    errors.append(error)
+                    break
+                
+                stats.record_success(time.monotonic() - started)
+                provider_requests_total.inc(provider.provider_name, "success")
+                return
+        
+        if not errors:
+            raise ProviderTransient("Kullanılabilir AI provider yok (tüm circuit'ler açık)")
+        raise combine_errors(errors)
+    
+    async def check_health(self, deep: bool = False):
+        """Sağlık kontrolü - en az bir provider hazırsa available"""
+        if not self.providers:
             return {
                 "available": False,
                 "error": "Provider başlatılamadı"
             }
         
-        return await self.provider.check_health()
+        results = await asyncio.gather(
+            *(provider.check_health(deep=deep) for provider in self.providers)
+        )
+        providers = {
+            provider.provider_name: result
+            for provider, result in zip(self.providers, results)
+        }
+        available = any(result.get("available", False) for result in results)
+        health = {"available": available, "providers": providers}
+        if not available:
+            health["error"] = "; ".join(
+                f"{name}: {result.get('error')}" for name, result in providers.items()
+            )
+        return health
+    
+    async def warm_up(self) -> Dict[str, Optional[str]]:
+        """Provider'ları (ör. yerel modelleri) önceden ısıt, provider başına hata mesajını döndür"""
+        results = await asyncio.gather(
+            *(provider.warm_up() for provider in self.providers), return_exceptions=True
+        )
+        return {
+            provider.provider_name: str(result) if isinstance(result, Exception) else None
+            for provider, result in zip(self.providers, results)
+        }
+    
+    async def close(self) -> None:
+        """Provider bağlantılarını kapat"""
+        if self._providers is None:
+            return
+        await asyncio.gather(
+            *(provider.close() for provider in self._providers), return_exceptions=True
+        )
+    
+    def provider_stats(self) -> Dict[str, Dict]:
+        """Provider başına routing istatistikleri"""
+        if self._providers is None:
+            return {}
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
     
     @property
     def provider_name(self) -> str:
-        """Aktif provider adı"""
+        """Şu an tercih edilen provider adı (çağrıya hizmet eden için ProviderResult kullanılır)"""
         return self.provider.provider_name if self.provider else "none"
+    
+    @property
+    def model_name(self) -> str:
+        """Şu an tercih edilen model adı"""
+        return self.provider.model_name if self.provider else "none"
 
 # Global AI service instance
 ai_service = AIService()
@@ -0,0 +1,218 @@
+"""
+Ruleset sonuç cache'i (content-addressed, TTL + LRU)
+"""
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from app.models.schemas import ProjectInfo
+from app.services.prompt_service import PromptService
+from app.core.config import settings
+
+class CacheBackend(ABC):
+    """Cache backend'leri için base class"""
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Değeri getir, yoksa veya süresi dolmuşsa None döndür"""
+        pass
+    
+    @abstractmethod
+    async def set(self, key: str, value: str) -> int:
+        """Değeri yaz, LRU ile silinen kayıt sayısını döndür"""
+        pass
+    
+    @abstractmethod
+    async def clear(self) -> None:
+        """Tüm kayıtları sil"""
+        pass
+    
+    @abstractmethod
+    def size(self) -> int:
+        """Kayıt sayısı"""
+        pass
+
+class MemoryCacheBackend(CacheBackend):
+    """Process içi LRU cache"""
+    
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+    
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: str) -> int:
+        self._entries[key] = (time.time() + self.ttl, value)
+        self._entries.move_to_end(key)
+        evicted = 0
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+    
+    async def clear(self) -> None:
+        self._entries.clear()
+    
+    def size(self) -> int:
+        return len(self._entries)
+
+class SQLiteCacheBackend(CacheBackend):
+    """Restart'lardan sonra da yaşayan SQLite cache"""
+    
+    def __init__(self, path: str, max_entries: int, ttl: float):
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ruleset_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ruleset_cache_access ON ruleset_cache (last_access)"
+        )
+        self._conn.commit()
+    
+    def _get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM ruleset_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._conn.execute("DELETE FROM ruleset_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE ruleset_cache SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            return row[0]
+    
+    def _set(self, key: str, value: str) -> int:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ruleset_cache (key, value, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, now + self.ttl, now)
+            )
+            self._conn.execute("DELETE FROM ruleset_cache WHERE expires_at < ?", (now,))
+            cursor = self._conn.execute(
+                "DELETE FROM ruleset_cache WHERE key IN ("
+                "SELECT key FROM ruleset_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+    
+    def _clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM ruleset_cache")
+            self._conn.commit()
+    
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get, key)
+    
+    async def set(self, key: str, value: str) -> int:
+        return await asyncio.to_thread(self._set, key, value)
+    
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+    
+    def size(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM ruleset_cache").fetchone()[0]
+
+class RulesetCache:
+    """Normalize edilmiş ProjectInfo üzerinden anahtarlanan ruleset cache'i"""
+    
+    def __init__(self, backend: CacheBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def make_key(project_info: ProjectInfo, provider_name: str, model_name: str, variant: str = "") -> str:
+        """Canonical spec + provider + model (+ üretim seçenekleri) için SHA-256 anahtarı üret"""
+        payload = {
+            "spec": PromptService.normalize_project_info(project_info),
+            "provider": provider_name.strip().casefold(),
+            "model": model_name.strip().casefold(),
+            "variant": variant
+        }
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    
+    async def get(self, key: str) -> Optional[str]:
+        """Cache'ten oku ve hit/miss sayaçlarını güncelle"""
+        if not self.enabled:
+            return None
+        value = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+    
+    async def set(self, key: str, value: str) -> None:
+        """Cache'e yaz"""
+        if not self.enabled:
+            return
+        self.evictions += await self.backend.set(key, value)
+    
+    async def clear(self) -> None:
+        """Cache'i temizle"""
+        await self.backend.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Cache istatistikleri"""
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "entries": self.backend.size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0
+        }
+
+def _create_backend() -> CacheBackend:
+    """Ayarlara göre backend seç"""
+    backend_name = settings.RULESET_CACHE_BACKEND.lower()
+    
+    if backend_name == "memory":
+        return MemoryCacheBackend(settings.RULESET_CACHE_MAX_ENTRIES, settings.RULESET_CACHE_TTL)
+    elif backend_name == "sqlite":
+        return SQLiteCacheBackend(
+            settings.RULESET_CACHE_PATH,
+            settings.RULESET_CACHE_MAX_ENTRIES,
+            settings.RULESET_CACHE_TTL
+        )
+    else:
+        raise ValueError(f"Desteklenmeyen cache backend: {backend_name}")
+
+# Global ruleset cache instance
+ruleset_cache = RulesetCache(_create_backend(), enabled=settings.RULESET_CACHE_ENABLED)
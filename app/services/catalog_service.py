@@ -0,0 +1,126 @@
+"""
+Statik katalog verileri - başlangıçta bir kez serialize edilip ETag'lerle servis edilir
+"""
+import gzip
+import hashlib
+from typing import Any, Dict, Optional
+from app.core.compression import brotli, negotiate_encoding
+from app.core.responses import dumps
+
+PROJECT_TYPES = [
+    "Web Application",
+    "Mobile Application", 
+    "Desktop Application",
+    "API/Microservice",
+    "Library/Package",
+    "CLI Tool",
+    "E-commerce Platform",
+    "Content Management System",
+    "Dashboard/Admin Panel",
+    "Real-time Application",
+    "Machine Learning Project",
+    "Blockchain Application",
+    "IoT Application",
+    "Game Development",
+    "Other"
+]
+
+FRAMEWORKS = {
+    "frontend": [
+        "React", "Vue.js", "Angular", "Svelte", "Next.js", "Nuxt.js", 
+        "Vanilla JavaScript", "jQuery", "Alpine.js", "Lit", "Other"
+    ],
+    "backend": [
+        "Node.js/Express", "Node.js/Fastify", "Python/Django", "Python/FastAPI", 
+        "Python/Flask", "Java/Spring", "C#/.NET", "PHP/Laravel", "PHP/Symfony", 
+        "Ruby on Rails", "Go/Gin", "Go/Echo", "Rust/Actix", "Other"
+    ],
+    "mobile": [
+        "React Native", "Flutter", "Swift/iOS", "Kotlin/Android", 
+        "Xamarin", "Ionic", "Cordova/PhoneGap", "Other"
+    ],
+    "database": [
+        "PostgreSQL", "MySQL", "MongoDB", "SQLite", "Redis", 
+        "Cassandra", "DynamoDB", "Firebase", "Supabase", "Other"
+    ]
+}
+
+PROJECT_CATEGORIES = {
+    "categories": ['frontend', 'backend', 'fullstack', 'mobile'],
+    "frontend_options": {
+        "frameworks": ['React', 'Vue.js', 'Angular', 'Svelte', 'Next.js', 'Nuxt.js', 'SvelteKit'],
+        "styling_approaches": ['CSS', 'SCSS/SASS', 'Styled Components', 'Tailwind CSS', 'Emotion', 'CSS Modules'],
+        "state_management": ['useState', 'Zustand', 'Redux Toolkit', 'TanStack Query', 'Jotai', 'Valtio'],
+        "http_clients": ['Fetch API', 'Axios', 'TanStack Query', 'SWR', 'Apollo Client'],
+        "ui_libraries": ['None', 'Material-UI', 'Ant Design', 'Chakra UI', 'Mantine', 'React Bootstrap'],
+        "build_tools": ['Vite', 'Webpack', 'Next.js', 'Create React App', 'Parcel', 'Rollup'],
+        "testing_frameworks": ['Jest', 'Vitest', 'Cypress', 'Playwright', 'Testing Library']
+    },
+    "backend_options": {
+        "languages": ['Python', 'JavaScript/Node.js', 'Java', 'C#', 'Go', 'Rust', 'PHP'],
+        "frameworks": ['FastAPI', 'Django', 'Express.js', 'Spring Boot', 'ASP.NET Core', 'Gin', 'Laravel'],
+        "databases": ['PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'SQLite', 'Cassandra', 'DynamoDB'],
+        "auth_methods": ['JWT', 'Session-based', 'OAuth 2.0', 'Auth0', 'Firebase Auth', 'Supabase Auth'],
+        "api_styles": ['REST', 'GraphQL', 'gRPC', 'tRPC'],
+        "orm_tools": ['Prisma', 'TypeORM', 'Sequelize', 'SQLAlchemy', 'Mongoose', 'Drizzle']
+    },
+    "fullstack_options": {
+        "frameworks": ['Next.js', 'Nuxt.js', 'SvelteKit', 'Remix', 'T3 Stack', 'MEAN', 'MERN'],
+        "meta_frameworks": ['Next.js', 'Nuxt.js', 'SvelteKit', 'Remix', 'Astro'],
+        "deployment_platforms": ['Vercel', 'Netlify', 'AWS', 'Railway', 'Render', 'Heroku'],
+        "databases": ['PostgreSQL', 'MySQL', 'MongoDB', 'Supabase', 'PlanetScale', 'Firebase']
+    },
+    "mobile_options": {
+        "frameworks": ['React Native', 'Flutter', 'Ionic', 'Xamarin', 'Cordova/PhoneGap'],
+        "native_languages": ['Swift/iOS', 'Kotlin/Android', 'Java/Android', 'Objective-C'],
+        "state_management": ['Redux', 'MobX', 'Provider', 'Riverpod', 'Bloc'],
+        "navigation": ['React Navigation', 'Navigator', 'GoRouter', 'AutoRoute'],
+        "ui_libraries": ['NativeBase', 'React Native Elements', 'Tamagui', 'Gluestack'],
+        "backends": ['Firebase', 'Supabase', 'AWS Amplify', 'Custom API']
+    },
+    "common_options": {
+        "project_types": ['Web Application', 'Mobile App', 'API/Microservice', 'CLI Tool', 'Desktop App', 'Library'],
+        "deployment_platforms": ['AWS', 'Vercel', 'Netlify', 'Heroku', 'Railway', 'Render', 'DigitalOcean'],
+        "code_styles": ['Standard', 'Prettier', 'ESLint', 'Airbnb', 'Google', 'TypeScript'],
+        "version_control": ['Git', 'GitHub', 'GitLab', 'Bitbucket'],
+        "ci_cd": ['GitHub Actions', 'GitLab CI', 'Jenkins', 'CircleCI', 'Travis CI']
+    }
+}
+
+class CatalogEntry:
+    """Önceden serialize edilmiş, sıkıştırılmış ve ETag'lenmiş katalog yanıtı"""
+    
+    def __init__(self, payload: Dict[str, Any]):
+        # FastJSONResponse ile aynı serialize (compact, UTF-8)
+        self.body = dumps(payload)
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:32] + '"'
+        self.encoded: Dict[str, bytes] = {"gzip": gzip.compress(self.body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            self.encoded["br"] = brotli.compress(self.body, quality=11)
+        # Strong ETag'ler content-coding başına farklı olmalı: "<hash>-gzip", "<hash>-br"
+        self.etags: Dict[Optional[str], str] = {None: self.etag}
+        for encoding in self.encoded:
+            self.etags[encoding] = f'{self.etag[:-1]}-{encoding}"'
+    
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """Seçilen content-coding'in ETag'i (None: sıkıştırılmamış gövde)"""
+        return self.etags[encoding]
+    
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """If-None-Match başlığı varyantlardan birinin ETag'iyle eşleşiyor mu (weak karşılaştırma)"""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        known = self.etags.values()
+        return "*" in tags or any((tag[2:] if tag.startswith("W/") else tag) in known for tag in tags)
+    
+    def negotiate(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """İstemcinin kabul ettiği en iyi ön-sıkıştırılmış varyantı seç"""
+        return negotiate_encoding(accept_encoding, [encoding for encoding in ("br", "gzip") if encoding in self.encoded])
+
+# Uygulama başlangıcında bir kez hazırlanır
+CATALOG: Dict[str, CatalogEntry] = {
+    "project_types": CatalogEntry({"project_types": PROJECT_TYPES}),
+    "frameworks": CatalogEntry({"frameworks": FRAMEWORKS}),
+    "project_categories": CatalogEntry(PROJECT_CATEGORIES)
+}
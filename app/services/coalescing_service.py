@@ -0,0 +1,68 @@
+"""
+Aynı anda gelen özdeş üretim isteklerini tek upstream çağrısında birleştirme (single-flight)
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+class RequestCoalescer:
+    """Aynı anahtara sahip eşzamanlı çağrıları tek bir paylaşılan task'a bağlar"""
+    
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.leaders = 0
+        self.deduplicated = 0
+        self.timeouts = 0
+        self.cancelled_waiters = 0
+    
+    @staticmethod
+    def make_key(prompt_fingerprint: str, provider_name: str, model_name: str) -> str:
+        """Prompt fingerprint'i + provider + model için anahtar üret"""
+        return f"{provider_name}:{model_name}:{prompt_fingerprint}"
+    
+    def _on_done(self, key: str, task: asyncio.Task) -> None:
+        """Task bitince kaydı temizle ve sahipsiz hataları tüket"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+    
+    async def run(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None
+    ) -> Any:
+        """Anahtar için uçuşta bir çağrı varsa onu bekle, yoksa yenisini başlat"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+            self.leaders += 1
+        else:
+            self.deduplicated += 1
+        
+        # shield: bir istemcinin kopması/timeout'u paylaşılan task'ı iptal etmez
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+        except asyncio.CancelledError:
+            self.cancelled_waiters += 1
+            raise
+    
+    def stats(self) -> Dict[str, Any]:
+        """Coalescing istatistikleri"""
+        total = self.leaders + self.deduplicated
+        return {
+            "in_flight": len(self._inflight),
+            "upstream_calls": self.leaders,
+            "deduplicated": self.deduplicated,
+            "timeouts": self.timeouts,
+            "cancelled_waiters": self.cancelled_waiters,
+            "dedup_ratio": round(self.deduplicated / total, 4) if total else 0.0
+        }
+
+# Global request coalescer instance
+request_coalescer = RequestCoalescer()
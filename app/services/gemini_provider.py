@@ -2,32 +2,67 @@
 Gemini AI provider implementation
 """
 import google.generativeai as genai
-from typing import Dict, Any
-from app.services.ai_provider import AIProvider
+from typing import Dict, Any, AsyncIterator, Optional
+from app.services.ai_provider import AIProvider, ProviderFatal, classify_error
+from app.services.retry_policy import RetryPolicy
 from app.core.config import settings
 
 class GeminiProvider(AIProvider):
     """Gemini AI provider"""
     
     def __init__(self):
+        super().__init__(
+            max_concurrency=settings.GEMINI_MAX_CONCURRENCY,
+            retry_policy=RetryPolicy(max_retries=settings.GEMINI_MAX_RETRIES, hedge=settings.GEMINI_HEDGE)
+        )
         if settings.GEMINI_API_KEY:
             genai.configure(api_key=settings.GEMINI_API_KEY)
             self.model = genai.GenerativeModel(settings.GEMINI_MODEL)
         else:
             self.model = None
     
-    async def generate_content(self, prompt: str) -> str:
+    @staticmethod
+    def _generation_config(max_tokens: Optional[int]) -> Optional[Dict[str, Any]]:
+        return {"max_output_tokens": max_tokens} if max_tokens else None
+    
+    async def _generate(self, prompt: str, max_tokens: Optional[int] = None):
+        """SDK'nın async yolunu kullan, yoksa thread pool'a düş"""
+        generation_config = self._generation_config(max_tokens)
+        async with self.concurrency_limit:
+            if hasattr(self.model, "generate_content_async"):
+                return await self.model.generate_content_async(prompt, generation_config=generation_config)
+            return await self.run_blocking(
+                self.model.generate_content, prompt, generation_config=generation_config
+            )
+    
+    async def generate_content(self, prompt: str, max_tokens: Optional[int] = None) -> str:
         """Gemini ile içerik üret"""
         if not self.model:
-            raise Exception("Gemini API key bulunamadı")
+            raise ProviderFatal("Gemini API key bulunamadı")
         
         try:
-            response = self.model.generate_content(prompt)
+            response = await self._generate(prompt, max_tokens)
             return response.text
         except Exception as e:
-            raise Exception(f"Gemini API hatası: {str(e)}")
+            raise classify_error(e, f"Gemini API hatası: {str(e)}") from e
     
-    async def check_health(self) -> Dict[str, Any]:
+    async def generate_content_stream(self, prompt: str, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        """Gemini ile içeriği parça parça üret"""
+        if not self.model:
+            raise ProviderFatal("Gemini API key bulunamadı")
+        
+        try:
+            async with self.concurrency_limit:
+                response = await self.model.generate_content_async(
+                    prompt, generation_config=self._generation_config(max_tokens), stream=True
+                )
+                async for chunk in response:
+                    if chunk.text:
+                        yield chunk.text
+        except Exception as e:
+            raise classify_error(e, f"Gemini API hatası: {str(e)}") from e
+    
+    async def check_health(self, deep: bool = False) -> Dict[str, Any]:
         """Gemini sağlık kontrolü"""
         try:
             if not settings.GEMINI_API_KEY:
@@ -36,13 +71,15 @@ class GeminiProvider(AIProvider):
                     "error": "API key eksik"
                 }
             
-            # Basit bir test prompt'u gönder
-            test_response = self.model.generate_content("Test")
+            if deep:
+                # Üretim yerine ucuz model metadata çağrısı
+                await self.run_blocking(genai.get_model, self.model.model_name)
             
             return {
                 "available": True,
                 "model": settings.GEMINI_MODEL,
-                "status": "healthy"
+                "status": "healthy",
+                "deep": deep
             }
         except Exception as e:
             return {
@@ -50,6 +87,14 @@ class GeminiProvider(AIProvider):
                 "error": str(e)
             }
     
+    @property
+    def is_configured(self) -> bool:
+        return self.model is not None
+    
     @property
     def provider_name(self) -> str:
         return "gemini"
+    
+    @property
+    def model_name(self) -> str:
+        return settings.GEMINI_MODEL
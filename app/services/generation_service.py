@@ -0,0 +1,395 @@
+"""
+Ruleset üretim akışı (cache -> prompt -> coalescing -> AI provider)
+"""
+import asyncio
+import hashlib
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
+from app.models.schemas import ProjectInfo
+from app.services.ai_service import ai_service, ProviderResult
+from app.services.cache_service import ruleset_cache
+from app.services.coalescing_service import request_coalescer
+from app.services.history_service import history_recorder
+from app.services.metrics_service import generation_stage_duration_seconds, generations_in_flight
+from app.services.prompt_service import PromptService
+from app.services.rate_limit_service import admission_controller
+from app.services.similarity_service import similarity_index
+from app.services.token_budget import TokenBudget, TokenBudgetExceeded
+from app.core.config import settings
+
+class MatchType:
+    """Cache eşleşme türleri"""
+    EXACT = "exact"
+    SIMILAR = "similar"
+    NONE = "none"
+
+class GenerationResult(NamedTuple):
+    """Üretim sonucu (match_distance: exact isabette 0, benzer spec'te mesafe, yeni üretimde None)"""
+    markdown: str
+    cache_hit: bool
+    match_distance: Optional[float] = None
+    sections: Optional[Dict[str, int]] = None  # Bölüm bazlı üretimde {"total", "cached"}
+    ai_provider: Optional[str] = None  # Üretime hizmet eden (cache isabetinde kaydı üreten) provider
+    match_type: str = MatchType.NONE  # Mesafesi 0 olan benzer spec ile exact isabeti ayırır
+
+class GenerationService:
+    """Endpoint'ler arasında paylaşılan ruleset üretim servisi"""
+    
+    @staticmethod
+    def spec_key(
+        project_info: ProjectInfo,
+        provider_name: Optional[str] = None,
+        model_name: Optional[str] = None
+    ) -> str:
+        """Provider/model (varsayılan: tercih edilen) ve çıktı bütçesi için normalize edilmiş spec anahtarı"""
+        project_info = TokenBudget.apply(project_info, enforce=False)
+        return ruleset_cache.make_key(
+            project_info,
+            provider_name or ai_service.provider_name,
+            model_name or ai_service.model_name,
+            variant=f"max_output_tokens={TokenBudget.max_output_tokens(project_info)}"
+        )
+    
+    @staticmethod
+    def similarity_scope(
+        project_info: ProjectInfo,
+        provider_name: Optional[str] = None,
+        model_name: Optional[str] = None
+    ) -> str:
+        """Benzerlik eşleşmesinin geçerli olduğu provider/model/çıktı bütçesi kapsamı"""
+        provider_name = provider_name or ai_service.provider_name
+        model_name = model_name or ai_service.model_name
+        return f"{provider_name}:{model_name}:{TokenBudget.max_output_tokens(project_info)}"
+    
+    @staticmethod
+    def allow_similar(reuse: Optional[str] = None) -> bool:
+        """İstek (reuse=exact/similar) ve SIMILARITY_REUSE ayarına göre benzer spec kullanılabilir mi"""
+        mode = settings.SIMILARITY_REUSE.lower()
+        if mode == "off" or reuse == "exact":
+            return False
+        return reuse == "similar" or mode == "auto"
+    
+    @staticmethod
+    def use_sections(strategy: Optional[str] = None) -> bool:
+        """İstekteki strategy (yoksa GENERATION_STRATEGY) bölüm bazlı üretimi seçiyor mu"""
+        return (strategy or settings.GENERATION_STRATEGY).lower() == "sections"
+    
+    @staticmethod
+    def section_key(
+        prompt: str,
+        max_tokens: int,
+        provider_name: Optional[str] = None,
+        model_name: Optional[str] = None
+    ) -> str:
+        """Bölüm prompt'u + provider/model (varsayılan: tercih edilen) + çıktı limiti için cache anahtarı"""
+        payload = "\x1f".join((
+            "section",
+            provider_name or ai_service.provider_name,
+            model_name or ai_service.model_name,
+            str(max_tokens),
+            prompt
+        ))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def served_by(results: List[ProviderResult]) -> Tuple[str, str]:
+        """Bölümlere hizmet eden provider ve model (birden fazlaysa "+" ile birleştirilir)"""
+        providers = dict.fromkeys(result.provider_name for result in results)
+        models = dict.fromkeys(result.model_name for result in results)
+        return "+".join(providers), "+".join(models)
+    
+    async def lookup(
+        self,
+        project_info: ProjectInfo,
+        cache_key: str,
+        reuse: Optional[str] = None
+    ) -> Optional[Tuple[str, float, str]]:
+        """Cache'te önce exact anahtarla, izin varsa en yakın benzer spec ile ara, (markdown, mesafe, eşleşme türü) döndür"""
+        scope = self.similarity_scope(project_info)
+        markdown_content = await ruleset_cache.get(cache_key)
+        if markdown_content is not None:
+            # Kalıcı cache'te restart öncesinden kalan kayıtlar indekse isabet anında eklenir
+            similarity_index.add(cache_key, project_info, scope)
+            return markdown_content, 0.0, MatchType.EXACT
+        if not self.allow_similar(reuse):
+            return None
+        
+        match = similarity_index.find(project_info, scope, settings.SIMILARITY_MAX_DISTANCE)
+        if match is None:
+            return None
+        markdown_content = await ruleset_cache.get(match.cache_key)
+        if markdown_content is None:
+            # Ruleset cache'ten düşmüş (TTL/LRU) kayıt
+            similarity_index.discard(match.cache_key)
+            return None
+        return markdown_content, match.distance, MatchType.SIMILAR
+    
+    async def store(self, project_info: ProjectInfo, result: ProviderResult) -> str:
+        """Üretilen ruleset'i hizmet eden provider/model anahtarıyla cache'e, indekse ve geçmişe yaz"""
+        cache_key = self.spec_key(project_info, result.provider_name, result.model_name)
+        await ruleset_cache.set(cache_key, result.content)
+        if ruleset_cache.enabled:
+            similarity_index.add(
+                cache_key, project_info, self.similarity_scope(project_info, result.provider_name, result.model_name)
+            )
+        history_recorder.record(project_info, cache_key, result)
+        return cache_key
+    
+    async def rehydrate(self) -> int:
+        """Restart sonrası geçmişteki son üretimlerle ruleset cache'ini ve benzerlik indeksini doldur"""
+        if not (settings.HISTORY_REHYDRATE and history_recorder.enabled and ruleset_cache.enabled):
+            return 0
+        entries = await history_recorder.store.latest(
+            settings.RULESET_CACHE_MAX_ENTRIES,
+            ai_service.provider_name,
+            ai_service.model_name,
+            since=time.time() - settings.RULESET_CACHE_TTL
+        )
+        # En eskiden yeniye: LRU sırası geçmişteki sırayla aynı kalır
+        for entry in reversed(entries):
+            project_info = ProjectInfo(**entry["project_info"])
+            # Kalıcı cache backend'inde zaten olan kayıtların TTL'i uzatılmaz
+            if await ruleset_cache.backend.get(entry["spec_hash"]) is None:
+                await ruleset_cache.backend.set(entry["spec_hash"], entry["markdown"])
+                history_recorder.rehydrated += 1
+            similarity_index.add(entry["spec_hash"], project_info, self.similarity_scope(project_info))
+        return history_recorder.rehydrated
+    
+    @staticmethod
+    def prepare(project_info: ProjectInfo) -> Tuple[ProjectInfo, str, int]:
+        """Bütçeyi uygula ve (kırpılmış project_info, prompt, max_output_tokens) döndür"""
+        with generation_stage_duration_seconds.time("prompt_build"):
+            project_info = TokenBudget.apply(project_info)
+            prompt = PromptService.generate_ruleset_prompt(project_info)
+            TokenBudget.check_prompt(prompt)
+        return project_info, prompt, TokenBudget.max_output_tokens(project_info)
+    
+    async def generate(
+        self,
+        project_info: ProjectInfo,
+        wait_for_slot: bool = True,
+        reuse: Optional[str] = None,
+        strategy: Optional[str] = None
+    ) -> GenerationResult:
+        """Ruleset üret (wait_for_slot=False: kapasite doluysa OverCapacityError; reuse: exact/similar; strategy: single/sections)"""
+        # Bütçe aşımları (reject modunda) upstream'e gitmeden reddedilir
+        project_info, prompt, max_tokens = self.prepare(project_info)
+        
+        # Bölümler kendi anahtarlarıyla cache'lenir; doküman cache'i ve benzerlik indeksi kullanılmaz
+        if self.use_sections(strategy):
+            return await asyncio.wait_for(
+                self.generate_sections(project_info, wait_for_slot), settings.GENERATION_TIMEOUT
+            )
+        
+        # Aynı (veya izin varsa yeterince benzer) stack daha önce üretildiyse cache'ten dön
+        provider_name, model_name = ai_service.provider_name, ai_service.model_name
+        cache_key = self.spec_key(project_info, provider_name, model_name)
+        cached = await self.lookup(project_info, cache_key, reuse)
+        if cached is not None:
+            return GenerationResult(cached[0], True, cached[1], ai_provider=provider_name, match_type=cached[2])
+        
+        # AI ile içerik üret; özdeş eşzamanlı istekler tek upstream çağrısını paylaşır
+        async def generate() -> ProviderResult:
+            # Yalnızca upstream'e giden lider çağrı slot tutar; cache isabetleri ve bekleyenler tutmaz
+            async with admission_controller.slot(wait=wait_for_slot):
+                with generations_in_flight.track("sync"), generation_stage_duration_seconds.time("provider_call"):
+                    result = await ai_service.generate_ruleset(prompt, max_tokens=max_tokens)
+            # Failover olduysa kayıt, tercih edilen değil hizmet eden provider'ın anahtarına yazılır
+            await self.store(project_info, result)
+            return result
+        
+        flight_key = request_coalescer.make_key(
+            f"{PromptService.prompt_fingerprint(project_info)}:{max_tokens}",
+            ai_service.provider_name,
+            ai_service.model_name
+        )
+        result = await request_coalescer.run(
+            flight_key, generate, timeout=settings.GENERATION_TIMEOUT
+        )
+        return GenerationResult(result.content, False, ai_provider=result.provider_name)
+    
+    async def _generate_section(self, prompt: str, max_tokens: int, semaphore: asyncio.Semaphore) -> ProviderResult:
+        """Tek bölümü üret ve cache'le; aynı bölüm prompt'u (farklı stack'lerden de) tek çağrıyı paylaşır"""
+        
+        async def generate() -> ProviderResult:
+            async with semaphore:
+                with generation_stage_duration_seconds.time("section_call"):
+                    result = await ai_service.generate_ruleset(prompt, max_tokens=max_tokens)
+            await ruleset_cache.set(
+                self.section_key(prompt, max_tokens, result.provider_name, result.model_name), result.content
+            )
+            return result
+        
+        return await request_coalescer.run(
+            self.section_key(prompt, max_tokens), generate, timeout=settings.GENERATION_TIMEOUT
+        )
+    
+    async def iter_sections(
+        self,
+        project_info: ProjectInfo,
+        wait_for_slot: bool = True
+    ) -> AsyncIterator[Tuple[ProviderResult, bool]]:
+        """Bölümleri paralel üret, (sonuç, cache_hit) çiftlerini doküman sırasıyla döndür"""
+        sections = PromptService.section_prompts(project_info)
+        max_tokens = TokenBudget.section_max_output_tokens(project_info, len(sections))
+        provider_name, model_name = ai_service.provider_name, ai_service.model_name
+        cached = [
+            None if content is None else ProviderResult(content, provider_name, model_name)
+            for content in await asyncio.gather(*(
+                ruleset_cache.get(self.section_key(prompt, max_tokens, provider_name, model_name))
+                for _, prompt in sections
+            ))
+        ]
+        if all(result is not None for result in cached):
+            for result in cached:
+                yield result, True
+            return
+        
+        # Eksik bölümler tek admission slot'u altında, SECTION_MAX_CONCURRENCY ile sınırlı paralel üretilir
+        semaphore = asyncio.Semaphore(max(1, settings.SECTION_MAX_CONCURRENCY))
+        async with admission_controller.slot(wait=wait_for_slot):
+            with generations_in_flight.track("sections"):
+                tasks = [
+                    None if result is not None
+                    else asyncio.ensure_future(self._generate_section(prompt, max_tokens, semaphore))
+                    for result, (_, prompt) in zip(cached, sections)
+                ]
+                try:
+                    for result, task in zip(cached, tasks):
+                        if task is None:
+                            yield result, True
+                        else:
+                            yield await task, False
+                finally:
+                    for task in tasks:
+                        if task is None:
+                            continue
+                        if not task.done():
+                            task.cancel()
+                        elif not task.cancelled():
+                            task.exception()
+    
+    async def generate_sections(self, project_info: ProjectInfo, wait_for_slot: bool = True) -> GenerationResult:
+        """Bölüm bazlı üretim: bölümleri paralel üretip sırayla tek dokümanda birleştir"""
+        parts: List[ProviderResult] = []
+        cached = 0
+        sections = self.iter_sections(project_info, wait_for_slot)
+        try:
+            async for result, cache_hit in sections:
+                parts.append(result)
+                cached += cache_hit
+        finally:
+            await sections.aclose()
+        
+        cache_hit = cached == len(parts)
+        markdown_content = PromptService.assemble_sections(project_info, [part.content for part in parts])
+        provider_name, model_name = self.served_by(parts)
+        if not cache_hit:
+            self.record_sections(project_info, ProviderResult(markdown_content, provider_name, model_name))
+        return GenerationResult(
+            markdown_content,
+            cache_hit,
+            0.0 if cache_hit else None,
+            {"total": len(parts), "cached": cached},
+            ai_provider=provider_name,
+            match_type=MatchType.EXACT if cache_hit else MatchType.NONE
+        )
+    
+    def record_sections(self, project_info: ProjectInfo, result: ProviderResult) -> None:
+        """Bölümlerden birleştirilen dokümanı hizmet eden provider/model anahtarıyla geçmişe kaydet"""
+        cache_key = self.spec_key(project_info, result.provider_name, result.model_name)
+        history_recorder.record(project_info, cache_key, result, strategy="sections")
+    
+    @staticmethod
+    def build_json_data(
+        project_info: ProjectInfo,
+        markdown_content: str,
+        cache_hit: bool,
+        include_content: bool = True,
+        match_distance: Optional[float] = None,
+        sections: Optional[Dict[str, int]] = None,
+        ai_provider: Optional[str] = None,
+        match_type: str = MatchType.NONE
+    ) -> Dict[str, Any]:
+        """RulesetResponse.json_data içeriğini hazırla (include_content=False: markdown tekrarlanmaz)"""
+        with generation_stage_duration_seconds.time("serialization"):
+            project_info = TokenBudget.apply(project_info, enforce=False)
+            if sections is None:
+                prompt = PromptService.generate_ruleset_prompt(project_info)
+            else:
+                prompt = "".join(section_prompt for _, section_prompt in PromptService.section_prompts(project_info))
+            json_data = {
+                "project_info": project_info.model_dump(),
+                "generated_at": datetime.now().isoformat(),
+                "ai_provider": ai_provider or ai_service.provider_name,
+                "cache_hit": cache_hit,
+                "match_type": match_type,
+                "match_distance": round(match_distance, 4) if match_distance is not None else None,
+                "token_usage": TokenBudget.usage(
+                    prompt, markdown_content, TokenBudget.max_output_tokens(project_info)
+                )
+            }
+            if sections is not None:
+                json_data["sections"] = sections
+            if include_content:
+                json_data["ruleset_content"] = markdown_content
+            return json_data
+    
+    async def generate_batch(
+        self,
+        items: List[ProjectInfo],
+        concurrency: Optional[int] = None,
+        include_content: bool = True,
+        reuse: Optional[str] = None,
+        strategy: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Birden fazla spec'i eşzamanlı üret, sonuçları tamamlanma sırasıyla döndür"""
+        limit = min(concurrency or settings.BATCH_MAX_CONCURRENCY, settings.BATCH_MAX_CONCURRENCY)
+        semaphore = asyncio.Semaphore(max(1, limit))
+        
+        # Özdeş spec'leri tek üretimde birleştir
+        groups: Dict[str, List[int]] = {}
+        for index, project_info in enumerate(items):
+            groups.setdefault(self.spec_key(project_info), []).append(index)
+        
+        async def run(indices: List[int]) -> Tuple[List[int], Optional[GenerationResult], Optional[str]]:
+            async with semaphore:
+                try:
+                    return indices, await self.generate(items[indices[0]], reuse=reuse, strategy=strategy), None
+                except asyncio.TimeoutError:
+                    return indices, None, "Ruleset generation timed out"
+                except TokenBudgetExceeded as e:
+                    return indices, None, f"Token budget exceeded: {str(e)}"
+                except Exception as e:
+                    return indices, None, f"Ruleset generation failed: {str(e)}"
+        
+        tasks = [asyncio.ensure_future(run(indices)) for indices in groups.values()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                indices, result, error = await next_done
+                for index in indices:
+                    if error is not None:
+                        yield {"index": index, "status": "error", "error": error}
+                    else:
+                        yield {
+                            "index": index,
+                            "status": "ok",
+                            "markdown": result.markdown,
+                            "json_data": self.build_json_data(
+                                items[index],
+                                result.markdown,
+                                result.cache_hit,
+                                include_content=include_content,
+                                match_distance=result.match_distance,
+                                sections=result.sections,
+                                ai_provider=result.ai_provider,
+                                match_type=result.match_type
+                            )
+                        }
+        finally:
+            for task in tasks:
+                task.cancel()
+
+# Global generation service instance
+generation_service = GenerationService()
@@ -0,0 +1,64 @@
+"""
+Arka planda yenilenen, bellekten servis edilen readiness durumu
+"""
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+from app.services.ai_service import ai_service
+from app.core.config import settings
+
+class HealthMonitor:
+    """Provider readiness sonucunu periyodik olarak yenileyip bellekte tutar"""
+    
+    def __init__(self, interval: float, deep: bool):
+        self.interval = interval
+        self.deep = deep
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at: float = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+    
+    async def refresh(self) -> Dict[str, Any]:
+        """Provider'ı kontrol et ve sonucu güncelle"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            try:
+                result = await ai_service.check_health(deep=self.deep)
+            except Exception as e:
+                result = {"available": False, "error": str(e)}
+            result["checked_at"] = datetime.now().isoformat()
+            self._result = result
+            self._checked_at = time.monotonic()
+            return result
+    
+    async def get(self) -> Dict[str, Any]:
+        """Son readiness sonucunu döndür, hiç yoksa veya bayatsa yenile"""
+        if self._result is None or time.monotonic() - self._checked_at > self.interval * 2:
+            return await self.refresh()
+        return self._result
+    
+    async def _run(self) -> None:
+        """Arka plan yenileme döngüsü"""
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.interval)
+    
+    def start(self) -> None:
+        """Arka plan yenilemesini başlat"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Arka plan yenilemesini durdur"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+# Global health monitor instance
+health_monitor = HealthMonitor(settings.HEALTH_CHECK_INTERVAL, settings.HEALTH_CHECK_DEEP)
@@ -0,0 +1,360 @@
+"""
+Üretim geçmişi: her üretimi kalıcı olarak saklayan, toplu yazan store
+"""
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Dict, List, Optional
+from app.models.schemas import ProjectInfo
+from app.services.ai_service import ProviderResult
+from app.services.prompt_service import PromptService
+from app.core.config import settings
+
+class HistoryStore(ABC):
+    """Geçmiş saklama backend'leri için base class"""
+    
+    @abstractmethod
+    async def write_many(self, entries: List[Dict[str, Any]]) -> None:
+        """Kayıtları tek seferde yaz"""
+        pass
+    
+    @abstractmethod
+    async def get(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        """Kaydı markdown ile birlikte getir"""
+        pass
+    
+    @abstractmethod
+    async def list(self, limit: int, before: Optional[int] = None, **filters) -> List[Dict[str, Any]]:
+        """seq < before olan kayıtları yeniden eskiye, markdown olmadan getir"""
+        pass
+    
+    @abstractmethod
+    async def latest(self, limit: int, ai_provider: str, model: str, since: float) -> List[Dict[str, Any]]:
+        """Spec başına en yeni tek parça üretimleri getir (cache rehydration için)"""
+        pass
+    
+    @abstractmethod
+    def size(self) -> int:
+        """Kayıt sayısı"""
+        pass
+
+def _matches(entry: Dict[str, Any], category: Optional[str], framework: Optional[str], spec_hash: Optional[str]) -> bool:
+    """Liste filtreleri (framework frontend veya backend framework'üyle eşleşir)"""
+    if category is not None and entry["category"] != category:
+        return False
+    if framework is not None and framework not in (entry["frontend_framework"], entry["backend_framework"]):
+        return False
+    return spec_hash is None or entry["spec_hash"] == spec_hash
+
+class MemoryHistoryStore(HistoryStore):
+    """Process içi, max_entries ile sınırlı geçmiş"""
+    
+    def __init__(self, max_entries: int):
+        self._entries: "deque[Dict[str, Any]]" = deque(maxlen=max(1, max_entries))
+        self._seq = 0
+    
+    async def write_many(self, entries: List[Dict[str, Any]]) -> None:
+        for entry in entries:
+            self._seq += 1
+            self._entries.append(dict(entry, seq=self._seq))
+    
+    async def get(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        for entry in self._entries:
+            if entry["id"] == entry_id:
+                return dict(entry)
+        return None
+    
+    async def list(
+        self,
+        limit: int,
+        before: Optional[int] = None,
+        category: Optional[str] = None,
+        framework: Optional[str] = None,
+        spec_hash: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        items = []
+        for entry in reversed(self._entries):
+            if len(items) >= limit:
+                break
+            if before is not None and entry["seq"] >= before:
+                continue
+            if _matches(entry, category, framework, spec_hash):
+                items.append({key: value for key, value in entry.items() if key != "markdown"})
+        return items
+    
+    async def latest(self, limit: int, ai_provider: str, model: str, since: float) -> List[Dict[str, Any]]:
+        seen = set()
+        items = []
+        for entry in reversed(self._entries):
+            if len(items) >= limit:
+                break
+            if (
+                entry["spec_hash"] in seen or entry["strategy"] != "single" or entry["created_at"] < since
+                or entry["ai_provider"] != ai_provider or entry["model"] != model
+            ):
+                continue
+            seen.add(entry["spec_hash"])
+            items.append(dict(entry))
+        return items
+    
+    def size(self) -> int:
+        return len(self._entries)
+
+class SQLiteHistoryStore(HistoryStore):
+    """WAL modunda SQLite geçmiş; spec hash, kategori, framework ve zaman üzerinden indeksli"""
+    
+    COLUMNS = (
+        "seq", "id", "spec_hash", "category", "frontend_framework", "backend_framework",
+        "ai_provider", "model", "strategy", "created_at", "project_info"
+    )
+    
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL: okuyucular (diğer worker'lar dahil) toplu yazmaları beklemez
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS history ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT NOT NULL UNIQUE, spec_hash TEXT NOT NULL, "
+            "category TEXT NOT NULL, frontend_framework TEXT NOT NULL, backend_framework TEXT NOT NULL, "
+            "ai_provider TEXT NOT NULL, model TEXT NOT NULL, strategy TEXT NOT NULL, created_at REAL NOT NULL, "
+            "project_info TEXT NOT NULL, markdown TEXT NOT NULL)"
+        )
+        # Tek kolon indeksleri rowid (seq) ile sıralıdır; filtre + seq cursor'ı aynı indeksi kullanır
+        for column in ("spec_hash", "category", "frontend_framework", "backend_framework", "created_at"):
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_history_{column} ON history ({column})")
+        self._conn.commit()
+    
+    def _row_to_entry(self, row, columns=COLUMNS) -> Dict[str, Any]:
+        entry = dict(zip(columns, row))
+        entry["project_info"] = json.loads(entry["project_info"])
+        return entry
+    
+    def _write_many(self, entries: List[Dict[str, Any]]) -> None:
+        rows = [
+            (
+                entry["id"], entry["spec_hash"], entry["category"], entry["frontend_framework"],
+                entry["backend_framework"], entry["ai_provider"], entry["model"], entry["strategy"],
+                entry["created_at"], json.dumps(entry["project_info"]), entry["markdown"]
+            )
+            for entry in entries
+        ]
+        with self._lock:
+            # Yarıda kesilen flush tekrarlanırsa aynı id ikinci kez yazılmaz
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO history (id, spec_hash, category, frontend_framework, backend_framework, "
+                "ai_provider, model, strategy, created_at, project_info, markdown) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.execute(
+                "DELETE FROM history WHERE seq <= (SELECT MAX(seq) FROM history) - ?", (self.max_entries,)
+            )
+            self._conn.commit()
+    
+    def _get(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        columns = self.COLUMNS + ("markdown",)
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(columns)} FROM history WHERE id = ?", (entry_id,)
+            ).fetchone()
+        return self._row_to_entry(row, columns) if row else None
+    
+    def _list(
+        self,
+        limit: int,
+        before: Optional[int],
+        category: Optional[str],
+        framework: Optional[str],
+        spec_hash: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        conditions, params = [], []
+        if before is not None:
+            conditions.append("seq < ?")
+            params.append(before)
+        if category is not None:
+            conditions.append("category = ?")
+            params.append(category)
+        if framework is not None:
+            conditions.append("(frontend_framework = ? OR backend_framework = ?)")
+            params.extend((framework, framework))
+        if spec_hash is not None:
+            conditions.append("spec_hash = ?")
+            params.append(spec_hash)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM history {where}ORDER BY seq DESC LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+    
+    def _latest(self, limit: int, ai_provider: str, model: str, since: float) -> List[Dict[str, Any]]:
+        columns = self.COLUMNS + ("markdown",)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(columns)} FROM history WHERE seq IN ("
+                "SELECT MAX(seq) FROM history WHERE ai_provider = ? AND model = ? AND strategy = 'single' "
+                "AND created_at >= ? GROUP BY spec_hash) ORDER BY seq DESC LIMIT ?",
+                (ai_provider, model, since, limit)
+            ).fetchall()
+        return [self._row_to_entry(row, columns) for row in rows]
+    
+    async def write_many(self, entries: List[Dict[str, Any]]) -> None:
+        await asyncio.to_thread(self._write_many, entries)
+    
+    async def get(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._get, entry_id)
+    
+    async def list(
+        self,
+        limit: int,
+        before: Optional[int] = None,
+        category: Optional[str] = None,
+        framework: Optional[str] = None,
+        spec_hash: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._list, limit, before, category, framework, spec_hash)
+    
+    async def latest(self, limit: int, ai_provider: str, model: str, since: float) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._latest, limit, ai_provider, model, since)
+    
+    def size(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+class HistoryRecorder:
+    """Üretimleri istek yolunu bekletmeden kuyruğa alıp arka planda toplu yazar"""
+    
+    def __init__(self, store: HistoryStore, enabled: bool, batch_size: int, flush_interval: float, queue_size: int):
+        self.store = store
+        self.enabled = enabled
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.queue_size = max(1, queue_size)
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._pending: List[Dict[str, Any]] = []
+        self.recorded = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+        self.rehydrated = 0
+    
+    def start(self) -> None:
+        """Yazıcı task'ını başlat (ilk kayıtta da otomatik başlar)"""
+        if self._writer is None or self._writer.done():
+            if self._queue is None:
+                self._queue = asyncio.Queue(maxsize=self.queue_size)
+            self._writer = asyncio.create_task(self._write_loop())
+    
+    async def stop(self) -> None:
+        """Yazıcıyı durdur ve kuyrukta kalanları yaz"""
+        if self._writer is not None:
+            self._writer.cancel()
+            await asyncio.gather(self._writer, return_exceptions=True)
+            self._writer = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._pending.append(self._queue.get_nowait())
+        await self._flush()
+    
+    def record(
+        self,
+        project_info: ProjectInfo,
+        spec_hash: str,
+        result: ProviderResult,
+        strategy: str = "single"
+    ) -> Optional[str]:
+        """Üretimi hizmet eden provider/model ile kuyruğa al, kayıt id'sini döndür (kuyruk doluysa atlanır)"""
+        if not self.enabled:
+            return None
+        self.start()
+        normalized = PromptService.normalize_project_info(project_info)
+        entry = {
+            "id": uuid.uuid4().hex,
+            "spec_hash": spec_hash,
+            "category": normalized["project_category"],
+            "frontend_framework": normalized["frontend_framework"],
+            "backend_framework": normalized["backend_framework"],
+            "ai_provider": result.provider_name,
+            "model": result.model_name,
+            "strategy": strategy,
+            "created_at": time.time(),
+            "project_info": project_info.model_dump(),
+            "markdown": result.content
+        }
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return None
+        self.recorded += 1
+        return entry["id"]
+    
+    async def _flush(self) -> None:
+        """Bekleyen kayıtları tek transaction'da yaz"""
+        if not self._pending:
+            return
+        try:
+            await self.store.write_many(self._pending)
+            self.written += len(self._pending)
+        except Exception:
+            self.failed += len(self._pending)
+        self._pending = []
+    
+    async def _write_loop(self) -> None:
+        """İlk kayıttan sonra flush_interval kadar biriktir, batch_size'a kadar toplu yaz"""
+        while True:
+            self._pending.append(await self._queue.get())
+            if self._queue.qsize() + 1 < self.batch_size:
+                await asyncio.sleep(self.flush_interval)
+            while len(self._pending) < self.batch_size and not self._queue.empty():
+                self._pending.append(self._queue.get_nowait())
+            await self._flush()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Geçmiş istatistikleri"""
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.store).__name__,
+            "entries": self.store.size(),
+            "queued": self._queue.qsize() if self._queue else 0,
+            "recorded": self.recorded,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "rehydrated": self.rehydrated
+        }
+
+def _create_store() -> HistoryStore:
+    """Ayarlara göre geçmiş store'u seç"""
+    backend_name = settings.HISTORY_BACKEND.lower()
+    
+    if backend_name == "memory":
+        return MemoryHistoryStore(settings.HISTORY_MAX_ENTRIES)
+    elif backend_name == "sqlite":
+        try:
+            return SQLiteHistoryStore(settings.HISTORY_PATH, settings.HISTORY_MAX_ENTRIES)
+        except sqlite3.OperationalError:
+            # Salt okunur dosya sistemlerinde (ör. serverless) geçmiş process içinde tutulur
+            return MemoryHistoryStore(settings.HISTORY_MAX_ENTRIES)
+    else:
+        raise ValueError(f"Desteklenmeyen history backend: {backend_name}")
+
+# Global history recorder instance
+history_recorder = HistoryRecorder(
+    _create_store(),
+    enabled=settings.HISTORY_ENABLED,
+    batch_size=settings.HISTORY_BATCH_SIZE,
+    flush_interval=settings.HISTORY_FLUSH_INTERVAL,
+    queue_size=settings.HISTORY_QUEUE_SIZE
+)
@@ -0,0 +1,201 @@
+"""
+Hugging Face provider implementation (self-hosted TGI veya OpenAI-uyumlu endpoint)
+"""
+import asyncio
+import json
+import httpx
+from typing import Dict, Any, AsyncIterator, List, Optional, Set, Tuple
+from app.services.ai_provider import AIProvider, classify_error
+from app.services.retry_policy import RetryPolicy
+from app.core.config import settings
+
+class HuggingFaceProvider(AIProvider):
+    """text-generation-inference ya da OpenAI-uyumlu (/v1/completions) sunucu için provider"""
+    
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(
+            max_concurrency=settings.HUGGINGFACE_MAX_CONCURRENCY,
+            retry_policy=RetryPolicy(max_retries=settings.HUGGINGFACE_MAX_RETRIES, hedge=settings.HUGGINGFACE_HEDGE)
+        )
+        self.api_style = settings.HUGGINGFACE_API_STYLE.lower()
+        if self.api_style not in ("tgi", "openai"):
+            raise ValueError(f"Desteklenmeyen Hugging Face API stili: {self.api_style}")
+        
+        headers = {}
+        if settings.HUGGINGFACE_API_KEY:
+            headers["Authorization"] = f"Bearer {settings.HUGGINGFACE_API_KEY}"
+        
+        # Tüm istekler keep-alive bağlantı havuzunu paylaşır
+        self.client = client or httpx.AsyncClient(
+            base_url=settings.HUGGINGFACE_BASE_URL,
+            headers=headers,
+            timeout=httpx.Timeout(settings.HUGGINGFACE_TIMEOUT, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=settings.HUGGINGFACE_MAX_CONCURRENCY,
+                max_keepalive_connections=settings.HUGGINGFACE_MAX_CONCURRENCY,
+                keepalive_expiry=300
+            )
+        )
+        
+        # OpenAI-uyumlu sunucularda eşzamanlı prompt'lar tek isteğe toplanır
+        self.batch_size = max(1, settings.HUGGINGFACE_BATCH_SIZE) if self.api_style == "openai" else 1
+        self.batch_window = settings.HUGGINGFACE_BATCH_WINDOW_MS / 1000
+        self._pending: List[Tuple[str, Optional[int], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+    
+    def _tgi_payload(self, prompt: str, max_tokens: Optional[int]) -> Dict[str, Any]:
+        return {
+            "inputs": prompt,
+            "parameters": {
+                "max_new_tokens": max_tokens or settings.HUGGINGFACE_MAX_NEW_TOKENS,
+                "temperature": 0.7,
+                "return_full_text": False
+            }
+        }
+    
+    def _openai_payload(self, prompt, stream: bool, max_tokens: Optional[int]) -> Dict[str, Any]:
+        return {
+            "model": settings.HUGGINGFACE_MODEL,
+            "prompt": prompt,
+            "max_tokens": max_tokens or settings.HUGGINGFACE_MAX_NEW_TOKENS,
+            "temperature": 0.7,
+            "stream": stream
+        }
+    
+    async def _complete_batch(self, prompts: List[str], max_tokens: Optional[int]) -> List[str]:
+        """Prompt listesini tek bir /v1/completions isteğiyle üret"""
+        async with self.concurrency_limit:
+            response = await self.client.post(
+                "/v1/completions", json=self._openai_payload(prompts, False, max_tokens)
+            )
+        response.raise_for_status()
+        choices = sorted(response.json()["choices"], key=lambda choice: choice.get("index", 0))
+        return [choice["text"] for choice in choices]
+    
+    def _flush(self) -> None:
+        """Bekleyen prompt'ları tek bir batch isteği olarak gönder"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._send_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _send_batch(self, batch: List[Tuple[str, Optional[int], asyncio.Future]]) -> None:
+        # Batch içindeki en yüksek çıktı limiti tüm prompt'lar için kullanılır
+        limits = [max_tokens for _, max_tokens, _ in batch if max_tokens]
+        try:
+            texts = await self._complete_batch(
+                [prompt for prompt, _, _ in batch], max(limits) if limits else None
+            )
+            if len(texts) != len(batch):
+                raise Exception(f"Beklenen {len(batch)} sonuç, gelen {len(texts)}")
+            for (_, _, future), text in zip(batch, texts):
+                if not future.done():
+                    future.set_result(text)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+    
+    async def _generate_batched(self, prompt: str, max_tokens: Optional[int]) -> str:
+        """Prompt'u batch penceresine ekle ve sonucunu bekle"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((prompt, max_tokens, future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await future
+    
+    async def generate_content(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+        """Hugging Face endpoint'i ile içerik üret"""
+        try:
+            if self.api_style == "openai":
+                if self.batch_size > 1:
+                    return await self._generate_batched(prompt, max_tokens)
+                return (await self._complete_batch([prompt], max_tokens))[0]
+            
+            # TGI eşzamanlı istekleri sunucu tarafında continuous batching ile birleştirir
+            async with self.concurrency_limit:
+                response = await self.client.post("/generate", json=self._tgi_payload(prompt, max_tokens))
+            response.raise_for_status()
+            return response.json()["generated_text"]
+        except Exception as e:
+            raise classify_error(e, f"Hugging Face API hatası: {str(e)}") from e
+    
+    async def generate_content_stream(self, prompt: str, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        """Hugging Face endpoint'i ile token'ları parça parça üret"""
+        if self.api_style == "openai":
+            path, payload = "/v1/completions", self._openai_payload(prompt, True, max_tokens)
+        else:
+            path, payload = "/generate_stream", self._tgi_payload(prompt, max_tokens)
+        
+        try:
+            async with self.concurrency_limit:
+                async with self.client.stream("POST", path, json=payload) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[len("data:"):].strip()
+                        if data == "[DONE]":
+                            break
+                        event = json.loads(data)
+                        if event.get("error"):
+                            raise Exception(event["error"])
+                        if self.api_style == "openai":
+                            text = event["choices"][0].get("text") if event.get("choices") else None
+                        else:
+                            token = event.get("token") or {}
+                            text = None if token.get("special") else token.get("text")
+                        if text:
+                            yield text
+        except Exception as e:
+            raise classify_error(e, f"Hugging Face API hatası: {str(e)}") from e
+    
+    async def close(self) -> None:
+        """Bağlantı havuzunu kapat"""
+        await self.client.aclose()
+    
+    async def check_health(self, deep: bool = False) -> Dict[str, Any]:
+        """Hugging Face sağlık kontrolü"""
+        try:
+            if not settings.HUGGINGFACE_BASE_URL:
+                return {
+                    "available": False,
+                    "error": "Base URL eksik"
+                }
+            
+            if deep:
+                # Üretim yerine ucuz metadata çağrısı
+                response = await self.client.get("/v1/models" if self.api_style == "openai" else "/info")
+                response.raise_for_status()
+            
+            return {
+                "available": True,
+                "model": settings.HUGGINGFACE_MODEL,
+                "status": "healthy",
+                "deep": deep
+            }
+        except Exception as e:
+            return {
+                "available": False,
+                "error": str(e)
+            }
+    
+    @property
+    def is_configured(self) -> bool:
+        return bool(settings.HUGGINGFACE_BASE_URL)
+    
+    @property
+    def model_name(self) -> str:
+        return settings.HUGGINGFACE_MODEL
+    
+    @property
+    def provider_name(self) -> str:
+        return "huggingface"
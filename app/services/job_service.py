@@ -0,0 +1,474 @@
+"""
+Uzun üretimler için asenkron job kuyruğu
+"""
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+from app.models.schemas import ProjectInfo
+from app.services.generation_service import generation_service
+from app.core.config import settings
+
+class JobStatus:
+    """Job durumları"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    
+    FINISHED = (SUCCEEDED, FAILED)
+
+class QueueFullError(Exception):
+    """Kuyruk dolu olduğunda fırlatılır"""
+    pass
+
+class JobStore(ABC):
+    """Job durumu saklama backend'leri için base class"""
+    
+    @abstractmethod
+    async def create(self, job: Dict[str, Any]) -> None:
+        """Yeni job kaydet"""
+        pass
+    
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job'u getir"""
+        pass
+    
+    @abstractmethod
+    async def update(self, job_id: str, **fields) -> None:
+        """Job alanlarını güncelle"""
+        pass
+    
+    @abstractmethod
+    async def claim(self, job_id: str, owner: str) -> Optional[Dict[str, Any]]:
+        """Job hâlâ queued ise atomik olarak running yapıp owner'a ver; alınamazsa None"""
+        pass
+    
+    @abstractmethod
+    async def heartbeat(self, job_id: str, owner: str) -> bool:
+        """Çalışan job'un updated_at'ini yenile; job artık owner'da değilse False"""
+        pass
+    
+    @abstractmethod
+    async def finish(self, job_id: str, owner: str, **fields) -> bool:
+        """Job owner'da ve running ise sonucu yaz; değilse (ör. yeniden kuyruğa alınmışsa) False"""
+        pass
+    
+    @abstractmethod
+    async def requeue_stale(self, stale_before: float) -> List[str]:
+        """updated_at'i stale_before'dan eski running job'ları queued'a geri al"""
+        pass
+    
+    @abstractmethod
+    async def list_queued(self) -> List[str]:
+        """Queued job id'lerini oluşturulma sırasıyla getir"""
+        pass
+    
+    @abstractmethod
+    async def purge_expired(self, ttl: float) -> int:
+        """TTL'i dolan bitmiş job'ları sil"""
+        pass
+
+class MemoryJobStore(JobStore):
+    """Process içi job store"""
+    
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+    
+    async def create(self, job: Dict[str, Any]) -> None:
+        self._jobs[job["id"]] = dict(job)
+    
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        return dict(job) if job is not None else None
+    
+    async def update(self, job_id: str, **fields) -> None:
+        if job_id in self._jobs:
+            self._jobs[job_id].update(fields, updated_at=time.time())
+    
+    async def claim(self, job_id: str, owner: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        if job is None or job["status"] != JobStatus.QUEUED:
+            return None
+        job.update(status=JobStatus.RUNNING, owner=owner, updated_at=time.time())
+        return dict(job)
+    
+    async def heartbeat(self, job_id: str, owner: str) -> bool:
+        job = self._jobs.get(job_id)
+        if job is None or job["status"] != JobStatus.RUNNING or job.get("owner") != owner:
+            return False
+        job["updated_at"] = time.time()
+        return True
+    
+    async def finish(self, job_id: str, owner: str, **fields) -> bool:
+        if not await self.heartbeat(job_id, owner):
+            return False
+        self._jobs[job_id].update(fields, updated_at=time.time())
+        return True
+    
+    async def requeue_stale(self, stale_before: float) -> List[str]:
+        stale = [
+            job for job in self._jobs.values()
+            if job["status"] == JobStatus.RUNNING and job["updated_at"] < stale_before
+        ]
+        for job in stale:
+            job.update(status=JobStatus.QUEUED, owner=None, updated_at=time.time())
+        return [job["id"] for job in stale]
+    
+    async def list_queued(self) -> List[str]:
+        queued = [job for job in self._jobs.values() if job["status"] == JobStatus.QUEUED]
+        return [job["id"] for job in sorted(queued, key=lambda job: job["created_at"])]
+    
+    async def purge_expired(self, ttl: float) -> int:
+        cutoff = time.time() - ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job["status"] in JobStatus.FINISHED and job["updated_at"] < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        return len(expired)
+
+class SQLiteJobStore(JobStore):
+    """Restart'lardan sonra da yaşayan SQLite job store"""
+    
+    COLUMNS = ("id", "status", "project_info", "result", "error", "created_at", "updated_at")
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, status TEXT NOT NULL, project_info TEXT NOT NULL, "
+            "result TEXT, error TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        try:
+            # Önceki şemayla oluşturulmuş dosyalar için
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+        except sqlite3.OperationalError:
+            pass
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, updated_at)")
+        self._conn.commit()
+    
+    def _row_to_job(self, row) -> Dict[str, Any]:
+        job = dict(zip(self.COLUMNS, row))
+        job["project_info"] = json.loads(job["project_info"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+    
+    def _create(self, job: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, status, project_info, result, error, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job["id"], job["status"], json.dumps(job["project_info"]),
+                    json.dumps(job["result"]) if job["result"] else None,
+                    job["error"], job["created_at"], job["updated_at"]
+                )
+            )
+            self._conn.commit()
+    
+    def _get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+    
+    def _update(self, job_id: str, fields: Dict[str, Any]) -> None:
+        fields = dict(fields, updated_at=time.time())
+        if "result" in fields and fields["result"] is not None:
+            fields["result"] = json.dumps(fields["result"])
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id)
+            )
+            self._conn.commit()
+    
+    def _claim(self, job_id: str, owner: str) -> Optional[Dict[str, Any]]:
+        # Koşullu UPDATE: aynı dosyayı paylaşan process'lerden yalnızca biri job'u alabilir
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, owner = ?, updated_at = ? WHERE id = ? AND status = ?",
+                (JobStatus.RUNNING, owner, time.time(), job_id, JobStatus.QUEUED)
+            )
+            self._conn.commit()
+        return self._get(job_id) if cursor.rowcount == 1 else None
+    
+    def _finish(self, job_id: str, owner: str, fields: Dict[str, Any]) -> bool:
+        fields = dict(fields, updated_at=time.time())
+        if "result" in fields and fields["result"] is not None:
+            fields["result"] = json.dumps(fields["result"])
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ? AND owner = ? AND status = ?",
+                (*fields.values(), job_id, owner, JobStatus.RUNNING)
+            )
+            self._conn.commit()
+        return cursor.rowcount == 1
+    
+    def _requeue_stale(self, stale_before: float) -> List[str]:
+        requeued = []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM jobs WHERE status = ? AND updated_at < ?", (JobStatus.RUNNING, stale_before)
+            ).fetchall()
+            for (job_id,) in rows:
+                # Koşul tekrarlanır: arada heartbeat yazan ya da job'u alan başka bir process olabilir
+                cursor = self._conn.execute(
+                    "UPDATE jobs SET status = ?, owner = NULL, updated_at = ? "
+                    "WHERE id = ? AND status = ? AND updated_at < ?",
+                    (JobStatus.QUEUED, time.time(), job_id, JobStatus.RUNNING, stale_before)
+                )
+                if cursor.rowcount == 1:
+                    requeued.append(job_id)
+            self._conn.commit()
+        return requeued
+    
+    def _list_queued(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM jobs WHERE status = ? ORDER BY created_at", (JobStatus.QUEUED,)
+            ).fetchall()
+        return [row[0] for row in rows]
+    
+    def _purge_expired(self, ttl: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (*JobStatus.FINISHED, time.time() - ttl)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+    
+    async def create(self, job: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._create, job)
+    
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._get, job_id)
+    
+    async def update(self, job_id: str, **fields) -> None:
+        await asyncio.to_thread(self._update, job_id, fields)
+    
+    async def claim(self, job_id: str, owner: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._claim, job_id, owner)
+    
+    async def heartbeat(self, job_id: str, owner: str) -> bool:
+        return await asyncio.to_thread(self._finish, job_id, owner, {})
+    
+    async def finish(self, job_id: str, owner: str, **fields) -> bool:
+        return await asyncio.to_thread(self._finish, job_id, owner, fields)
+    
+    async def requeue_stale(self, stale_before: float) -> List[str]:
+        return await asyncio.to_thread(self._requeue_stale, stale_before)
+    
+    async def list_queued(self) -> List[str]:
+        return await asyncio.to_thread(self._list_queued)
+    
+    async def purge_expired(self, ttl: float) -> int:
+        return await asyncio.to_thread(self._purge_expired, ttl)
+
+class JobQueue:
+    """Sınırlı kuyruk + worker havuzu ile arka plan ruleset üretimi"""
+    
+    def __init__(
+        self,
+        store: JobStore,
+        workers: int,
+        max_size: int,
+        result_ttl: float,
+        heartbeat_interval: float = 10.0,
+        stale_after: float = 60.0
+    ):
+        self.store = store
+        self.worker_count = max(1, workers)
+        self.max_size = max(1, max_size)
+        self.result_ttl = result_ttl
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        # Aynı store'u paylaşan process'ler arasında job sahipliği
+        self.owner = uuid.uuid4().hex
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._events: Dict[str, asyncio.Event] = {}
+        # store.create beklenirken ayrılmış kuyruk yerleri (eşzamanlı submit'ler kuyruğu aşamaz)
+        self._reserved = 0
+        self.requeued = 0
+        self.lost = 0
+        self.store_errors = 0
+    
+    async def start(self) -> None:
+        """Worker'ları başlat; heartbeat'i kesilmiş job'ları ve sahipsiz queued job'ları kuyruğa al"""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.worker_count)]
+        
+        # Başka bir worker'ın hâlâ çalıştırdığı job'lar heartbeat'leri taze olduğu için alınmaz
+        self.requeued += len(await self.store.requeue_stale(time.time() - self.stale_after))
+        for job_id in await self.store.list_queued():
+            # Diğer worker'ların kuyruğundaki job'lar da listelenir; claim yalnızca birinin çalıştırmasını sağlar.
+            # Kuyruk doluysa kalanlar queued kalır ve başka bir worker'ın (veya sonraki açılışın) kuyruğuna girer
+            if not self._has_room():
+                break
+            self._queue.put_nowait(job_id)
+    
+    async def stop(self) -> None:
+        """Worker'ları durdur"""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+    
+    async def submit(self, project_info: ProjectInfo) -> Dict[str, Any]:
+        """Job oluştur ve kuyruğa al; kuyruk doluysa QueueFullError fırlat"""
+        await self.start()
+        if not self._has_room():
+            raise QueueFullError("Job queue is full")
+        
+        now = time.time()
+        job = {
+            "id": uuid.uuid4().hex,
+            "status": JobStatus.QUEUED,
+            "project_info": project_info.model_dump(),
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now
+        }
+        # Yer store yazılmadan ayrılır; create sırasında gelen submit'ler aynı yeri alamaz
+        self._reserved += 1
+        try:
+            await self.store.create(job)
+        finally:
+            self._reserved -= 1
+        self._queue.put_nowait(job["id"])
+        return job
+    
+    def _has_room(self) -> bool:
+        """Kuyrukta (ayrılmış yerler dahil) boş yer var mı"""
+        return self._queue.qsize() + self._reserved < self.max_size
+    
+    async def get(self, job_id: str, wait: float = 0) -> Optional[Dict[str, Any]]:
+        """Job'u getir; wait > 0 ise bitene kadar en fazla wait saniye bekle (long-poll)"""
+        job = await self.store.get(job_id)
+        deadline = time.monotonic() + min(wait, settings.JOB_MAX_WAIT)
+        
+        while job is not None and job["status"] not in JobStatus.FINISHED:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            event = self._events.setdefault(job_id, asyncio.Event())
+            try:
+                # Başka bir process'in güncellediği job'lar için periyodik olarak da kontrol et
+                await asyncio.wait_for(event.wait(), min(remaining, 1.0))
+            except asyncio.TimeoutError:
+                pass
+            job = await self.store.get(job_id)
+        
+        return job
+    
+    def stats(self) -> Dict[str, Any]:
+        """Kuyruk istatistikleri"""
+        return {
+            "workers": len(self._workers),
+            "queued": self._queue.qsize() if self._queue else 0,
+            "max_size": self.max_size,
+            "requeued": self.requeued,
+            "lost": self.lost,
+            "store_errors": self.store_errors
+        }
+    
+    def _notify(self, job_id: str) -> None:
+        event = self._events.pop(job_id, None)
+        if event is not None:
+            event.set()
+    
+    async def _heartbeat(self, job_id: str) -> None:
+        """Job çalıştığı sürece updated_at'i yenile (diğer process'ler stale saymasın)"""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self.store.heartbeat(job_id, self.owner)
+            except Exception:
+                self.store_errors += 1
+    
+    async def _worker(self) -> None:
+        """Kuyruktan job alıp GenerationService ile üret"""
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception:
+                # Store hatası worker task'ını öldürmez; job stale olunca yeniden kuyruğa alınır
+                self.store_errors += 1
+            finally:
+                self._queue.task_done()
+    
+    async def _run(self, job_id: str) -> None:
+        """Job'u sahiplen, üret ve sonucu yaz"""
+        job = await self.store.claim(job_id, self.owner)
+        if job is None:
+            # Başka bir worker/process almış, bitmiş ya da silinmiş
+            return
+        project_info = ProjectInfo(**job["project_info"])
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            result = await generation_service.generate(project_info)
+            fields = {
+                "status": JobStatus.SUCCEEDED,
+                "result": {
+                    "markdown": result.markdown,
+                    "json_data": generation_service.build_json_data(
+                        project_info,
+                        result.markdown,
+                        result.cache_hit,
+                        match_distance=result.match_distance,
+                        sections=result.sections,
+                        ai_provider=result.ai_provider,
+                        match_type=result.match_type
+                    )
+                }
+            }
+        except asyncio.TimeoutError:
+            fields = {"status": JobStatus.FAILED, "error": "Ruleset generation timed out"}
+        except Exception as e:
+            fields = {"status": JobStatus.FAILED, "error": f"Ruleset generation failed: {str(e)}"}
+        finally:
+            heartbeat.cancel()
+        
+        # Heartbeat kesilip job başka bir worker'a geçtiyse sonucu onun yazmasına bırak
+        if not await self.store.finish(job_id, self.owner, **fields):
+            self.lost += 1
+        self._notify(job_id)
+        await self.store.purge_expired(self.result_ttl)
+
+def _create_store() -> JobStore:
+    """Ayarlara göre job store seç"""
+    backend_name = settings.JOB_STORE_BACKEND.lower()
+    
+    if backend_name == "memory":
+        return MemoryJobStore()
+    elif backend_name == "sqlite":
+        return SQLiteJobStore(settings.JOB_STORE_PATH)
+    else:
+        raise ValueError(f"Desteklenmeyen job store backend: {backend_name}")
+
+# Global job queue instance
+job_queue = JobQueue(
+    _create_store(),
+    workers=settings.JOB_WORKERS,
+    max_size=settings.JOB_QUEUE_MAX_SIZE,
+    result_ttl=settings.JOB_RESULT_TTL,
+    heartbeat_interval=settings.JOB_HEARTBEAT_INTERVAL,
+    stale_after=settings.JOB_STALE_AFTER
+)
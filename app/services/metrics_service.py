@@ -0,0 +1,189 @@
+"""
+Prometheus text formatında hafif metrik kaydı (harici bağımlılık yok)
+"""
+import bisect
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Metric:
+    """Tüm metrik tipleri için ortak alanlar"""
+    
+    metric_type = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+    
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        """(suffix, label string, value) üçlüleri"""
+        return iter(())
+    
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+class Counter(Metric):
+    """Yalnızca artan sayaç"""
+    
+    metric_type = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+    
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+    
+    def samples(self):
+        for labels, value in self._values.items():
+            yield "", _format_labels(self.labelnames, labels), value
+
+class Gauge(Metric):
+    """Artıp azalabilen değer"""
+    
+    metric_type = "gauge"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+    
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+    
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+    
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+    
+    @contextmanager
+    def track(self, *labels: str):
+        """Blok süresince gauge'u bir artır"""
+        self.inc(*labels)
+        try:
+            yield
+        finally:
+            self.dec(*labels)
+    
+    def samples(self):
+        for labels, value in self._values.items():
+            yield "", _format_labels(self.labelnames, labels), value
+
+class CallbackMetric(Metric):
+    """Değeri render anında bir fonksiyondan okunan metrik (ör. cache istatistikleri)"""
+    
+    def __init__(self, name: str, documentation: str, callback: Callable[[], float], metric_type: str = "gauge"):
+        super().__init__(name, documentation)
+        self.callback = callback
+        self.metric_type = metric_type
+    
+    def samples(self):
+        try:
+            yield "", "", self.callback()
+        except Exception:
+            return
+
+class Histogram(Metric):
+    """Sabit bucket'lı gecikme histogramı"""
+    
+    metric_type = "histogram"
+    
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[LabelValues, List] = {}
+    
+    def observe(self, value: float, *labels: str) -> None:
+        state = self._values.get(labels)
+        if state is None:
+            state = self._values[labels] = [[0] * len(self.buckets), 0.0, 0]
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            state[0][index] += 1
+        state[1] += value
+        state[2] += 1
+    
+    @contextmanager
+    def time(self, *labels: str):
+        """Blok süresini saniye cinsinden gözlemle"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+    
+    def samples(self):
+        names = self.labelnames + ("le",)
+        for labels, (counts, total, count) in self._values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield "_bucket", _format_labels(names, labels + (_format_value(float(bound)),)), cumulative
+            yield "_bucket", _format_labels(names, labels + ("+Inf",)), count
+            yield "_sum", _format_labels(self.labelnames, labels), total
+            yield "_count", _format_labels(self.labelnames, labels), count
+
+class MetricsRegistry:
+    """Kayıtlı metrikleri Prometheus text formatında render eder"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+    
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+    
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+# Global metrics registry ve uygulama metrikleri
+registry = MetricsRegistry()
+
+http_requests_total = registry.register(Counter(
+    "http_requests_total", "HTTP istek sayısı", ("route", "method", "status")
+))
+http_request_duration_seconds = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP istek süresi", ("route", "method")
+))
+generation_stage_duration_seconds = registry.register(Histogram(
+    "generation_stage_duration_seconds", "Üretim aşaması süresi (prompt_build, provider_call, serialization, json_encode)", ("stage",)
+))
+provider_requests_total = registry.register(Counter(
+    "provider_requests_total", "Upstream provider çağrı sayısı", ("provider", "outcome")
+))
+provider_errors_total = registry.register(Counter(
+    "provider_errors_total", "Tipine göre upstream provider hataları", ("provider", "error_type")
+))
+provider_retries_total = registry.register(Counter(
+    "provider_retries_total", "Aynı provider'da yapılan tekrar denemeler", ("provider", "error_type")
+))
+provider_hedges_total = registry.register(Counter(
+    "provider_hedges_total", "Hedge istekleri (fired, hedge_won, primary_won)", ("provider", "outcome")
+))
+generations_in_flight = registry.register(Gauge(
+    "generations_in_flight", "Devam eden upstream üretim sayısı", ("mode",)
+))
@@ -0,0 +1,117 @@
+"""
+Ollama provider implementation
+"""
+import json
+import httpx
+from typing import Dict, Any, AsyncIterator, Optional
+from app.services.ai_provider import AIProvider, classify_error
+from app.services.retry_policy import RetryPolicy
+from app.core.config import settings
+
+class OllamaProvider(AIProvider):
+    """Yerel Ollama sunucusu için provider"""
+    
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(
+            max_concurrency=settings.OLLAMA_MAX_CONCURRENCY,
+            retry_policy=RetryPolicy(max_retries=settings.OLLAMA_MAX_RETRIES, hedge=settings.OLLAMA_HEDGE)
+        )
+        # Tüm istekler keep-alive bağlantı havuzunu paylaşır
+        self.client = client or httpx.AsyncClient(
+            base_url=settings.OLLAMA_BASE_URL,
+            timeout=httpx.Timeout(settings.OLLAMA_TIMEOUT, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=settings.OLLAMA_MAX_CONCURRENCY,
+                max_keepalive_connections=settings.OLLAMA_MAX_CONCURRENCY,
+                keepalive_expiry=300
+            )
+        )
+    
+    def _payload(self, prompt: str, stream: bool, max_tokens: Optional[int]) -> Dict[str, Any]:
+        payload = {
+            "model": settings.OLLAMA_MODEL,
+            "prompt": prompt,
+            "stream": stream,
+            "keep_alive": settings.OLLAMA_KEEP_ALIVE
+        }
+        if max_tokens:
+            payload["options"] = {"num_predict": max_tokens}
+        return payload
+    
+    async def generate_content(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+        """Ollama ile içerik üret"""
+        try:
+            async with self.concurrency_limit:
+                response = await self.client.post("/api/generate", json=self._payload(prompt, False, max_tokens))
+            response.raise_for_status()
+            return response.json()["response"]
+        except Exception as e:
+            raise classify_error(e, f"Ollama API hatası: {str(e)}") from e
+    
+    async def generate_content_stream(self, prompt: str, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        """Ollama ile içeriği parça parça üret"""
+        try:
+            async with self.concurrency_limit:
+                async with self.client.stream("POST", "/api/generate", json=self._payload(prompt, True, max_tokens)) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if not line:
+                            continue
+                        data = json.loads(line)
+                        if data.get("error"):
+                            raise Exception(data["error"])
+                        if data.get("response"):
+                            yield data["response"]
+                        if data.get("done"):
+                            break
+        except Exception as e:
+            raise classify_error(e, f"Ollama API hatası: {str(e)}") from e
+    
+    async def warm_up(self) -> None:
+        """Modeli belleğe yükle (boş prompt yalnızca modeli yükler)"""
+        if not settings.OLLAMA_WARMUP:
+            return
+        
+        response = await self.client.post(
+            "/api/generate",
+            json={"model": settings.OLLAMA_MODEL, "keep_alive": settings.OLLAMA_KEEP_ALIVE}
+        )
+        response.raise_for_status()
+    
+    async def close(self) -> None:
+        """Bağlantı havuzunu kapat"""
+        await self.client.aclose()
+    
+    async def check_health(self, deep: bool = False) -> Dict[str, Any]:
+        """Ollama sağlık kontrolü"""
+        try:
+            if deep:
+                # Üretim yerine ucuz model listesi çağrısı
+                response = await self.client.get("/api/tags")
+                response.raise_for_status()
+                models = [model.get("name", "") for model in response.json().get("models", [])]
+                if not any(name.split(":")[0] == settings.OLLAMA_MODEL.split(":")[0] for name in models):
+                    return {
+                        "available": False,
+                        "error": f"Model bulunamadı: {settings.OLLAMA_MODEL}"
+                    }
+            
+            return {
+                "available": True,
+                "model": settings.OLLAMA_MODEL,
+                "status": "healthy",
+                "deep": deep
+            }
+        except Exception as e:
+            return {
+                "available": False,
+                "error": str(e)
+            }
+    
+    @property
+    def model_name(self) -> str:
+        return settings.OLLAMA_MODEL
+    
+    @property
+    def provider_name(self) -> str:
+        return "ollama"
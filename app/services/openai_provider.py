@@ -2,53 +2,80 @@
 OpenAI provider implementation
 """
 import openai
-from typing import Dict, Any
-from app.services.ai_provider import AIProvider
+from typing import Dict, Any, AsyncIterator, Optional
+from app.services.ai_provider import AIProvider, ProviderFatal, classify_error
+from app.services.retry_policy import RetryPolicy
 from app.core.config import settings
 
 class OpenAIProvider(AIProvider):
     """OpenAI provider"""
     
     def __init__(self):
+        super().__init__(
+            max_concurrency=settings.OPENAI_MAX_CONCURRENCY,
+            retry_policy=RetryPolicy(max_retries=settings.OPENAI_MAX_RETRIES, hedge=settings.OPENAI_HEDGE)
+        )
+        self.client = None
         if settings.OPENAI_API_KEY:
-            openai.api_key = settings.OPENAI_API_KEY
+            # Async client tek bir bağlantı havuzunu tüm isteklerle paylaşır;
+            # retry'ler SDK'da değil AIService'te (RetryPolicy) yapılır
+            self.client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY, max_retries=0)
         
-    async def generate_content(self, prompt: str) -> str:
+    async def generate_content(self, prompt: str, max_tokens: Optional[int] = None) -> str:
         """OpenAI ile içerik üret"""
-        if not settings.OPENAI_API_KEY:
-            raise Exception("OpenAI API key bulunamadı")
+        if not self.client:
+            raise ProviderFatal("OpenAI API key bulunamadı")
         
         try:
-            response = openai.ChatCompletion.create(
-                model=settings.OPENAI_MODEL,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=4000,
-                temperature=0.7
-            )
+            async with self.concurrency_limit:
+                response = await self.client.chat.completions.create(
+                    model=settings.OPENAI_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=max_tokens or 4000,
+                    temperature=0.7
+                )
             return response.choices[0].message.content
         except Exception as e:
-            raise Exception(f"OpenAI API hatası: {str(e)}")
+            raise classify_error(e, f"OpenAI API hatası: {str(e)}") from e
     
-    async def check_health(self) -> Dict[str, Any]:
+    async def generate_content_stream(self, prompt: str, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        """OpenAI ile içeriği parça parça üret"""
+        if not self.client:
+            raise ProviderFatal("OpenAI API key bulunamadı")
+        
+        try:
+            async with self.concurrency_limit:
+                stream = await self.client.chat.completions.create(
+                    model=settings.OPENAI_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=max_tokens or 4000,
+                    temperature=0.7,
+                    stream=True
+                )
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise classify_error(e, f"OpenAI API hatası: {str(e)}") from e
+    
+    async def check_health(self, deep: bool = False) -> Dict[str, Any]:
         """OpenAI sağlık kontrolü"""
         try:
-            if not settings.OPENAI_API_KEY:
+            if not self.client:
                 return {
                     "available": False,
                     "error": "API key eksik"
                 }
             
-            # Basit bir test prompt'u gönder
-            response = openai.ChatCompletion.create(
-                model=settings.OPENAI_MODEL,
-                messages=[{"role": "user", "content": "Test"}],
-                max_tokens=10
-            )
+            if deep:
+                # Üretim yerine ucuz model metadata çağrısı
+                await self.client.models.retrieve(settings.OPENAI_MODEL)
             
             return {
                 "available": True,
                 "model": settings.OPENAI_MODEL,
-                "status": "healthy"
+                "status": "healthy",
+                "deep": deep
             }
         except Exception as e:
             return {
@@ -56,6 +83,14 @@ class OpenAIProvider(AIProvider):
                 "error": str(e)
             }
     
+    @property
+    def is_configured(self) -> bool:
+        return self.client is not None
+    
     @property
     def provider_name(self) -> str:
         return "openai"
+    
+    @property
+    def model_name(self) -> str:
+        return settings.OPENAI_MODEL
@@ -0,0 +1,193 @@
+"""
+Katalog kombinasyonları için ruleset cache'i ve üretim geçmişini önceden doldurma
+
+Sonuçlar sunucuya üretim geçmişi üzerinden taşınır: CLI sunucuyla aynı HISTORY_PATH'i
+(sqlite backend) kullanmalı ve sunucu prewarm bittikten sonra yeniden başlatılmalıdır.
+Cache açılışta geçmişten doldurulur (HISTORY_REHYDRATE); varsayılan memory cache
+backend'inde CLI'nin doldurduğu cache süreç bitince kaybolur. Atlama kontrolü tercih
+edilen provider/model'in anahtarına bakar; başka provider ile üretilmiş kayıtlar sayılmaz.
+"""
+import asyncio
+import itertools
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from app.models.schemas import ProjectInfo
+from app.services.cache_service import ruleset_cache
+from app.services.catalog_service import PROJECT_CATEGORIES
+from app.services.generation_service import generation_service
+from app.services.history_service import history_recorder
+from app.services.rate_limit_service import MemoryRateLimitBackend
+from app.services.token_budget import TokenBudget
+from app.core.config import settings
+
+_frontend = PROJECT_CATEGORIES["frontend_options"]
+_backend = PROJECT_CATEGORIES["backend_options"]
+_fullstack = PROJECT_CATEGORIES["fullstack_options"]
+_common = PROJECT_CATEGORIES["common_options"]
+
+# /project-categories listelerinin ProjectInfo alanlarına karşılığı (mobile'ın şablonu olmadığı için dahil değil)
+CATALOG_FIELDS: Dict[str, Dict[str, List[str]]] = {
+    "frontend": {
+        "project_type": _common["project_types"],
+        "frontend_framework": _frontend["frameworks"],
+        "styling_approach": _frontend["styling_approaches"],
+        "state_management": _frontend["state_management"],
+        "http_client": _frontend["http_clients"],
+        "ui_library": _frontend["ui_libraries"],
+        "build_tool": _frontend["build_tools"],
+        "testing_framework": _frontend["testing_frameworks"],
+        "deployment_platform": _common["deployment_platforms"],
+        "code_style": _common["code_styles"]
+    },
+    "backend": {
+        "project_type": _common["project_types"],
+        "backend_language": _backend["languages"],
+        "backend_framework": _backend["frameworks"],
+        "database_type": _backend["databases"],
+        "auth_method": _backend["auth_methods"],
+        "api_style": _backend["api_styles"],
+        "orm_tool": _backend["orm_tools"],
+        "deployment_platform": _common["deployment_platforms"],
+        "code_style": _common["code_styles"]
+    },
+    "fullstack": {
+        "project_type": _common["project_types"],
+        "frontend_framework": _fullstack["frameworks"],
+        "backend_language": _backend["languages"],
+        "backend_framework": _backend["frameworks"],
+        "database_type": _fullstack["databases"],
+        "auth_method": _backend["auth_methods"],
+        "deployment_platform": _fullstack["deployment_platforms"],
+        "code_style": _common["code_styles"]
+    }
+}
+
+# Varsayılan alt küme: kategori başına en çok seçilen iki alanın kombinasyonları
+DEFAULT_VARY: Dict[str, Sequence[str]] = {
+    "frontend": ("frontend_framework", "styling_approach"),
+    "backend": ("backend_framework", "database_type"),
+    "fullstack": ("frontend_framework", "database_type")
+}
+DEFAULT_PROJECT_TYPES: Dict[str, str] = {
+    "frontend": "Web Application",
+    "backend": "API/Microservice",
+    "fullstack": "Web Application"
+}
+
+def enumerate_specs(
+    categories: Sequence[str],
+    vary: Optional[Sequence[str]] = None,
+    fixed: Optional[Dict[str, Any]] = None,
+    limit: Optional[int] = None
+) -> List[ProjectInfo]:
+    """Kategori başına vary alanlarının katalog değerlerini kartezyen çarpımla sabit sırada say"""
+    fixed = fixed or {}
+    specs: List[ProjectInfo] = []
+    for category in categories:
+        if category not in CATALOG_FIELDS:
+            raise ValueError(f"Desteklenmeyen kategori: {category}")
+        options = CATALOG_FIELDS[category]
+        # Kategoride karşılığı olmayan ya da sabitlenmiş alanlar atlanır
+        fields = [field for field in (vary or DEFAULT_VARY[category]) if field in options and field not in fixed]
+        base = {"project_category": category, "project_type": DEFAULT_PROJECT_TYPES[category], **fixed}
+        for values in itertools.product(*(options[field] for field in fields)):
+            specs.append(ProjectInfo(**{**base, **dict(zip(fields, values))}))
+            if limit is not None and len(specs) >= limit:
+                return specs
+    return specs
+
+class PrewarmRunner:
+    """Spec'leri rate bütçesi altında eşzamanlı üretir; geçmişte olanları atlayarak kaldığı yerden devam eder"""
+    
+    def __init__(
+        self,
+        concurrency: int = 4,
+        rate_per_minute: float = 30,
+        burst: int = 1,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        progress_interval: float = 5.0
+    ):
+        self.concurrency = max(1, concurrency)
+        self.rate = max(rate_per_minute, 1e-3) / 60
+        self.burst = max(1, burst)
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self._bucket = MemoryRateLimitBackend(max_clients=1)
+        self.total = 0
+        self.generated = 0
+        self.skipped = 0
+        self.failed = 0
+        self.errors: List[str] = []
+        self._started = 0.0
+    
+    async def is_done(self, project_info: ProjectInfo, cache_key: str) -> bool:
+        """Spec (cache_key: tercih edilen provider/model) cache'te ya da TTL içinde geçmişte varsa tekrar üretilmez"""
+        if await ruleset_cache.backend.get(cache_key) is not None:
+            return True
+        entries = await history_recorder.store.list(1, spec_hash=cache_key)
+        return bool(entries) and entries[0]["created_at"] >= time.time() - settings.RULESET_CACHE_TTL
+    
+    async def _acquire(self) -> None:
+        """Rate bütçesinden bir üretim hakkı al"""
+        while True:
+            wait = await self._bucket.consume("prewarm", self.rate, self.burst, 1)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+    
+    async def _process(self, project_info: ProjectInfo) -> None:
+        cache_key = generation_service.spec_key(TokenBudget.apply(project_info, enforce=False))
+        if await self.is_done(project_info, cache_key):
+            self.skipped += 1
+            return
+        await self._acquire()
+        try:
+            result = await generation_service.generate(project_info)
+        except Exception as e:
+            self.failed += 1
+            if len(self.errors) < 10:
+                self.errors.append(f"{project_info.project_category}/{cache_key[:12]}: {type(e).__name__}: {str(e)}")
+            return
+        if result.cache_hit:
+            self.skipped += 1
+        else:
+            self.generated += 1
+    
+    async def _report(self) -> None:
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            self.progress(self.stats())
+    
+    async def run(self, specs: Sequence[ProjectInfo]) -> Dict[str, Any]:
+        """Tüm spec'leri işle, son istatistikleri döndür"""
+        self.total = len(specs)
+        self._started = time.monotonic()
+        pending: Iterator[ProjectInfo] = iter(specs)
+        
+        async def worker() -> None:
+            for project_info in pending:
+                await self._process(project_info)
+        
+        reporter = asyncio.create_task(self._report()) if self.progress else None
+        try:
+            await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+        return self.stats()
+    
+    def stats(self) -> Dict[str, Any]:
+        """İlerleme ve throughput"""
+        elapsed = time.monotonic() - self._started if self._started else 0.0
+        done = self.generated + self.skipped + self.failed
+        return {
+            "total": self.total,
+            "done": done,
+            "generated": self.generated,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "elapsed_s": round(elapsed, 1),
+            "generated_per_minute": round(self.generated / elapsed * 60, 1) if elapsed else 0.0,
+            "eta_s": round(elapsed / done * (self.total - done), 1) if done else None,
+            "errors": list(self.errors)
+        }
@@ -1,121 +1,195 @@
 """
 Ruleset prompt generation service
 """
+import hashlib
+import operator
+import string
+from functools import lru_cache
+from typing import Dict, Any, Callable, List, NamedTuple, Tuple
 from app.models.schemas import ProjectInfo
+from app.core.config import settings
 
-class PromptService:
-    """Prompt üretimi için service"""
-    
-    @staticmethod
-    def generate_ruleset_prompt(project_info: ProjectInfo) -> str:
-        """Proje bilgilerine göre ruleset prompt'u üret"""
-        
-        # Temel bilgiler
-        base_info = f"""
+# Prompt'ta boş alanlar için kullanılan varsayılan değerler
+FIELD_DEFAULTS: Dict[str, str] = {
+    "frontend_framework": "Not specified",
+    "styling_approach": "Standard CSS",
+    "state_management": "Component state",
+    "http_client": "Fetch API",
+    "ui_library": "None",
+    "build_tool": "Standard bundler",
+    "testing_framework": "Not specified",
+    "backend_language": "Not specified",
+    "backend_framework": "Not specified",
+    "database_type": "Not specified",
+    "auth_method": "Basic auth",
+    "api_style": "REST",
+    "orm_tool": "Native queries",
+    "code_style": "Standard conventions",
+    "deployment_platform": "Not specified",
+    "notes": "None"
+}
+
+# Temel bilgiler
+BASE_TEMPLATE = """
 Create a comprehensive project ruleset for an AI coding assistant (like Copilot, Cursor, or ChatGPT). 
 This ruleset should serve as context for generating high-quality, consistent code.
 
-PROJECT CATEGORY: {project_info.project_category.upper()}
-PROJECT TYPE: {project_info.project_type}
+PROJECT CATEGORY: {project_category}
+PROJECT TYPE: {project_type}
 """
 
-        # Kategori-özel bilgiler
-        if project_info.project_category == "frontend":
-            tech_details = f"""
+# Kategori-özel bilgiler
+FRONTEND_TECH_TEMPLATE = """
 FRONTEND TECHNOLOGY STACK:
-- Framework: {project_info.frontend_framework or 'Not specified'}
-- Styling Approach: {project_info.styling_approach or 'Standard CSS'}
-- State Management: {project_info.state_management or 'Component state'}
-- HTTP Client: {project_info.http_client or 'Fetch API'}
-- UI Library: {project_info.ui_library or 'None'}
-- Build Tool: {project_info.build_tool or 'Standard bundler'}
-- Testing Framework: {project_info.testing_framework or 'Not specified'}
-"""
-            
-            specific_sections = """
-Generate a detailed markdown ruleset that includes:
-
-1. **Agent Role Definition** - Frontend developer persona for AI assistants
-2. **Technology Stack** - Specific frontend technologies and their usage patterns
-3. **Component Architecture** - Component structure, atomic design, file organization
-4. **Styling Guidelines** - CSS/SCSS/Styled-components best practices
-5. **State Management** - How to handle local and global state
-6. **API Integration** - HTTP client usage, data fetching patterns
-7. **Performance Optimization** - Bundle size, lazy loading, memoization
-8. **Accessibility Standards** - A11Y guidelines and semantic HTML
-9. **Testing Strategy** - Unit, integration, and E2E testing approaches
-10. **Code Organization** - File structure, naming conventions
-11. **Development Workflow** - Git workflow, PR guidelines, code review
-12. **Build and Deployment** - Bundling, optimization, deployment strategies
+- Framework: {frontend_framework}
+- Styling Approach: {styling_approach}
+- State Management: {state_management}
+- HTTP Client: {http_client}
+- UI Library: {ui_library}
+- Build Tool: {build_tool}
+- Testing Framework: {testing_framework}
 """
 
-        elif project_info.project_category == "backend":
-            tech_details = f"""
+
+BACKEND_TECH_TEMPLATE = """
 BACKEND TECHNOLOGY STACK:
-- Language: {project_info.backend_language or 'Not specified'}
-- Framework: {project_info.backend_framework or 'Not specified'}
-- Database: {project_info.database_type or 'Not specified'}
-- Authentication: {project_info.auth_method or 'Basic auth'}
-- API Style: {project_info.api_style or 'REST'}
-- ORM/Database Tool: {project_info.orm_tool or 'Native queries'}
-"""
-            
-            specific_sections = """
-Generate a detailed markdown ruleset that includes:
-
-1. **Agent Role Definition** - Backend developer persona for AI assistants
-2. **Technology Stack** - Specific backend technologies and frameworks
-3. **API Design Principles** - RESTful/GraphQL design patterns
-4. **Database Design** - Schema design, migrations, queries
-5. **Authentication & Authorization** - Security patterns and implementations
-6. **Error Handling** - Exception management and error responses
-7. **Testing Strategy** - Unit, integration, and API testing
-8. **Performance & Optimization** - Caching, indexing, query optimization
-9. **Security Guidelines** - Input validation, SQL injection prevention
-10. **Code Architecture** - Clean architecture, SOLID principles
-11. **Documentation Standards** - API documentation, code comments
-12. **Deployment & DevOps** - Containerization, CI/CD, monitoring
+- Language: {backend_language}
+- Framework: {backend_framework}
+- Database: {database_type}
+- Authentication: {auth_method}
+- API Style: {api_style}
+- ORM/Database Tool: {orm_tool}
 """
 
-        else:  # fullstack
-            tech_details = f"""
+
+FULLSTACK_TECH_TEMPLATE = """
 FULLSTACK TECHNOLOGY STACK:
-- Frontend Framework: {project_info.frontend_framework or 'Not specified'}
-- Backend Language: {project_info.backend_language or 'Not specified'}
-- Backend Framework: {project_info.backend_framework or 'Not specified'}
-- Database: {project_info.database_type or 'Not specified'}
-- Authentication: {project_info.auth_method or 'Basic auth'}
+- Frontend Framework: {frontend_framework}
+- Backend Language: {backend_language}
+- Backend Framework: {backend_framework}
+- Database: {database_type}
+- Authentication: {auth_method}
 """
-            
-            specific_sections = """
-Generate a detailed markdown ruleset that includes:
-
-1. **Agent Role Definition** - Full-stack developer persona for AI assistants
-2. **Technology Stack** - Complete frontend and backend technologies
-3. **Project Architecture** - Monorepo vs separate repos, folder structure
-4. **API Design** - Backend API design and frontend integration
-5. **Database Design** - Schema design and frontend data handling
-6. **Authentication Flow** - End-to-end auth implementation
-7. **State Management** - Frontend state with backend synchronization
-8. **Testing Strategy** - Full-stack testing approach
-9. **Performance** - Both frontend and backend optimization
-10. **Security** - Comprehensive security measures
-11. **Development Workflow** - Full-stack development practices
-12. **Deployment** - Complete application deployment strategy
+
+
+class SectionSpec(NamedTuple):
+    """Ruleset bölümü ve bölüm prompt'una girecek alanlar"""
+    title: str
+    description: str
+    fields: Tuple[str, ...]  # Bölümün bağımlı olduğu alanlar; section cache'i bu alanlara göre paylaşılır
+
+FRONTEND_STACK = ("frontend_framework", "styling_approach", "state_management", "http_client", "ui_library", "build_tool", "testing_framework")
+BACKEND_STACK = ("backend_language", "backend_framework", "database_type", "auth_method", "api_style", "orm_tool")
+FULLSTACK_STACK = ("frontend_framework", "backend_language", "backend_framework", "database_type", "auth_method")
+
+SECTION_SPECS: Dict[str, List[SectionSpec]] = {
+    "frontend": [
+        SectionSpec("Agent Role Definition", "Frontend developer persona for AI assistants", ("project_type", "frontend_framework")),
+        SectionSpec("Technology Stack", "Specific frontend technologies and their usage patterns", ("project_type",) + FRONTEND_STACK),
+        SectionSpec("Component Architecture", "Component structure, atomic design, file organization", ("frontend_framework", "ui_library", "code_style")),
+        SectionSpec("Styling Guidelines", "CSS/SCSS/Styled-components best practices", ("frontend_framework", "styling_approach", "ui_library")),
+        SectionSpec("State Management", "How to handle local and global state", ("frontend_framework", "state_management")),
+        SectionSpec("API Integration", "HTTP client usage, data fetching patterns", ("frontend_framework", "http_client", "state_management")),
+        SectionSpec("Performance Optimization", "Bundle size, lazy loading, memoization", ("frontend_framework", "build_tool")),
+        SectionSpec("Accessibility Standards", "A11Y guidelines and semantic HTML", ("frontend_framework", "ui_library")),
+        SectionSpec("Testing Strategy", "Unit, integration, and E2E testing approaches", ("frontend_framework", "testing_framework", "testing_requirement")),
+        SectionSpec("Code Organization", "File structure, naming conventions", ("frontend_framework", "build_tool", "code_style")),
+        SectionSpec("Development Workflow", "Git workflow, PR guidelines, code review", ("code_style", "testing_requirement")),
+        SectionSpec("Build and Deployment", "Bundling, optimization, deployment strategies", ("frontend_framework", "build_tool", "deployment_platform"))
+    ],
+    "backend": [
+        SectionSpec("Agent Role Definition", "Backend developer persona for AI assistants", ("project_type", "backend_language", "backend_framework")),
+        SectionSpec("Technology Stack", "Specific backend technologies and frameworks", ("project_type",) + BACKEND_STACK),
+        SectionSpec("API Design Principles", "RESTful/GraphQL design patterns", ("backend_language", "backend_framework", "api_style")),
+        SectionSpec("Database Design", "Schema design, migrations, queries", ("backend_language", "database_type", "orm_tool")),
+        SectionSpec("Authentication & Authorization", "Security patterns and implementations", ("backend_language", "backend_framework", "auth_method")),
+        SectionSpec("Error Handling", "Exception management and error responses", ("backend_language", "backend_framework", "api_style")),
+        SectionSpec("Testing Strategy", "Unit, integration, and API testing", ("backend_language", "backend_framework", "database_type", "testing_requirement")),
+        SectionSpec("Performance & Optimization", "Caching, indexing, query optimization", ("backend_framework", "database_type", "orm_tool")),
+        SectionSpec("Security Guidelines", "Input validation, SQL injection prevention", ("backend_language", "backend_framework", "database_type", "auth_method")),
+        SectionSpec("Code Architecture", "Clean architecture, SOLID principles", ("backend_language", "backend_framework", "code_style")),
+        SectionSpec("Documentation Standards", "API documentation, code comments", ("backend_language", "api_style", "code_style")),
+        SectionSpec("Deployment & DevOps", "Containerization, CI/CD, monitoring", ("backend_language", "database_type", "deployment_platform"))
+    ],
+    "fullstack": [
+        SectionSpec("Agent Role Definition", "Full-stack developer persona for AI assistants", ("project_type", "frontend_framework", "backend_framework")),
+        SectionSpec("Technology Stack", "Complete frontend and backend technologies", ("project_type",) + FULLSTACK_STACK),
+        SectionSpec("Project Architecture", "Monorepo vs separate repos, folder structure", ("frontend_framework", "backend_language", "backend_framework")),
+        SectionSpec("API Design", "Backend API design and frontend integration", ("frontend_framework", "backend_framework")),
+        SectionSpec("Database Design", "Schema design and frontend data handling", ("backend_framework", "database_type")),
+        SectionSpec("Authentication Flow", "End-to-end auth implementation", ("frontend_framework", "backend_framework", "auth_method")),
+        SectionSpec("State Management", "Frontend state with backend synchronization", ("frontend_framework", "backend_framework")),
+        SectionSpec("Testing Strategy", "Full-stack testing approach", ("frontend_framework", "backend_framework", "testing_requirement")),
+        SectionSpec("Performance", "Both frontend and backend optimization", ("frontend_framework", "backend_framework", "database_type")),
+        SectionSpec("Security", "Comprehensive security measures", ("backend_framework", "database_type", "auth_method")),
+        SectionSpec("Development Workflow", "Full-stack development practices", ("code_style", "testing_requirement")),
+        SectionSpec("Deployment", "Complete application deployment strategy", ("frontend_framework", "backend_language", "deployment_platform"))
+    ]
+}
+
+def _sections_template(template_name: str) -> str:
+    """Tek parça prompt için numaralı bölüm listesi"""
+    lines = [
+        f"{number}. **{section.title}** - {section.description}"
+        for number, section in enumerate(SECTION_SPECS[template_name], 1)
+    ]
+    return "\nGenerate a detailed markdown ruleset that includes:\n\n" + "\n".join(lines) + "\n"
+
+FRONTEND_SECTIONS = _sections_template("frontend")
+BACKEND_SECTIONS = _sections_template("backend")
+FULLSTACK_SECTIONS = _sections_template("fullstack")
+
+# Bölüm prompt'larında stack bağlamı satır etiketleri
+FIELD_LABELS: Dict[str, str] = {
+    "project_type": "Project Type",
+    "frontend_framework": "Frontend Framework",
+    "styling_approach": "Styling Approach",
+    "state_management": "State Management",
+    "http_client": "HTTP Client",
+    "ui_library": "UI Library",
+    "build_tool": "Build Tool",
+    "testing_framework": "Testing Framework",
+    "backend_language": "Backend Language",
+    "backend_framework": "Backend Framework",
+    "database_type": "Database",
+    "auth_method": "Authentication",
+    "api_style": "API Style",
+    "orm_tool": "ORM/Database Tool",
+    "code_style": "Code Style",
+    "testing_requirement": "Testing Required",
+    "deployment_platform": "Deployment Platform"
+}
+
+# Bölüm bazlı üretimde her bölüm için ayrı, küçük prompt
+SECTION_TEMPLATE = """
+You are writing one section of a project ruleset for an AI coding assistant (like Copilot, Cursor, or ChatGPT).
+The other sections are written separately, so stay strictly within this section's scope.
+
+PROJECT CATEGORY: {project_category}
+STACK CONTEXT:
+{stack_context}
+
+Write section {number}: **{title}** - {description}
+
+IMPORTANT FORMATTING REQUIREMENTS:
+1. Start with the header "## {number}. {title}" and do not add a document title, introduction or conclusion
+2. Use proper markdown formatting with lists and code blocks
+3. Make rules actionable and specific to the stack above, not generic
+4. Provide concrete examples of good vs bad practices where relevant
 """
 
-        # Ortak gereksinimler
-        common_requirements = f"""
+# Ortak gereksinimler
+COMMON_TEMPLATE = """
 ADDITIONAL REQUIREMENTS:
-- Code Style: {project_info.code_style or 'Standard conventions'}
-- Testing Required: {'Yes' if project_info.testing_requirement else 'No'}
-- Deployment Platform: {project_info.deployment_platform or 'Not specified'}
-- Additional Requirements: {', '.join(project_info.additional_requirements) if project_info.additional_requirements else 'None'}
-- Notes: {project_info.notes or 'None'}
+- Code Style: {code_style}
+- Testing Required: {testing_requirement}
+- Deployment Platform: {deployment_platform}
+- Additional Requirements: {additional_requirements}
+- Notes: {notes}
 """
 
-        # Çıktı formatı
-        output_format = """
+# Çıktı formatı
+OUTPUT_FORMAT = """
 IMPORTANT FORMATTING REQUIREMENTS:
 1. Use proper markdown formatting with headers, lists, and code blocks
 2. Include specific code examples where relevant
@@ -128,4 +202,150 @@ IMPORTANT FORMATTING REQUIREMENTS:
 Format the output as a comprehensive markdown document that can be directly used as context for AI coding assistants.
 """
 
-        return base_info + tech_details + specific_sections + common_requirements + output_format
+# Varsayılan değer yerine özel dönüşüm uygulanan slot'lar
+SLOT_TRANSFORMS: Dict[str, Callable[[Any], str]] = {
+    "project_category": lambda value: value.upper(),
+    "project_type": lambda value: value,
+    "testing_requirement": lambda value: 'Yes' if value else 'No',
+    "additional_requirements": lambda value: ', '.join(value) if value else 'None'
+}
+
+class CompiledTemplate:
+    """Statik segmentler + slot adlarına önceden ayrıştırılmış prompt şablonu"""
+    
+    def __init__(self, *parts: str):
+        self.segments: List[str] = []
+        self.slots: List[str] = []
+        pending = ""
+        for literal, slot, _, _ in string.Formatter().parse("".join(parts)):
+            pending += literal
+            if slot is not None:
+                self.segments.append(pending)
+                self.slots.append(slot)
+                pending = ""
+        self.segments.append(pending)
+        self._getter = operator.attrgetter(*self.slots)
+        self._rules = [(SLOT_TRANSFORMS.get(slot), FIELD_DEFAULTS.get(slot)) for slot in self.slots]
+    
+    def slot_values(self, project_info: ProjectInfo) -> Tuple[str, ...]:
+        """ProjectInfo'dan slot değerlerini sırayla oku"""
+        return tuple([
+            transform(value) if transform else (value or default)
+            for value, (transform, default) in zip(self._getter(project_info), self._rules)
+        ])
+    
+    def render(self, values: Tuple[str, ...]) -> str:
+        """Slot değerlerini statik segmentlerle birleştir"""
+        parts = [self.segments[0]]
+        for value, segment in zip(values, self.segments[1:]):
+            parts.append(value)
+            parts.append(segment)
+        return "".join(parts)
+
+# Kategori başına bir kez derlenen şablonlar
+TEMPLATES: Dict[str, CompiledTemplate] = {
+    "frontend": CompiledTemplate(BASE_TEMPLATE, FRONTEND_TECH_TEMPLATE, FRONTEND_SECTIONS, COMMON_TEMPLATE, OUTPUT_FORMAT),
+    "backend": CompiledTemplate(BASE_TEMPLATE, BACKEND_TECH_TEMPLATE, BACKEND_SECTIONS, COMMON_TEMPLATE, OUTPUT_FORMAT),
+    "fullstack": CompiledTemplate(BASE_TEMPLATE, FULLSTACK_TECH_TEMPLATE, FULLSTACK_SECTIONS, COMMON_TEMPLATE, OUTPUT_FORMAT)
+}
+
+# Şablon metni değiştiğinde fingerprint'lerin de değişmesi için
+TEMPLATE_VERSION = hashlib.sha256(
+    "\x00".join("\x01".join(t.segments) for t in TEMPLATES.values()).encode("utf-8")
+).hexdigest()[:12]
+
+@lru_cache(maxsize=settings.PROMPT_CACHE_SIZE)
+def _render(template_name: str, values: Tuple[str, ...]) -> str:
+    """Tam prompt'u slot değerleri üzerinden memoize ederek üret"""
+    return TEMPLATES[template_name].render(values)
+
+class PromptService:
+    """Prompt üretimi için service"""
+    
+    # Prompt'ta boş alanlar için kullanılan varsayılan değerler
+    FIELD_DEFAULTS: Dict[str, str] = FIELD_DEFAULTS
+    
+    @staticmethod
+    def normalize_project_info(project_info: ProjectInfo) -> Dict[str, Any]:
+        """Cache/dedup anahtarları için ProjectInfo'yu canonical hale getir"""
+        def clean(value, default: str = "") -> str:
+            value = (value or "").strip()
+            return (value or default).casefold()
+        
+        normalized: Dict[str, Any] = {
+            "project_category": clean(project_info.project_category),
+            "project_type": clean(project_info.project_type),
+            "testing_requirement": bool(project_info.testing_requirement),
+            "additional_requirements": sorted(
+                clean(item) for item in (project_info.additional_requirements or []) if clean(item)
+            )
+        }
+        for field, default in PromptService.FIELD_DEFAULTS.items():
+            normalized[field] = clean(getattr(project_info, field), default)
+        
+        return normalized
+    
+    @staticmethod
+    def template_name(project_info: ProjectInfo) -> str:
+        """ProjectInfo için kullanılacak şablon (kategori eşleşmezse fullstack)"""
+        if project_info.project_category == "frontend":
+            return "frontend"
+        elif project_info.project_category == "backend":
+            return "backend"
+        return "fullstack"
+    
+    @staticmethod
+    def _slot_values(project_info: ProjectInfo) -> Tuple[str, Tuple[str, ...]]:
+        template_name = PromptService.template_name(project_info)
+        return template_name, TEMPLATES[template_name].slot_values(project_info)
+    
+    @staticmethod
+    def generate_ruleset_prompt(project_info: ProjectInfo) -> str:
+        """Proje bilgilerine göre ruleset prompt'u üret"""
+        return _render(*PromptService._slot_values(project_info))
+    
+    @staticmethod
+    def prompt_fingerprint(project_info: ProjectInfo) -> str:
+        """Prompt'u render etmeden, prompt'u birebir belirleyen girdilerin kararlı hash'i"""
+        template_name, values = PromptService._slot_values(project_info)
+        payload = "\x1f".join((TEMPLATE_VERSION, template_name) + values)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def _field_value(project_info: ProjectInfo, field: str) -> str:
+        """Alanın prompt'a yazılacak değeri (tek parça şablonla aynı dönüşüm ve varsayılanlar)"""
+        value = getattr(project_info, field)
+        transform = SLOT_TRANSFORMS.get(field)
+        return transform(value) if transform else (value or FIELD_DEFAULTS.get(field, ""))
+    
+    @staticmethod
+    def section_prompts(project_info: ProjectInfo) -> List[Tuple[str, str]]:
+        """Bölüm bazlı üretim için (başlık, prompt) listesi; prompt yalnızca bölümün alanlarını içerir"""
+        value = PromptService._field_value
+        shared = []
+        if project_info.additional_requirements:
+            shared.append(f"- Additional Requirements: {value(project_info, 'additional_requirements')}")
+        if project_info.notes:
+            shared.append(f"- Notes: {project_info.notes}")
+        
+        prompts = []
+        for number, section in enumerate(SECTION_SPECS[PromptService.template_name(project_info)], 1):
+            context = [f"- {FIELD_LABELS[field]}: {value(project_info, field)}" for field in section.fields]
+            prompts.append((section.title, SECTION_TEMPLATE.format(
+                project_category=value(project_info, "project_category"),
+                stack_context="\n".join(context + shared),
+                number=number,
+                title=section.title,
+                description=section.description
+            )))
+        return prompts
+    
+    @staticmethod
+    def ruleset_title(project_info: ProjectInfo) -> str:
+        """Bölümlerden birleştirilen ruleset'in başlığı"""
+        return f"# Project Ruleset: {project_info.project_type}"
+    
+    @staticmethod
+    def assemble_sections(project_info: ProjectInfo, sections: List[str]) -> str:
+        """Bölüm çıktılarını sırasıyla tek markdown dokümanında birleştir"""
+        return "\n\n".join([PromptService.ruleset_title(project_info)] + [section.strip() for section in sections])
@@ -0,0 +1,113 @@
+"""
+Provider başına gecikme/hata istatistikleri ve circuit breaker
+"""
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+class ProviderStats:
+    """EWMA gecikme ve hata oranı ile circuit breaker durumu"""
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(
+        self,
+        alpha: float,
+        failure_threshold: int,
+        cooldown: float,
+        window: int = 256,
+        failure_latency: float = 90.0
+    ):
+        self.alpha = alpha
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        # Hiç başarılı çağrısı olmayan provider'ın skorunda kullanılan gecikme (provider timeout'u)
+        self.failure_latency = failure_latency
+        self.ewma_latency: Optional[float] = None
+        # Yüzdelik (ör. hedge için p95) hesabında kullanılan son gecikmeler
+        self.latencies: deque = deque(maxlen=max(1, window))
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+    
+    def is_available(self) -> bool:
+        """Circuit açık değilse veya cooldown dolduysa routing'e dahil et"""
+        return self.state != self.OPEN or time.monotonic() - self.opened_at >= self.cooldown
+    
+    def allow_request(self) -> bool:
+        """Circuit durumuna göre isteğe izin ver (half-open'da tek probe)"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.cooldown:
+                return False
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+        return True
+    
+    def record_success(self, latency: float) -> None:
+        """Başarılı çağrıyı kaydet"""
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.error_rate = (1 - self.alpha) * self.error_rate
+        self.latencies.append(latency)
+        self._update_latency(latency)
+        self.state = self.CLOSED
+        self._probe_in_flight = False
+    
+    def record_failure(self, latency: Optional[float] = None) -> None:
+        """Başarısız çağrıyı kaydet (süresi EWMA'ya girer), gerekirse circuit'i aç"""
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.error_rate = self.alpha + (1 - self.alpha) * self.error_rate
+        if latency is not None:
+            self._update_latency(latency)
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+        self._probe_in_flight = False
+    
+    def _update_latency(self, latency: float) -> None:
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency = self.alpha * latency + (1 - self.alpha) * self.ewma_latency
+    
+    def release(self) -> None:
+        """Sonuçsuz biten (ör. iptal edilen) probe'u serbest bırak"""
+        self._probe_in_flight = False
+    
+    def latency_quantile(self, quantile: float, min_samples: int = 1) -> Optional[float]:
+        """Son başarılı çağrıların gecikme yüzdeliği; yeterli örnek yoksa None"""
+        if len(self.latencies) < max(1, min_samples):
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+    
+    def score(self) -> float:
+        """Routing skoru - düşük olan tercih edilir"""
+        if self.requests == 0:
+            # Hiç denenmemiş provider önce denenir
+            return 0.0
+        if self.failures == self.requests:
+            # Yalnızca hata almış provider hızlı hata verse de timeout kadar yavaş sayılır
+            return self.failure_latency * (1 + 4 * self.error_rate)
+        return self.ewma_latency * (1 + 4 * self.error_rate)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Health yanıtı için istatistikler"""
+        return {
+            "state": self.state,
+            "requests": self.requests,
+            "failures": self.failures,
+            "error_rate": round(self.error_rate, 4),
+            "ewma_latency_ms": round(self.ewma_latency * 1000, 1) if self.ewma_latency is not None else None
+        }
@@ -0,0 +1,249 @@
+"""
+İstemci başına rate limiting (token bucket) ve global admission control
+"""
+import asyncio
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Iterable, List, Optional
+from fastapi import Request
+from app.core.config import settings
+
+class RateLimitExceeded(Exception):
+    """İstemcinin token bucket'ı boş"""
+    
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limit exceeded, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+class OverCapacityError(Exception):
+    """Eşzamanlı üretim sınırı dolu"""
+    pass
+
+class RateLimitBackend(ABC):
+    """Token bucket backend'leri için base class"""
+    
+    @abstractmethod
+    async def consume(self, key: str, rate: float, capacity: float, cost: float) -> float:
+        """cost kadar token harca; başarılıysa 0, değilse beklenmesi gereken saniyeyi döndür"""
+        pass
+
+def _refill(tokens: float, updated_at: float, now: float, rate: float, capacity: float) -> float:
+    return min(capacity, tokens + max(0.0, now - updated_at) * rate)
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Süreç içi bucket'lar (worker başına ayrı limit), en eski istemciler LRU ile silinir"""
+    
+    def __init__(self, max_clients: int):
+        self.max_clients = max(1, max_clients)
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+    
+    async def consume(self, key: str, rate: float, capacity: float, cost: float) -> float:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [capacity, now]
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        
+        tokens = _refill(bucket[0], bucket[1], now, rate, capacity)
+        bucket[1] = now
+        if tokens >= cost:
+            bucket[0] = tokens - cost
+            return 0.0
+        bucket[0] = tokens
+        return (cost - tokens) / rate
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """Aynı makinedeki worker'lar arasında paylaşılan bucket'lar"""
+    
+    def __init__(self, path: str, max_clients: int):
+        self.path = path
+        self.max_clients = max(1, max_clients)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rate_limits_updated ON rate_limits (updated_at)"
+        )
+    
+    def _consume(self, key: str, rate: float, capacity: float, cost: float) -> float:
+        # Duvar saati: farklı süreçlerin monotonic saatleri karşılaştırılamaz
+        now = time.time()
+        with self._lock:
+            # Okuma-yazma tek yazma kilidi altında; diğer worker'lar araya giremez
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at FROM rate_limits WHERE key = ?", (key,)
+                ).fetchone()
+                tokens = capacity if row is None else _refill(row[0], row[1], now, rate, capacity)
+                wait = 0.0 if tokens >= cost else (cost - tokens) / rate
+                if not wait:
+                    tokens -= cost
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rate_limits (key, tokens, updated_at) VALUES (?, ?, ?)",
+                    (key, tokens, now)
+                )
+                if row is None:
+                    # Dolu bucket'a dönmüş eski istemcileri temizle
+                    self._conn.execute(
+                        "DELETE FROM rate_limits WHERE updated_at < ?", (now - capacity / rate,)
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return wait
+    
+    async def consume(self, key: str, rate: float, capacity: float, cost: float) -> float:
+        return await asyncio.to_thread(self._consume, key, rate, capacity, cost)
+
+def _hash_key(client_key: str) -> str:
+    return hashlib.sha256(client_key.encode("utf-8")).hexdigest()[:32]
+
+class RateLimiter:
+    """Tanımlı istemci anahtarı (header) veya IP başına token bucket"""
+    
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        per_minute: float,
+        burst: int,
+        enabled: bool = True,
+        key_header: str = "X-Client-Key",
+        trust_forwarded: bool = False,
+        client_keys: Iterable[str] = ()
+    ):
+        self.backend = backend
+        self.rate = max(per_minute, 1e-6) / 60
+        self.capacity = max(1, burst)
+        self.enabled = enabled
+        self.key_header = key_header
+        self.trust_forwarded = trust_forwarded
+        # Yalnızca bu anahtarlar ayrı bucket alır; bilinmeyen değerler IP'ye düşer (header
+        # her istekte değiştirilerek limit aşılamaz)
+        self.client_keys = frozenset(_hash_key(key) for key in client_keys if key)
+        self.allowed = 0
+        self.rejected = 0
+    
+    def client_key(self, request: Request) -> str:
+        """Tanımlı istemci anahtarı varsa onu (hash'lenmiş), yoksa IP adresini kullan"""
+        client_key = request.headers.get(self.key_header) if self.key_header else None
+        if client_key:
+            hashed = _hash_key(client_key)
+            if hashed in self.client_keys:
+                return "key:" + hashed
+        
+        forwarded = request.headers.get("x-forwarded-for") if self.trust_forwarded else None
+        if forwarded:
+            return "ip:" + forwarded.split(",")[0].strip()
+        return "ip:" + (request.client.host if request.client else "unknown")
+    
+    def max_cost(self) -> Optional[int]:
+        """Tek istekte harcanabilecek en fazla token (burst); limit kapalıysa None"""
+        return self.capacity if self.enabled else None
+    
+    async def check(self, request: Request, cost: int = 1) -> None:
+        """cost kadar token harca, bucket yetmiyorsa RateLimitExceeded fırlat"""
+        if not self.enabled:
+            return
+        cost = max(1, cost)
+        # Burst'ten büyük istek hiçbir zaman karşılanamaz; çağıran önceden reddetmeli (bkz. max_cost)
+        if cost > self.capacity:
+            raise ValueError(f"Rate limit cost {cost} exceeds burst {self.capacity}")
+        wait = await self.backend.consume(self.client_key(request), self.rate, self.capacity, cost)
+        if wait:
+            self.rejected += 1
+            raise RateLimitExceeded(wait)
+        self.allowed += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Rate limit istatistikleri"""
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "per_minute": round(self.rate * 60, 3),
+            "burst": self.capacity,
+            "allowed": self.allowed,
+            "rejected": self.rejected
+        }
+
+class AdmissionController:
+    """Eşzamanlı upstream üretimlerini sınırla - dolu ise kuyruğa almak yerine hemen reddet"""
+    
+    def __init__(self, max_in_flight: int):
+        self.max_in_flight = max(1, max_in_flight)
+        self.in_flight = 0
+        self.rejected = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self._semaphore
+    
+    def has_capacity(self) -> bool:
+        """Bekleyen yoksa ve boş slot varsa True"""
+        return not self.semaphore.locked()
+    
+    @asynccontextmanager
+    async def slot(self, wait: bool = False):
+        """Üretim süresince bir slot tut; wait=False ve dolu ise OverCapacityError"""
+        if not wait and not self.has_capacity():
+            self.rejected += 1
+            raise OverCapacityError(f"{self.max_in_flight} generations already in flight")
+        # Boş slot varsa acquire askıya almadan döner; wait=True ise sıraya girer
+        async with self.semaphore:
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Admission istatistikleri"""
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "rejected": self.rejected
+        }
+
+def retry_after_header(seconds: float) -> Dict[str, str]:
+    """Retry-After tam saniye olmalı; en az 1"""
+    return {"Retry-After": str(max(1, math.ceil(seconds)))}
+
+def _create_backend() -> RateLimitBackend:
+    """Ayarlara göre backend seç"""
+    backend_name = settings.RATE_LIMIT_BACKEND.lower()
+    
+    if backend_name == "memory":
+        return MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_CLIENTS)
+    elif backend_name == "sqlite":
+        return SQLiteRateLimitBackend(settings.RATE_LIMIT_PATH, settings.RATE_LIMIT_MAX_CLIENTS)
+    else:
+        raise ValueError(f"Desteklenmeyen rate limit backend: {backend_name}")
+
+# Global rate limiter ve admission controller instance'ları
+rate_limiter = RateLimiter(
+    _create_backend(),
+    settings.RATE_LIMIT_PER_MINUTE,
+    settings.RATE_LIMIT_BURST,
+    enabled=settings.RATE_LIMIT_ENABLED,
+    key_header=settings.RATE_LIMIT_KEY_HEADER,
+    trust_forwarded=settings.RATE_LIMIT_TRUST_FORWARDED,
+    client_keys=[key.strip() for key in settings.RATE_LIMIT_CLIENT_KEYS.split(",")]
+)
+admission_controller = AdmissionController(settings.GENERATION_MAX_IN_FLIGHT)
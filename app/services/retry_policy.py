@@ -0,0 +1,47 @@
+"""
+Upstream çağrıları için retry (jitter'lı exponential backoff) ve hedge ayarları
+"""
+import random
+from typing import Optional
+from app.core.config import settings
+
+class RetryPolicy:
+    """Provider başına retry/hedge politikası"""
+    
+    def __init__(
+        self,
+        max_retries: Optional[int] = None,
+        hedge: Optional[bool] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+        retry_after_max: Optional[float] = None,
+        hedge_quantile: Optional[float] = None,
+        hedge_min_delay: Optional[float] = None,
+        hedge_min_samples: Optional[int] = None
+    ):
+        # Verilmeyen değerler PROVIDER_* ayarlarından gelir
+        self.max_retries = max(0, settings.PROVIDER_MAX_RETRIES if max_retries is None else max_retries)
+        self.hedge = settings.PROVIDER_HEDGE if hedge is None else hedge
+        self.backoff_base = settings.PROVIDER_BACKOFF_BASE if backoff_base is None else backoff_base
+        self.backoff_max = settings.PROVIDER_BACKOFF_MAX if backoff_max is None else backoff_max
+        self.retry_after_max = settings.PROVIDER_RETRY_AFTER_MAX if retry_after_max is None else retry_after_max
+        self.hedge_quantile = settings.PROVIDER_HEDGE_QUANTILE if hedge_quantile is None else hedge_quantile
+        self.hedge_min_delay = settings.PROVIDER_HEDGE_MIN_DELAY if hedge_min_delay is None else hedge_min_delay
+        self.hedge_min_samples = settings.PROVIDER_HEDGE_MIN_SAMPLES if hedge_min_samples is None else hedge_min_samples
+    
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """attempt. denemeden sonra beklenecek süre; None ise tekrar deneme (sıradaki provider'a geç)"""
+        if attempt > self.max_retries:
+            return None
+        # Retry-After çok uzunsa beklemek yerine failover daha hızlı
+        if retry_after is not None and retry_after > self.retry_after_max:
+            return None
+        # Full jitter: eşzamanlı istemciler aynı anda tekrar denemesin
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+        return max(delay, retry_after or 0.0)
+    
+    def hedge_delay(self, latency_quantile: Optional[float]) -> Optional[float]:
+        """İkinci denemenin gönderileceği gecikme; yeterli örnek yoksa None (hedge yok)"""
+        if not self.hedge or latency_quantile is None:
+            return None
+        return max(self.hedge_min_delay, latency_quantile)
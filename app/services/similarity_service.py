@@ -0,0 +1,181 @@
+"""
+Benzer ProjectInfo spec'leri için yakınlık indeksi (yalnızca önemsiz farklarla ayrışan istekler)
+"""
+import hashlib
+import heapq
+import re
+from collections import OrderedDict
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+from app.models.schemas import ProjectInfo
+from app.services.prompt_service import PromptService
+from app.core.config import settings
+
+# Aynı bucket'ta olmayan spec'ler hiçbir zaman eşleşmez (farklı stack farklı ruleset demektir).
+# Veritabanı, state/stil/UI kütüphanesi, API stili ve ORM ruleset'in içeriğini belirler; mesafeyle
+# tolere edilmez (PostgreSQL isteyen spec'e MongoDB ruleset'i dönmemeli)
+BLOCKING_FIELDS: Tuple[str, ...] = (
+    "project_category", "frontend_framework", "backend_language", "backend_framework",
+    "database_type", "state_management", "styling_approach", "ui_library", "api_style", "orm_tool"
+)
+
+# Yalnızca proje tipi ve küçük farklar mesafeye katılır; toplam ağırlığa bölünerek 0-1 aralığına normalize edilir
+FIELD_WEIGHTS: Dict[str, float] = {
+    "project_type": 1.0,
+    "http_client": 0.25,
+    "build_tool": 0.25,
+    "testing_framework": 0.25,
+    "auth_method": 0.25,
+    "code_style": 0.25,
+    "deployment_platform": 0.25,
+    "testing_requirement": 0.25
+}
+REQUIREMENTS_WEIGHT = 0.75
+NOTES_WEIGHT = 1.0
+TOTAL_WEIGHT = sum(FIELD_WEIGHTS.values()) + REQUIREMENTS_WEIGHT + NOTES_WEIGHT
+
+# "None", "n/a", "-", "Not specified" gibi değerler aynı boş değere indirgenir
+EMPTY_VALUES = {"", "none", "no", "na", "n/a", "null", "nil", "-", "notspecified", "notapplicable"}
+_PUNCTUATION = re.compile(r"[^0-9a-z+#]+")
+_WORDS = re.compile(r"[0-9a-z+#]+")
+
+class Features(NamedTuple):
+    """Bir spec'in karşılaştırmada kullanılan özellikleri"""
+    block: Tuple[str, ...]
+    fields: Tuple[str, ...]
+    requirements: FrozenSet[str]
+    notes: Tuple[int, ...]  # Bottom-k MinHash imzası
+
+class SimilarityMatch(NamedTuple):
+    """En yakın kayıt: ruleset cache anahtarı ve 0-1 arası mesafe"""
+    cache_key: str
+    distance: float
+
+def normalize_value(value) -> str:
+    """Büyük/küçük harf, boşluk ve noktalama farklarını ve boş değer eşanlamlılarını yok say"""
+    text = _PUNCTUATION.sub("", str(value).casefold())
+    return "" if text in EMPTY_VALUES else text
+
+def jaccard_distance(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+    """İki kümenin Jaccard mesafesi (ikisi de boşsa 0)"""
+    if not left and not right:
+        return 0.0
+    return 1.0 - len(left & right) / len(left | right)
+
+class SimilarityIndex:
+    """Üretilmiş spec'leri bucket'lara ayırıp ağırlıklı mesafeyle en yakınını bulan LRU indeks"""
+    
+    def __init__(self, max_entries: int = 5000, sketch_size: int = 64, shingle_size: int = 5):
+        self.max_entries = max(1, max_entries)
+        self.sketch_size = max(1, sketch_size)
+        self.shingle_size = max(1, shingle_size)
+        self._entries: "OrderedDict[str, Features]" = OrderedDict()
+        self._buckets: Dict[Tuple[str, ...], Dict[str, Features]] = {}
+        self.lookups = 0
+        self.matches = 0
+    
+    def sketch(self, text: str) -> Tuple[int, ...]:
+        """Notların karakter shingle'larından bottom-k MinHash imzası çıkar"""
+        text = " ".join(_WORDS.findall(text.casefold()))
+        if normalize_value(text) == "":
+            return ()
+        size = min(self.shingle_size, len(text))
+        shingles = {text[i:i + size] for i in range(len(text) - size + 1)}
+        hashes = (
+            int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+            for shingle in shingles
+        )
+        return tuple(heapq.nsmallest(self.sketch_size, hashes))
+    
+    def notes_distance(self, left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+        """İki imzanın birleşiminin en küçük k hash'i üzerinden Jaccard mesafesi tahmini"""
+        if not left and not right:
+            return 0.0
+        if not left or not right:
+            return 1.0
+        left_set, right_set = set(left), set(right)
+        union = heapq.nsmallest(self.sketch_size, left_set | right_set)
+        shared = sum(1 for value in union if value in left_set and value in right_set)
+        return 1.0 - shared / len(union)
+    
+    def features(self, project_info: ProjectInfo, scope: str) -> Features:
+        """Spec'i normalize edip özellik vektörüne dönüştür (scope: provider/model/bütçe)"""
+        normalized = PromptService.normalize_project_info(project_info)
+        return Features(
+            block=(scope,) + tuple(normalize_value(normalized[field]) for field in BLOCKING_FIELDS),
+            fields=tuple(normalize_value(normalized[field]) for field in FIELD_WEIGHTS),
+            requirements=frozenset(
+                value for value in (normalize_value(item) for item in normalized["additional_requirements"]) if value
+            ),
+            notes=self.sketch(project_info.notes or "")
+        )
+    
+    def distance(self, left: Features, right: Features, limit: float = 1.0) -> float:
+        """Ağırlıklı mesafe; limit aşılınca pahalı not karşılaştırması atlanır"""
+        total = sum(
+            weight for weight, a, b in zip(FIELD_WEIGHTS.values(), left.fields, right.fields) if a != b
+        )
+        total += REQUIREMENTS_WEIGHT * jaccard_distance(left.requirements, right.requirements)
+        if total / TOTAL_WEIGHT > limit:
+            return total / TOTAL_WEIGHT
+        total += NOTES_WEIGHT * self.notes_distance(left.notes, right.notes)
+        return total / TOTAL_WEIGHT
+    
+    def add(self, cache_key: str, project_info: ProjectInfo, scope: str) -> None:
+        """Cache'e yazılan spec'i indekse ekle (varsa LRU sırasını yenile)"""
+        if cache_key in self._entries:
+            self._entries.move_to_end(cache_key)
+            return
+        features = self.features(project_info, scope)
+        self._entries[cache_key] = features
+        self._buckets.setdefault(features.block, {})[cache_key] = features
+        while len(self._entries) > self.max_entries:
+            self.discard(next(iter(self._entries)))
+    
+    def discard(self, cache_key: str) -> None:
+        """Kaydı indeksten çıkar (ör. ruleset cache'ten düşmüşse)"""
+        features = self._entries.pop(cache_key, None)
+        if features is None:
+            return
+        bucket = self._buckets.get(features.block)
+        if bucket is not None:
+            bucket.pop(cache_key, None)
+            if not bucket:
+                del self._buckets[features.block]
+    
+    def find(self, project_info: ProjectInfo, scope: str, max_distance: float) -> Optional[SimilarityMatch]:
+        """Aynı bucket'taki en yakın kaydı max_distance içindeyse döndür"""
+        self.lookups += 1
+        features = self.features(project_info, scope)
+        best: Optional[SimilarityMatch] = None
+        for cache_key, candidate in self._buckets.get(features.block, {}).items():
+            limit = best.distance if best is not None else max_distance
+            distance = self.distance(features, candidate, limit)
+            if distance <= limit and (best is None or distance < best.distance):
+                best = SimilarityMatch(cache_key, distance)
+                if distance == 0.0:
+                    break
+        if best is not None:
+            self.matches += 1
+            self._entries.move_to_end(best.cache_key)
+        return best
+    
+    def clear(self) -> None:
+        """İndeksi temizle"""
+        self._entries.clear()
+        self._buckets.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """İndeks istatistikleri"""
+        return {
+            "entries": len(self._entries),
+            "buckets": len(self._buckets),
+            "lookups": self.lookups,
+            "matches": self.matches
+        }
+
+# Global similarity index instance
+similarity_index = SimilarityIndex(
+    max_entries=settings.SIMILARITY_MAX_ENTRIES,
+    sketch_size=settings.SIMILARITY_SKETCH_SIZE,
+    shingle_size=settings.SIMILARITY_SHINGLE_SIZE
+)
@@ -0,0 +1,85 @@
+"""
+Token bütçesi: prompt boyutu tahmini, kategori başına çıktı limiti ve girdi kırpma
+"""
+import math
+from typing import Any, Dict, List
+from app.models.schemas import ProjectInfo
+from app.core.config import settings
+
+class TokenBudgetExceeded(Exception):
+    """İstek token bütçesini aştığında (reject modunda) fırlatılır"""
+    pass
+
+class TokenBudget:
+    """Prompt/yanıt boyutunu kategori ve istek seçeneklerine göre sınırlar"""
+    
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Tokenizer olmadan yaklaşık token sayısı (karakter / CHARS_PER_TOKEN)"""
+        if not text:
+            return 0
+        return math.ceil(len(text) / settings.TOKEN_CHARS_PER_TOKEN)
+    
+    @staticmethod
+    def max_output_tokens(project_info: ProjectInfo) -> int:
+        """Kategori varsayılanı veya istekteki max_output_tokens (üst limitle sınırlı)"""
+        category_budgets = {
+            "frontend": settings.TOKEN_BUDGET_FRONTEND,
+            "backend": settings.TOKEN_BUDGET_BACKEND
+        }
+        budget = category_budgets.get(project_info.project_category, settings.TOKEN_BUDGET_FULLSTACK)
+        if project_info.max_output_tokens:
+            budget = project_info.max_output_tokens
+        return max(1, min(budget, settings.TOKEN_BUDGET_MAX_OUTPUT))
+    
+    @staticmethod
+    def section_max_output_tokens(project_info: ProjectInfo, section_count: int) -> int:
+        """Bölüm başına çıktı limiti: toplam bütçenin eşit payı (SECTION_MIN_OUTPUT_TOKENS altına inmez)"""
+        share = math.ceil(TokenBudget.max_output_tokens(project_info) / max(1, section_count))
+        return max(share, settings.SECTION_MIN_OUTPUT_TOKENS)
+    
+    @staticmethod
+    def apply(project_info: ProjectInfo, enforce: bool = True) -> ProjectInfo:
+        """notes ve additional_requirements'ı limitlere göre kırp ya da (enforce ve reject modunda) reddet"""
+        reject = enforce and settings.TOKEN_BUDGET_OVERFLOW.lower() == "reject"
+        violations: List[str] = []
+        updates: Dict[str, Any] = {}
+        
+        notes = project_info.notes
+        if notes and len(notes) > settings.NOTES_MAX_CHARS:
+            violations.append(f"notes exceeds {settings.NOTES_MAX_CHARS} characters")
+            updates["notes"] = notes[:settings.NOTES_MAX_CHARS]
+        
+        requirements = project_info.additional_requirements or []
+        limited = [item[:settings.REQUIREMENT_MAX_CHARS] for item in requirements[:settings.REQUIREMENTS_MAX_ITEMS]]
+        if len(requirements) > settings.REQUIREMENTS_MAX_ITEMS:
+            violations.append(f"additional_requirements exceeds {settings.REQUIREMENTS_MAX_ITEMS} items")
+        if any(len(item) > settings.REQUIREMENT_MAX_CHARS for item in requirements):
+            violations.append(f"an additional requirement exceeds {settings.REQUIREMENT_MAX_CHARS} characters")
+        if limited != requirements:
+            updates["additional_requirements"] = limited
+        
+        if violations and reject:
+            raise TokenBudgetExceeded("; ".join(violations))
+        
+        return project_info.model_copy(update=updates) if updates else project_info
+    
+    @staticmethod
+    def check_prompt(prompt: str) -> int:
+        """Prompt'un tahmini token sayısını döndür, limit aşılırsa reddet"""
+        prompt_tokens = TokenBudget.estimate_tokens(prompt)
+        if prompt_tokens > settings.TOKEN_BUDGET_MAX_PROMPT:
+            raise TokenBudgetExceeded(
+                f"Prompt is ~{prompt_tokens} tokens, limit is {settings.TOKEN_BUDGET_MAX_PROMPT}"
+            )
+        return prompt_tokens
+    
+    @staticmethod
+    def usage(prompt: str, completion: str, max_output_tokens: int) -> Dict[str, Any]:
+        """json_data için token kullanım raporu"""
+        return {
+            "prompt_tokens": TokenBudget.estimate_tokens(prompt),
+            "completion_tokens": TokenBudget.estimate_tokens(completion),
+            "max_output_tokens": max_output_tokens,
+            "estimated": True
+        }
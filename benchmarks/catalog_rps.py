@@ -0,0 +1,89 @@
+"""
+Katalog endpoint'leri için önce/sonra RPS karşılaştırması
+
+"before": her istekte katalogu yeniden kuran, Pydantic ile doğrulayıp
+JSONResponse ile serialize eden eski handler'ların birebir kopyası.
+"after": önceden serialize edilmiş bytes + ETag (uygulamadaki gerçek router).
+İki taraf da middleware'siz boş FastAPI uygulamalarına bağlanır; böylece yalnızca
+handler farkı ölçülür. Ölçüm ağ olmadan, süreç içi ASGI üzerinden yapılır.
+
+Kullanım:
+    python benchmarks/catalog_rps.py --requests 3000 --concurrency 16
+"""
+import argparse
+import asyncio
+import copy
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+warnings.simplefilter("ignore")
+
+import httpx
+from fastapi import FastAPI
+from app.models.schemas import ProjectTypesResponse, FrameworksResponse
+from app.routers.main import router
+from app.services.catalog_service import PROJECT_TYPES, FRAMEWORKS, PROJECT_CATEGORIES
+
+PATHS = ["/project-types", "/frameworks", "/project-categories"]
+
+def build_legacy_app() -> FastAPI:
+    """Katalogu her istekte yeniden kuran eski davranış"""
+    legacy = FastAPI()
+    
+    @legacy.get("/project-types", response_model=ProjectTypesResponse)
+    async def get_project_types():
+        return ProjectTypesResponse(project_types=list(PROJECT_TYPES))
+    
+    @legacy.get("/frameworks", response_model=FrameworksResponse)
+    async def get_frameworks():
+        return FrameworksResponse(frameworks=copy.deepcopy(FRAMEWORKS))
+    
+    @legacy.get("/project-categories")
+    async def get_project_categories():
+        return copy.deepcopy(PROJECT_CATEGORIES)
+    
+    return legacy
+
+def build_current_app() -> FastAPI:
+    """Uygulamanın gerçek router'ı, main.app'teki middleware'ler (CORS, sıkıştırma, metrik) olmadan"""
+    current = FastAPI()
+    current.include_router(router)
+    return current
+
+async def run(app: FastAPI, path: str, total: int, concurrency: int, headers: dict) -> float:
+    """path'e total istek at ve RPS döndür"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        remaining = iter(range(total))
+        
+        async def worker():
+            for _ in remaining:
+                response = await client.get(path, headers=headers)
+                assert response.status_code in (200, 304)
+        
+        await client.get(path)  # ısınma
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return total / (time.perf_counter() - started)
+
+async def main():
+    parser = argparse.ArgumentParser(description="Katalog endpoint RPS karşılaştırması")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    
+    legacy_app, current_app = build_legacy_app(), build_current_app()
+    print(f"{'path':<22} {'before':>10} {'after':>10} {'after/304':>10} {'speedup':>8}")
+    for path in PATHS:
+        before = await run(legacy_app, path, args.requests, args.concurrency, {})
+        after = await run(current_app, path, args.requests, args.concurrency, {"accept-encoding": "identity"})
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=current_app), base_url="http://bench") as client:
+            etag = (await client.get(path)).headers["etag"]
+        revalidated = await run(current_app, path, args.requests, args.concurrency, {"if-none-match": etag})
+        print(f"{path:<22} {before:>10.0f} {after:>10.0f} {revalidated:>10.0f} {after / before:>7.2f}x")
+
+if __name__ == "__main__":
+    asyncio.run(main())
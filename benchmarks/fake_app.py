@@ -0,0 +1,28 @@
+"""
+Worker scaling benchmark'ı için sahte provider'lı uygulama (her worker kendi kopyasını kurar)
+
+    gunicorn benchmarks.fake_app:app -c gunicorn.conf.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Sahte provider çıktıları çalışma dizinindeki history.db / cache / jobs dosyalarına yazılmaz;
+# app modülleri ayarları import sırasında okuduğu için bu atamalar import'lardan önce yapılır
+for _name in ("HISTORY_BACKEND", "RULESET_CACHE_BACKEND", "JOB_STORE_BACKEND", "RATE_LIMIT_BACKEND"):
+    os.environ[_name] = "memory"
+os.environ["HISTORY_REHYDRATE"] = "false"
+
+from benchmarks.fake_provider import FakeProvider, install
+from app.services.rate_limit_service import admission_controller, rate_limiter
+from main import app
+
+install(FakeProvider(
+    latency_ms=float(os.getenv("FAKE_LATENCY_MS", "50")),
+    distribution=os.getenv("FAKE_LATENCY_DIST", "fixed"),
+    seed=os.getpid()
+))
+# Tüm yük tek istemciden gelir; sınırlar ölçümü bozmasın
+rate_limiter.enabled = False
+admission_controller.max_in_flight = 1_000_000
@@ -0,0 +1,134 @@
+"""
+Benchmark'lar için deterministik sahte AIProvider (ağ ve API anahtarı gerektirmez)
+
+Gecikme dağılımı, streaming parça hızı ve hata enjeksiyonu seed'li bir
+random.Random ile üretilir; aynı seed aynı örnek dizisini verir.
+"""
+import asyncio
+import math
+import random
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+from app.services.ai_provider import AIProvider, classify_error
+from app.services.ai_service import ai_service
+from app.services.provider_stats import ProviderStats
+from app.services.retry_policy import RetryPolicy
+from app.core.config import settings
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+class FakeProviderError(ConnectionError):
+    """Enjekte edilen upstream hatası"""
+    pass
+
+class FakeProvider(AIProvider):
+    """Ayarlanabilir gecikme/hata profiline sahip sahte provider"""
+    
+    def __init__(
+        self,
+        latency_ms: float = 200.0,
+        distribution: str = "lognormal",
+        spread: float = 0.5,
+        chunks: int = 20,
+        chunk_rate: float = 50.0,
+        error_rate: float = 0.0,
+        blocking_ms: float = 0.0,
+        decode_ms_per_token: float = 0.0,
+        seed: int = 42,
+        name: str = "fake",
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        super().__init__(max_concurrency=settings.AI_MAX_CONCURRENCY, retry_policy=retry_policy)
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Desteklenmeyen gecikme dağılımı: {distribution}")
+        self.latency_ms = latency_ms
+        self.distribution = distribution
+        self.spread = spread
+        self.chunks = max(1, chunks)
+        self.chunk_rate = chunk_rate
+        self.error_rate = error_rate
+        self.blocking_ms = blocking_ms
+        # Uzun çıktıların seri decode süresini max_tokens ile orantılı taklit eder
+        self.decode_ms_per_token = decode_ms_per_token
+        self.random = random.Random(seed)
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+    
+    def sample_latency(self) -> float:
+        """Dağılıma göre saniye cinsinden gecikme örnekle"""
+        if self.distribution == "fixed":
+            latency_ms = self.latency_ms
+        elif self.distribution == "uniform":
+            latency_ms = self.random.uniform(self.latency_ms * (1 - self.spread), self.latency_ms * (1 + self.spread))
+        else:
+            # latency_ms medyan, spread log-uzayındaki standart sapma
+            latency_ms = self.random.lognormvariate(math.log(max(self.latency_ms, 1e-3)), self.spread)
+        return max(latency_ms, 0.0) / 1000
+    
+    def _begin_call(self) -> float:
+        """Çağrıyı say, gerekirse hata enjekte et, gecikmeyi döndür"""
+        self.calls += 1
+        latency = self.sample_latency()
+        fail = self.random.random() < self.error_rate
+        if self.blocking_ms:
+            # Async handler içindeki bloklayan çağrı regresyonunu taklit eder
+            time.sleep(self.blocking_ms / 1000)
+        if fail:
+            self.errors += 1
+            raise FakeProviderError("Enjekte edilen upstream hatası")
+        return latency
+    
+    def decode_time(self, max_tokens: Optional[int]) -> float:
+        """max_tokens ile orantılı decode süresi (saniye)"""
+        return (max_tokens or 0) * self.decode_ms_per_token / 1000
+    
+    def _content(self, prompt: str) -> str:
+        return f"# Ruleset\n\n{len(prompt)} karakterlik prompt için sahte içerik.\n" + "- kural\n" * self.chunks
+    
+    async def generate_content(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+        try:
+            latency = self._begin_call()
+        except FakeProviderError as e:
+            raise classify_error(e, f"Fake API hatası: {str(e)}") from e
+        await asyncio.sleep(latency + self.decode_time(max_tokens))
+        return self._content(prompt)
+    
+    async def generate_content_stream(self, prompt: str, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        try:
+            latency = self._begin_call()
+        except FakeProviderError as e:
+            raise classify_error(e, f"Fake API hatası: {str(e)}") from e
+        # İlk parçaya kadar örneklenen gecikme, sonrasında sabit parça hızı
+        await asyncio.sleep(latency)
+        lines = self._content(prompt).splitlines(keepends=True)
+        interval = 1 / self.chunk_rate if self.chunk_rate > 0 else 0
+        interval = max(interval, self.decode_time(max_tokens) / len(lines))
+        for index, line in enumerate(lines):
+            if index and interval:
+                await asyncio.sleep(interval)
+            yield line
+    
+    async def check_health(self, deep: bool = False) -> Dict[str, Any]:
+        return {"available": True, "model": self.model_name, "deep": deep}
+    
+    @property
+    def provider_name(self) -> str:
+        return self.name
+    
+    @property
+    def model_name(self) -> str:
+        return f"fake-{self.distribution}"
+
+def install(provider: FakeProvider) -> FakeProvider:
+    """Global ai_service havuzunu yalnızca verilen sahte provider ile değiştir"""
+    ai_service._providers = [provider]
+    ai_service.stats = {
+        provider.provider_name: ProviderStats(
+            settings.PROVIDER_EWMA_ALPHA,
+            settings.PROVIDER_FAILURE_THRESHOLD,
+            settings.PROVIDER_COOLDOWN,
+            failure_latency=settings.PROVIDER_TIMEOUT
+        )
+    }
+    return provider
@@ -0,0 +1,89 @@
+"""
+Cold start import süresi raporu
+
+Her senaryo temiz bir Python sürecinde ölçülür:
+  - lazy:  yalnızca `import main` (provider SDK'ları yüklenmez)
+  - first: `import main` + seçili provider'ın ilk kullanımı
+  - eager: `import main` + registry'deki tüm provider'lar (eski davranış)
+
+Kullanım:
+    python benchmarks/import_time.py --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "lazy": "import main",
+    "first": (
+        "import main\n"
+        "from app.services.ai_service import ai_service\n"
+        "ai_service.initialize()"
+    ),
+    "eager": (
+        "import main\n"
+        "from app.services.ai_service import PROVIDER_REGISTRY, load_provider_class\n"
+        "for name in PROVIDER_REGISTRY: load_provider_class(name)"
+    )
+}
+
+TIMER = (
+    "import time, warnings\n"
+    "warnings.simplefilter('ignore')\n"
+    "started = time.perf_counter()\n"
+    "{code}\n"
+    "print((time.perf_counter() - started) * 1000)"
+)
+
+def measure(code: str) -> float:
+    """Kodu temiz bir süreçte çalıştır ve süreyi (ms) döndür"""
+    output = subprocess.run(
+        [sys.executable, "-c", TIMER.format(code=code)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout.strip().splitlines()[-1]
+    return float(output)
+
+def top_imports(code: str, limit: int) -> list:
+    """-X importtime çıktısından en pahalı modülleri getir"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # İç içe importlar ek girintiyle gelir; yalnızca doğrudan importları say
+        if not name.startswith("  "):
+            rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:limit]
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start import süresi raporu")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+    
+    print(f"{'scenario':<8} {'median ms':>10} {'min ms':>10} {'max ms':>10}")
+    for name, code in SCENARIOS.items():
+        samples = [measure(code) for _ in range(args.runs)]
+        print(f"{name:<8} {statistics.median(samples):>10.1f} {min(samples):>10.1f} {max(samples):>10.1f}")
+    
+    for name in ("lazy", "eager"):
+        print(f"\nEn pahalı top-level importlar ({name}):")
+        for cumulative, module in top_imports(SCENARIOS[name], args.top):
+            print(f"  {cumulative / 1000:>8.1f} ms  {module}")
+
+if __name__ == "__main__":
+    main()
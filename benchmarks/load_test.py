@@ -0,0 +1,220 @@
+"""
+Sahte LLM provider ile çevrimdışı yük testi
+
+Uygulama süreç içi ASGI üzerinden (ağ olmadan) çalıştırılır; AI provider
+havuzu benchmarks/fake_provider.py'deki deterministik FakeProvider ile
+değiştirilir. Her senaryo için RPS, p50/p95/p99 gecikme ve event loop
+gecikmesi raporlanır. Async handler içindeki bloklayan bir çağrı loop
+gecikmesinde ve düşen RPS'te doğrudan görünür (bkz. --blocking-ms).
+
+Kullanım:
+    python benchmarks/load_test.py --scenarios generate,catalog,health --requests 2000 --concurrency 64
+    python benchmarks/load_test.py --scenarios stream --latency-ms 300 --chunks 40 --chunk-rate 100
+    python benchmarks/load_test.py --scenarios generate --error-rate 0.05 --json
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+import warnings
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+warnings.simplefilter("ignore")
+
+# Sahte provider çıktıları çalışma dizinindeki history.db / cache / jobs dosyalarına yazılmaz;
+# app modülleri ayarları import sırasında okuduğu için bu atamalar import'lardan önce yapılır
+for _name in ("HISTORY_BACKEND", "RULESET_CACHE_BACKEND", "JOB_STORE_BACKEND", "RATE_LIMIT_BACKEND"):
+    os.environ[_name] = "memory"
+os.environ["HISTORY_REHYDRATE"] = "false"
+
+import httpx
+from benchmarks.fake_provider import FakeProvider, LATENCY_DISTRIBUTIONS, install
+from app.services.cache_service import ruleset_cache
+from app.services.rate_limit_service import admission_controller, rate_limiter
+from app.services.retry_policy import RetryPolicy
+from main import app, lifespan
+
+CATALOG_PATHS = ["/project-types", "/frameworks", "/project-categories"]
+
+def percentile(samples: List[float], q: float) -> float:
+    """Sıralı örneklerde nearest-rank yüzdelik"""
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, max(0, int(round(q / 100 * len(samples) + 0.5)) - 1))
+    return samples[index]
+
+def project_payload(scenario: str, index: int, distinct: int) -> Dict[str, Any]:
+    """distinct=0 ise her istek benzersiz (cache/coalescing devre dışı kalır); senaryolar cache paylaşmaz"""
+    key = index if distinct <= 0 else index % distinct
+    return {
+        "project_category": "fullstack",
+        "project_type": "web",
+        "frontend_framework": "react",
+        "backend_language": "typescript",
+        "backend_framework": "express",
+        "database_type": "postgresql",
+        "testing_requirement": True,
+        "notes": f"benchmark {scenario} spec {key}"
+    }
+
+class LoopLagMonitor:
+    """Event loop'un zamanında uyanıp uyanamadığını ölç"""
+    
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task = None
+    
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - started - self.interval))
+    
+    def start(self) -> None:
+        self.samples = []
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> List[float]:
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        return sorted(self.samples)
+
+def build_scenarios(args) -> Dict[str, Callable[[httpx.AsyncClient, int], Any]]:
+    """Senaryo adı -> tek isteği atan coroutine fabrikası"""
+    catalog_cycle = itertools.cycle(CATALOG_PATHS)
+    params = {"strategy": args.strategy} if args.strategy else None
+    
+    async def generate(client: httpx.AsyncClient, index: int) -> bool:
+        response = await client.post("/generate-ruleset", params=params, json=project_payload("generate", index, args.distinct))
+        return response.status_code == 200
+    
+    async def stream(client: httpx.AsyncClient, index: int) -> bool:
+        async with client.stream(
+            "POST", "/generate-ruleset/stream", params=params, json=project_payload("stream", index, args.distinct)
+        ) as response:
+            body = b"".join([chunk async for chunk in response.aiter_bytes()])
+        return response.status_code == 200 and b"event: error" not in body
+    
+    async def catalog(client: httpx.AsyncClient, index: int) -> bool:
+        response = await client.get(next(catalog_cycle))
+        return response.status_code == 200
+    
+    async def health(client: httpx.AsyncClient, index: int) -> bool:
+        response = await client.get("/health")
+        return response.status_code == 200
+    
+    return {"generate": generate, "stream": stream, "catalog": catalog, "health": health}
+
+async def run_scenario(name: str, request: Callable, total: int, concurrency: int) -> Dict[str, Any]:
+    """Senaryoyu total istekle, concurrency eşzamanlı istemciyle çalıştır"""
+    transport = httpx.ASGITransport(app=app)
+    latencies: List[float] = []
+    failures = 0
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        await request(client, -1)  # ısınma
+        counter = iter(range(total))
+        
+        async def worker():
+            nonlocal failures
+            for index in counter:
+                started = time.perf_counter()
+                try:
+                    ok = await request(client, index)
+                except Exception:
+                    ok = False
+                latencies.append(time.perf_counter() - started)
+                failures += not ok
+        
+        monitor = LoopLagMonitor()
+        monitor.start()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        lag = await monitor.stop()
+    
+    latencies.sort()
+    return {
+        "scenario": name,
+        "requests": total,
+        "errors": failures,
+        "rps": round(total / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "loop_lag_p99_ms": round(percentile(lag, 99) * 1000, 2),
+        "loop_lag_max_ms": round((lag[-1] if lag else 0.0) * 1000, 2)
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description="Sahte provider ile çevrimdışı yük testi")
+    parser.add_argument("--scenarios", default="generate,stream,catalog,health")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--distinct", type=int, default=0, help="Farklı spec sayısı (0: her istek benzersiz)")
+    parser.add_argument("--no-cache", action="store_true", help="Ruleset cache'i kapat")
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Provider gecikmesi (lognormal için medyan)")
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-spread", type=float, default=0.5)
+    parser.add_argument("--chunks", type=int, default=20, help="Streaming yanıttaki parça sayısı")
+    parser.add_argument("--chunk-rate", type=float, default=50.0, help="Saniyedeki streaming parça sayısı")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Enjekte edilen provider hata oranı (0-1)")
+    parser.add_argument("--blocking-ms", type=float, default=0.0, help="Her provider çağrısında bloklayan uyku (regresyon simülasyonu)")
+    parser.add_argument("--decode-ms-per-token", type=float, default=0.0, help="max_tokens ile orantılı sahte decode süresi")
+    parser.add_argument("--strategy", choices=["single", "sections"], default=None, help="Üretim stratejisi (varsayılan: GENERATION_STRATEGY)")
+    parser.add_argument("--max-retries", type=int, default=None, help="Provider retry sayısı (varsayılan: PROVIDER_MAX_RETRIES)")
+    parser.add_argument("--hedge", action="store_true", help="p95 sonrası hedge isteklerini aç")
+    parser.add_argument("--rate-limit", action="store_true", help="İstemci rate limit'ini açık bırak (tüm istekler tek istemciden gelir)")
+    parser.add_argument("--max-in-flight", type=int, default=0, help="Admission sınırı (0: concurrency kadar, 503 üretmez)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    args = parser.parse_args()
+    
+    provider = install(FakeProvider(
+        latency_ms=args.latency_ms,
+        distribution=args.latency_dist,
+        spread=args.latency_spread,
+        chunks=args.chunks,
+        chunk_rate=args.chunk_rate,
+        error_rate=args.error_rate,
+        blocking_ms=args.blocking_ms,
+        decode_ms_per_token=args.decode_ms_per_token,
+        seed=args.seed,
+        retry_policy=RetryPolicy(max_retries=args.max_retries, hedge=args.hedge or None)
+    ))
+    if args.no_cache:
+        ruleset_cache.enabled = False
+    rate_limiter.enabled = args.rate_limit
+    admission_controller.max_in_flight = args.max_in_flight or args.concurrency
+    
+    scenarios = build_scenarios(args)
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in names if name not in scenarios]
+    if unknown:
+        parser.error(f"Bilinmeyen senaryo: {', '.join(unknown)}")
+    
+    results = []
+    # Uygulama yaşam döngüsü (health monitor, job queue) gerçek sunucudaki gibi çalışır
+    async with lifespan(app):
+        for name in names:
+            results.append(await run_scenario(name, scenarios[name], args.requests, args.concurrency))
+    
+    if args.json:
+        print(json.dumps({"provider_calls": provider.calls, "results": results}, indent=2))
+        return
+    
+    columns = ["scenario", "requests", "errors", "rps", "p50_ms", "p95_ms", "p99_ms", "loop_lag_p99_ms", "loop_lag_max_ms"]
+    print(" ".join(f"{column:>15}" for column in columns))
+    for result in results:
+        print(" ".join(f"{result[column]:>15}" for column in columns))
+    print(f"provider calls: {provider.calls}, injected errors: {provider.errors}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,152 @@
+"""
+Worker sayısına göre throughput ölçümü (gerçek TCP, gunicorn + uvicorn worker'ları)
+
+Her worker sayısı için gunicorn.conf.py profiliyle sahte provider'lı uygulama
+(benchmarks/fake_app.py) başlatılır ve birden fazla yük üreteci süreç aynı anda
+istek atar. Yük üreteçleri de CPU kullandığından worker sayısı ile yük üreteci
+sayısının toplamı çekirdek sayısını aşınca ölçeklenme doğal olarak durur.
+
+Kullanım:
+    python benchmarks/worker_scaling.py --workers 1,2,4 --duration 10 --scenario generate
+    python benchmarks/worker_scaling.py --workers 1,2 --scenario catalog --clients 2 --concurrency 64
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+import warnings
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+warnings.simplefilter("ignore")
+
+import httpx
+
+SPEC_VARIANTS = 50
+
+def _request(scenario: str, index: int) -> Tuple[str, str, dict]:
+    """Senaryoya göre (method, path, json) üret"""
+    if scenario == "catalog":
+        return "GET", "/project-categories", None
+    if scenario == "health":
+        return "GET", "/health", None
+    # Spec'ler döngüsel: ısınmadan sonra çoğu istek cache'ten döner (CPU yolu ölçülür)
+    return "POST", "/generate-ruleset", {
+        "project_category": "backend",
+        "project_type": "API",
+        "backend_language": "python",
+        "backend_framework": "fastapi",
+        "notes": f"scaling spec {index % SPEC_VARIANTS}"
+    }
+
+async def _client_loop(base_url: str, scenario: str, duration: float, concurrency: int, offset: int) -> Tuple[int, int, List[float]]:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        async def worker(worker_id: int):
+            nonlocal errors
+            index = offset + worker_id
+            while time.perf_counter() < deadline:
+                method, path, body = _request(scenario, index)
+                index += concurrency
+                started = time.perf_counter()
+                try:
+                    response = await client.request(method, path, json=body, headers={"accept-encoding": "identity"})
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+        
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return len(latencies), errors, latencies
+
+def _run_client(args: Tuple[str, str, float, int, int]) -> Tuple[int, int, List[float]]:
+    """Ayrı süreçte çalışan yük üreteci"""
+    return asyncio.run(_client_loop(*args))
+
+def _wait_ready(base_url: str, timeout: float = 60) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health/live", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("Sunucu zamanında hazır olmadı")
+
+def measure(workers: int, args) -> Dict[str, float]:
+    """workers adet worker ile sunucuyu başlat, yük uygula, sonucu döndür"""
+    env = {
+        **os.environ,
+        "ENVIRONMENT": "production",
+        "WEB_CONCURRENCY": str(workers),
+        "PRELOAD_PROVIDERS": "false",
+        "FAKE_LATENCY_MS": str(args.latency_ms),
+        "PYTHONWARNINGS": "ignore"
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "benchmarks.fake_app:app", "-c", "gunicorn.conf.py",
+         "--bind", f"127.0.0.1:{args.port}", "--log-level", "warning"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        _wait_ready(base_url)
+        # Isınma: her worker'ın cache'i ve bağlantıları dolsun
+        _run_client((base_url, args.scenario, min(2.0, args.duration), args.concurrency, 0))
+        
+        jobs = [(base_url, args.scenario, args.duration, args.concurrency, i * args.concurrency) for i in range(args.clients)]
+        with multiprocessing.Pool(args.clients) as pool:
+            results = pool.map(_run_client, jobs)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    
+    total = sum(count for count, _, _ in results)
+    errors = sum(error for _, error, _ in results)
+    latencies = sorted(latency for _, _, samples in results for latency in samples)
+    
+    def percentile(q: float) -> float:
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000 if latencies else 0.0
+    
+    return {
+        "workers": workers,
+        "requests": total,
+        "errors": errors,
+        "rps": total / args.duration,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker sayısına göre throughput ölçeklenmesi")
+    parser.add_argument("--workers", default="1,2,4", help="Virgülle ayrılmış worker sayıları")
+    parser.add_argument("--scenario", choices=["generate", "catalog", "health"], default="generate")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--clients", type=int, default=max(1, (os.cpu_count() or 2) // 2), help="Yük üreteci süreç sayısı")
+    parser.add_argument("--concurrency", type=int, default=32, help="Yük üreteci başına eşzamanlı istek")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Sahte provider gecikmesi (cache ıskalarında)")
+    parser.add_argument("--port", type=int, default=8799)
+    args = parser.parse_args()
+    
+    print(f"cpu={os.cpu_count()} scenario={args.scenario} clients={args.clients}x{args.concurrency} duration={args.duration}s")
+    print(f"{'workers':>8} {'requests':>10} {'errors':>7} {'rps':>10} {'p50_ms':>8} {'p99_ms':>8} {'speedup':>8}")
+    baseline = None
+    for workers in [int(value) for value in args.workers.split(",") if value.strip()]:
+        result = measure(workers, args)
+        baseline = baseline or result["rps"]
+        print(
+            f"{result['workers']:>8} {result['requests']:>10} {result['errors']:>7} {result['rps']:>10.0f} "
+            f"{result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f} {result['rps'] / baseline:>7.2f}x"
+        )
+
+if __name__ == "__main__":
+    main()
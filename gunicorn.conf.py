@@ -0,0 +1,29 @@
+"""
+Production sunucu profili - gunicorn master + uvicorn worker'ları
+
+Kullanım:
+    gunicorn main:app -c gunicorn.conf.py
+"""
+from app.core.config import settings
+
+bind = f"{settings.HOST}:{settings.PORT}"
+workers = max(1, settings.WORKERS)
+worker_class = "app.core.workers.RulesetUvicornWorker"
+backlog = settings.SERVER_BACKLOG
+keepalive = settings.SERVER_KEEP_ALIVE
+graceful_timeout = settings.SERVER_GRACEFUL_TIMEOUT
+# UvicornWorker heartbeat'i event loop üzerinde çalışır: loop'u bu süre boyunca bloklayan kod
+# (ör. senkron SDK çağrısı) worker'ın öldürülmesine yol açar. Await edilen uzun LLM çağrıları
+# loop'u bloklamaz; bloklayan işler asyncio.to_thread ile thread'e alınmalı
+timeout = 60
+max_requests = settings.SERVER_MAX_REQUESTS
+max_requests_jitter = settings.SERVER_MAX_REQUESTS // 10
+# Uygulamanın tamamı preload edilmez: SQLite bağlantıları (cache, job, rate limit) worker başına açılmalı
+preload_app = False
+accesslog = "-" if settings.DEBUG else None
+
+def on_starting(server):
+    """Provider SDK'larını fork'tan önce master'da bir kez yükle (worker'lar copy-on-write paylaşır)"""
+    if settings.PRELOAD_PROVIDERS:
+        from app.services.ai_service import ai_service
+        ai_service.initialize()
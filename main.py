@@ -1,16 +1,46 @@
 """
 AI Ruleset Generator - FastAPI Main Application
 """
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.compression import CompressionMiddleware
+from app.core.metrics import MetricsMiddleware
 from app.routers.main import router
+from app.services.health_service import health_monitor
+from app.services.job_service import job_queue
+from app.services.generation_service import generation_service
+from app.services.history_service import history_recorder
+from app.services.ai_service import ai_service
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Uygulama başlangıç/kapanış işlemleri"""
+    # Readiness durumunu arka planda yenile
+    health_monitor.start()
+    await job_queue.start()
+    # Geçmiş yazıcısını başlat, cache'i geçmişteki son üretimlerden arka planda doldur
+    history_recorder.start()
+    rehydrate_task = asyncio.create_task(generation_service.rehydrate())
+    # Yerel modelleri beklemeden arka planda ısıt
+    warm_up_task = asyncio.create_task(ai_service.warm_up())
+    yield
+    warm_up_task.cancel()
+    rehydrate_task.cancel()
+    await job_queue.stop()
+    # Kuyrukta kalan geçmiş kayıtlarını yaz
+    await history_recorder.stop()
+    await health_monitor.stop()
+    await ai_service.close()
 
 # FastAPI uygulaması oluştur
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.PROJECT_DESCRIPTION,
-    version=settings.VERSION
+    version=settings.VERSION,
+    lifespan=lifespan
 )
 
 # CORS middleware ekle - Daha açık ayarlar
@@ -22,14 +52,49 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Büyük ruleset yanıtlarını sıkıştır (streaming yanıtlar olduğu gibi geçer)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY
+    )
+
+# Route şablonu başına istek sayısı ve gecikme (api/index.py de bu app'i kullanır)
+app.add_middleware(MetricsMiddleware)
+
 # Router'ları dahil et
 app.include_router(router)
 
-if __name__ == "__main__":
+def run_server() -> None:
+    """Ayarlara göre uvicorn'u başlat (development: reload, production: çoklu worker)
+    
+    Fork öncesi provider preload'u için production'da gunicorn.conf.py önerilir;
+    uvicorn'un kendi worker'ları spawn ile başladığından master'daki import'ları paylaşmaz.
+    """
     import uvicorn
+    
+    if settings.DEBUG:
+        # Reloader import string ister
+        uvicorn.run("main:app", host=settings.HOST, port=settings.PORT, reload=True)
+        return
+    
+    workers = max(1, settings.WORKERS)
+    if workers == 1 and settings.PRELOAD_PROVIDERS:
+        ai_service.initialize()
     uvicorn.run(
-        app, 
-        host=settings.HOST, 
-        port=settings.PORT, 
-        reload=settings.DEBUG
+        "main:app" if workers > 1 else app,
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=workers,
+        loop=settings.SERVER_LOOP,
+        http=settings.SERVER_HTTP,
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEP_ALIVE,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT,
+        limit_max_requests=settings.SERVER_MAX_REQUESTS or None
     )
+
+if __name__ == "__main__":
+    run_server()
@@ -0,0 +1,119 @@
+"""
+Katalog kombinasyonları için ruleset'leri önceden üretip cache'i ve üretim geçmişini doldurur
+
+Geçmişte (TTL içinde) bulunan spec'ler atlanır; yarıda kesilen çalıştırma aynı
+komutla kaldığı yerden devam eder. Sunucu açılışta cache'i geçmişten doldurur
+(HISTORY_REHYDRATE), bu yüzden:
+
+- CLI sunucuyla aynı HISTORY_PATH'i kullanmalıdır (HISTORY_BACKEND=sqlite; varsayılan
+  "history.db" çalışma dizinine göredir, sunucunun dizininden ya da mutlak yol ile çalıştırın)
+  ve aynı AI_PROVIDER/model ayarlarıyla çalışmalıdır (kayıtlar provider/model'e göre anahtarlanır)
+- Çalışan sunucu prewarm bittikten sonra yeniden başlatılmalıdır. Varsayılan memory cache
+  backend'inde CLI'nin doldurduğu cache süreç bitince kaybolur; sunucuya yalnızca geçmiş taşınır
+
+Kullanım:
+    python prewarm.py --categories frontend,backend --rate 30 --concurrency 4
+    python prewarm.py --vary frontend_framework,ui_library --set "styling_approach=Tailwind CSS" --dry-run
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Any, Dict
+from app.core.config import settings
+from app.services.ai_service import ai_service
+from app.services.history_service import history_recorder, MemoryHistoryStore
+from app.services.prewarm_service import CATALOG_FIELDS, PrewarmRunner, enumerate_specs
+from app.services.prompt_service import PromptService
+from app.services.token_budget import TokenBudget
+
+def print_progress(stats: Dict[str, Any]) -> None:
+    """Tek satırlık ilerleme raporu"""
+    eta = f"{stats['eta_s']}s" if stats["eta_s"] is not None else "-"
+    print(
+        f"[{stats['done']}/{stats['total']}] generated={stats['generated']} skipped={stats['skipped']} "
+        f"failed={stats['failed']} {stats['generated_per_minute']}/min eta={eta}",
+        file=sys.stderr,
+        flush=True
+    )
+
+def parse_fixed(values) -> Dict[str, str]:
+    """--set alan=değer çiftlerini sözlüğe çevir"""
+    fixed = {}
+    for item in values:
+        field, separator, value = item.partition("=")
+        if not separator:
+            raise argparse.ArgumentTypeError(f"--set alan=değer biçiminde olmalı: {item}")
+        fixed[field.strip()] = value.strip()
+    return fixed
+
+async def main() -> int:
+    fields = sorted({field for options in CATALOG_FIELDS.values() for field in options})
+    parser = argparse.ArgumentParser(description="Katalog kombinasyonları için ruleset cache'ini önceden doldur")
+    parser.add_argument("--categories", default="frontend,backend,fullstack", help=f"Kategoriler ({', '.join(CATALOG_FIELDS)})")
+    parser.add_argument("--vary", default=None, help=f"Kombinasyonu alınacak alanlar (varsayılan: kategori başına iki alan). Alanlar: {', '.join(fields)}")
+    parser.add_argument("--set", action="append", default=[], metavar="ALAN=DEĞER", help="Tüm spec'lerde sabit alan (tekrarlanabilir)")
+    parser.add_argument("--limit", type=int, default=None, help="En fazla bu kadar spec")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=30.0, help="Dakikadaki en fazla üretim (upstream bütçesi)")
+    parser.add_argument("--burst", type=int, default=1)
+    parser.add_argument("--progress-interval", type=float, default=5.0, help="İlerleme raporu aralığı (saniye)")
+    parser.add_argument("--dry-run", action="store_true", help="Yalnızca spec'leri ve prompt boyutlarını listele")
+    parser.add_argument("--json", action="store_true", help="Sonucu JSON olarak yazdır")
+    args = parser.parse_args()
+    
+    try:
+        specs = enumerate_specs(
+            [category.strip() for category in args.categories.split(",") if category.strip()],
+            vary=[field.strip() for field in args.vary.split(",") if field.strip()] if args.vary else None,
+            fixed=parse_fixed(args.set),
+            limit=args.limit
+        )
+    except (ValueError, argparse.ArgumentTypeError) as e:
+        parser.error(str(e))
+    
+    if args.dry_run:
+        prompt_tokens = 0
+        for project_info in specs:
+            prompt = PromptService.generate_ruleset_prompt(TokenBudget.apply(project_info, enforce=False))
+            prompt_tokens += TokenBudget.estimate_tokens(prompt)
+            if not args.json:
+                print(project_info.model_dump_json(exclude_defaults=True))
+        summary = {"specs": len(specs), "prompt_tokens": prompt_tokens}
+        print(json.dumps(summary) if args.json else f"{len(specs)} spec, ~{prompt_tokens} prompt token")
+        return 0
+    
+    if not settings.HISTORY_ENABLED or isinstance(history_recorder.store, MemoryHistoryStore):
+        print("Uyarı: geçmiş kalıcı değil; çalıştırma devam ettirilemez ve sunucu cache'i geçmişten dolduramaz", file=sys.stderr)
+    else:
+        print(
+            f"Geçmiş: {os.path.abspath(settings.HISTORY_PATH)} (sunucu aynı dosyayı kullanmalı ve "
+            f"prewarm sonrası yeniden başlatılmalı)",
+            file=sys.stderr
+        )
+    
+    runner = PrewarmRunner(
+        concurrency=args.concurrency,
+        rate_per_minute=args.rate,
+        burst=args.burst,
+        progress=None if args.json else print_progress,
+        progress_interval=args.progress_interval
+    )
+    try:
+        stats = await runner.run(specs)
+    finally:
+        # Kuyruktaki geçmiş kayıtları yazılmadan çıkılmaz
+        await history_recorder.stop()
+        await ai_service.close()
+    
+    if args.json:
+        print(json.dumps(stats, indent=2))
+    else:
+        print_progress(stats)
+        for error in stats["errors"]:
+            print(f"  {error}", file=sys.stderr)
+    return 1 if stats["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
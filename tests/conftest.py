@@ -0,0 +1,73 @@
+"""
+Test ortamı: app modülleri import edilmeden önce kalıcı store'ları bellek içine al
+"""
+import asyncio
+import os
+
+# Testler çalışma dizinindeki history.db / jobs.db vb. dosyalara yazmaz
+os.environ.setdefault("HISTORY_BACKEND", "memory")
+os.environ.setdefault("HISTORY_REHYDRATE", "false")
+os.environ.setdefault("RULESET_CACHE_BACKEND", "memory")
+os.environ.setdefault("JOB_STORE_BACKEND", "memory")
+os.environ.setdefault("RATE_LIMIT_BACKEND", "memory")
+
+import pytest
+from benchmarks.fake_provider import FakeProvider
+from app.services.ai_service import ai_service
+from app.services.cache_service import ruleset_cache
+from app.services.history_service import history_recorder, MemoryHistoryStore
+from app.services.provider_stats import ProviderStats
+from app.services.rate_limit_service import MemoryRateLimitBackend, rate_limiter
+from app.services.retry_policy import RetryPolicy
+from app.services.similarity_service import similarity_index
+from app.core.config import settings
+
+def make_fake_provider(name: str = "fake", error_rate: float = 0.0, latency_ms: float = 1.0) -> FakeProvider:
+    """Tekrar denemesiz, sabit gecikmeli sahte provider"""
+    return FakeProvider(
+        latency_ms=latency_ms,
+        distribution="fixed",
+        error_rate=error_rate,
+        name=name,
+        retry_policy=RetryPolicy(max_retries=0, hedge=False)
+    )
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limits(monkeypatch):
+    """Tüm test istekleri aynı istemci IP'sinden gelir; her test boş bucket'larla başlar"""
+    monkeypatch.setattr(rate_limiter, "backend", MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_CLIENTS))
+
+@pytest.fixture
+def fake_provider():
+    """Sahte provider fabrikası"""
+    return make_fake_provider
+
+@pytest.fixture
+def provider_pool():
+    """ai_service havuzunu verilen provider'larla değiştir; cache, indeks ve geçmiş boş başlar"""
+    saved = ai_service._providers, ai_service.stats
+    saved_store = history_recorder.store
+    asyncio.run(ruleset_cache.clear())
+    similarity_index.clear()
+    history_recorder.store = MemoryHistoryStore(settings.HISTORY_MAX_ENTRIES)
+    
+    def install(*providers: FakeProvider):
+        ai_service._providers = list(providers)
+        ai_service.stats = {
+            provider.provider_name: ProviderStats(
+                settings.PROVIDER_EWMA_ALPHA,
+                settings.PROVIDER_FAILURE_THRESHOLD,
+                settings.PROVIDER_COOLDOWN,
+                failure_latency=settings.PROVIDER_TIMEOUT
+            )
+            for provider in providers
+        }
+        return providers
+    
+    yield install
+    ai_service._providers, ai_service.stats = saved
+    history_recorder.store = saved_store
+    # Kuyruk ve yazıcı task'ı her testin kendi event loop'una bağlanır
+    history_recorder._queue = None
+    history_recorder._writer = None
+    history_recorder._pending = []
@@ -0,0 +1,74 @@
+"""
+Katalog endpoint'leri: ETag, koşullu istek (304) ve ön-sıkıştırılmış varyantlar
+"""
+import asyncio
+import json
+import httpx
+import pytest
+import main
+from app.core.compression import brotli
+from app.services.catalog_service import CATALOG, FRAMEWORKS, PROJECT_CATEGORIES, PROJECT_TYPES, CatalogEntry
+
+ENDPOINTS = {
+    "/project-types": ("project_types", {"project_types": PROJECT_TYPES}),
+    "/frameworks": ("frameworks", {"frameworks": FRAMEWORKS}),
+    "/project-categories": ("project_categories", PROJECT_CATEGORIES)
+}
+
+def get(path: str, **headers) -> httpx.Response:
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path, headers=headers)
+    return asyncio.run(scenario())
+
+@pytest.mark.parametrize("path", list(ENDPOINTS))
+def test_catalog_body_and_cache_headers(path):
+    name, payload = ENDPOINTS[path]
+    response = get(path, **{"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.json() == json.loads(json.dumps(payload))
+    assert response.headers["etag"] == CATALOG[name].etag
+    assert response.headers["cache-control"].startswith("public, max-age=")
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in response.headers
+
+@pytest.mark.parametrize("path", list(ENDPOINTS))
+def test_matching_etag_returns_304(path):
+    etag = get(path).headers["etag"]
+    response = get(path, **{"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+@pytest.mark.parametrize("encoding", [
+    "gzip",
+    pytest.param("br", marks=pytest.mark.skipif(brotli is None, reason="brotli kurulu değil"))
+])
+def test_compressed_variant_has_own_etag(encoding):
+    plain = get("/project-categories", **{"Accept-Encoding": "identity"})
+    compressed = get("/project-categories", **{"Accept-Encoding": encoding})
+    assert compressed.headers["content-encoding"] == encoding
+    assert compressed.json() == plain.json()
+    # Strong ETag'ler content-coding başına farklıdır
+    assert compressed.headers["etag"] == plain.headers["etag"][:-1] + f'-{encoding}"'
+    # Sıkıştırılmış varyantın ETag'i ile gelen koşullu istek de 304 alır
+    revalidated = get("/project-categories", **{"Accept-Encoding": encoding, "If-None-Match": compressed.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == compressed.headers["etag"]
+
+def test_if_none_match_forms():
+    entry = CatalogEntry({"a": 1})
+    assert entry.matches(entry.etag)
+    assert entry.matches(entry.etag_for("gzip"))
+    assert not entry.matches(entry.etag[:-1] + '-deflate"')
+    assert entry.matches(f'"other", W/{entry.etag}')
+    assert entry.matches("*")
+    assert not entry.matches('"other"')
+    assert not entry.matches(None)
+    assert not entry.matches("")
+
+def test_stale_etag_returns_full_body():
+    response = get("/frameworks", **{"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.json() == {"frameworks": FRAMEWORKS}
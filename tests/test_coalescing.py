@@ -0,0 +1,104 @@
+"""
+Single-flight: özdeş eşzamanlı istekler tek upstream çağrısını paylaşır
+"""
+import asyncio
+from typing import Optional
+import httpx
+import pytest
+import main
+from app.services.coalescing_service import RequestCoalescer
+from app.services.history_service import history_recorder
+
+SPEC = {"project_category": "backend", "project_type": "API/Microservice", "backend_framework": "FastAPI"}
+
+class SlowCall:
+    """Çağrı sayısını tutan, verilen süre sonra değer döndüren factory"""
+    
+    def __init__(self, delay: float = 0.05, error: Optional[Exception] = None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.finished = 0
+    
+    async def __call__(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        self.finished += 1
+        if self.error is not None:
+            raise self.error
+        return "sonuç"
+
+def test_identical_calls_share_one_task():
+    coalescer, call = RequestCoalescer(), SlowCall()
+    
+    async def scenario():
+        return await asyncio.gather(*(coalescer.run("k", call) for _ in range(5)))
+    
+    assert asyncio.run(scenario()) == ["sonuç"] * 5
+    assert call.calls == 1
+    assert coalescer.stats()["deduplicated"] == 4
+    assert coalescer.stats()["in_flight"] == 0
+
+def test_different_keys_do_not_share():
+    coalescer, call = RequestCoalescer(), SlowCall(delay=0.01)
+    
+    async def scenario():
+        await asyncio.gather(coalescer.run("a", call), coalescer.run("b", call))
+    
+    asyncio.run(scenario())
+    assert call.calls == 2
+
+def test_waiter_timeout_does_not_cancel_shared_call():
+    coalescer, call = RequestCoalescer(), SlowCall(delay=0.1)
+    
+    async def scenario():
+        patient = asyncio.ensure_future(coalescer.run("k", call))
+        with pytest.raises(asyncio.TimeoutError):
+            await coalescer.run("k", call, timeout=0.01)
+        return await patient
+    
+    assert asyncio.run(scenario()) == "sonuç"
+    assert call.calls == 1 and call.finished == 1
+    assert coalescer.timeouts == 1
+
+def test_cancelled_waiter_does_not_cancel_shared_call():
+    coalescer, call = RequestCoalescer(), SlowCall(delay=0.05)
+    
+    async def scenario():
+        leader = asyncio.ensure_future(coalescer.run("k", call))
+        await asyncio.sleep(0)
+        leader.cancel()
+        # İptal edilen istemcinin ardından gelen istek yeni çağrı başlatmaz
+        return await coalescer.run("k", call)
+    
+    assert asyncio.run(scenario()) == "sonuç"
+    assert call.calls == 1
+    assert coalescer.cancelled_waiters == 1
+
+def test_error_reaches_all_waiters_and_clears_key():
+    coalescer, call = RequestCoalescer(), SlowCall(delay=0.01, error=RuntimeError("upstream"))
+    
+    async def scenario():
+        results = await asyncio.gather(*(coalescer.run("k", call) for _ in range(3)), return_exceptions=True)
+        # Hata kayıtlı kalmaz; sonraki istek yeniden dener
+        retry = await asyncio.gather(coalescer.run("k", call), return_exceptions=True)
+        return results, retry
+    
+    results, retry = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results + retry)
+    assert call.calls == 2
+
+def test_concurrent_requests_hit_provider_once(provider_pool, fake_provider):
+    (provider,) = provider_pool(fake_provider(latency_ms=50))
+    
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(*(client.post("/generate-ruleset", json=SPEC) for _ in range(8)))
+        await history_recorder.stop()
+        return responses
+    
+    responses = asyncio.run(scenario())
+    assert [response.status_code for response in responses] == [200] * 8
+    assert len({response.json()["markdown"] for response in responses}) == 1
+    assert provider.calls == 1
@@ -0,0 +1,117 @@
+"""
+Üretim geçmişi: seq cursor'ı ile sayfalama, filtreler ve /history endpoint'i
+"""
+import asyncio
+import time
+import uuid
+from typing import Any, Dict, List
+import httpx
+import pytest
+import main
+from app.services.history_service import HistoryStore, MemoryHistoryStore, SQLiteHistoryStore, history_recorder
+
+def make_entry(category: str = "frontend", frontend_framework: str = "react", backend_framework: str = "none") -> Dict[str, Any]:
+    return {
+        "id": uuid.uuid4().hex,
+        "spec_hash": uuid.uuid4().hex,
+        "category": category,
+        "frontend_framework": frontend_framework,
+        "backend_framework": backend_framework,
+        "ai_provider": "fake",
+        "model": "fake-model",
+        "strategy": "single",
+        "created_at": time.time(),
+        "project_info": {"project_category": category},
+        "markdown": "# ruleset"
+    }
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path) -> HistoryStore:
+    if request.param == "memory":
+        return MemoryHistoryStore(100)
+    return SQLiteHistoryStore(str(tmp_path / "history.db"), 100)
+
+def walk(store: HistoryStore, limit: int, **filters) -> List[List[Dict[str, Any]]]:
+    """Cursor'ı son kaydın seq'i olarak ilerleterek tüm sayfaları topla"""
+    async def scenario():
+        pages, before = [], None
+        while True:
+            page = await store.list(limit, before=before, **filters)
+            if not page:
+                return pages
+            pages.append(page)
+            before = page[-1]["seq"]
+    return asyncio.run(scenario())
+
+def test_cursor_walks_every_entry_once_newest_first(store):
+    entries = [make_entry() for _ in range(7)]
+    asyncio.run(store.write_many(entries))
+    pages = walk(store, 3)
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [entry["id"] for page in pages for entry in page] == [entry["id"] for entry in reversed(entries)]
+    assert all("markdown" not in entry for page in pages for entry in page)
+
+def test_new_entries_do_not_shift_later_pages(store):
+    entries = [make_entry() for _ in range(4)]
+    asyncio.run(store.write_many(entries))
+    
+    async def scenario():
+        first = await store.list(2)
+        # Sayfalar arasında gelen yeni kayıt sonraki sayfada tekrar veya kayma yaratmaz
+        await store.write_many([make_entry()])
+        return first, await store.list(2, before=first[-1]["seq"])
+    
+    first, second = asyncio.run(scenario())
+    assert [entry["id"] for entry in first + second] == [entry["id"] for entry in reversed(entries)]
+
+def test_filters_combine_with_cursor(store):
+    entries = [
+        make_entry("frontend", "react"),
+        make_entry("backend", "none", "fastapi"),
+        make_entry("fullstack", "react", "fastapi"),
+        make_entry("frontend", "vue"),
+        make_entry("backend", "none", "gin")
+    ]
+    asyncio.run(store.write_many(entries))
+    by_framework = [entry["id"] for page in walk(store, 1, framework="fastapi") for entry in page]
+    assert by_framework == [entries[2]["id"], entries[1]["id"]]
+    by_category = [entry["id"] for page in walk(store, 1, category="frontend") for entry in page]
+    assert by_category == [entries[3]["id"], entries[0]["id"]]
+    assert [entry["id"] for entry in asyncio.run(store.list(5, spec_hash=entries[4]["spec_hash"]))] == [entries[4]["id"]]
+
+def test_sqlite_store_keeps_max_entries_and_ignores_replayed_batch(tmp_path):
+    store = SQLiteHistoryStore(str(tmp_path / "history.db"), 3)
+    entries = [make_entry() for _ in range(5)]
+    asyncio.run(store.write_many(entries))
+    asyncio.run(store.write_many(entries[-2:]))
+    assert store.size() == 3
+    assert [entry["id"] for entry in asyncio.run(store.list(10))] == [entry["id"] for entry in reversed(entries[2:])]
+
+def test_history_endpoint_pages_with_next_cursor(provider_pool):
+    provider_pool()
+    entries = [make_entry() for _ in range(5)]
+    asyncio.run(history_recorder.store.write_many(entries))
+    
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            pages, cursor = [], None
+            while True:
+                params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+                body = (await client.get("/history", params=params)).json()
+                pages.append(body)
+                cursor = body["next_cursor"]
+                if cursor is None:
+                    break
+            invalid = await client.get("/history", params={"cursor": "abc"})
+            detail = await client.get(f"/history/{entries[0]['id']}")
+            missing = await client.get("/history/unknown")
+        return pages, invalid, detail, missing
+    
+    pages, invalid, detail, missing = asyncio.run(scenario())
+    assert [len(page["items"]) for page in pages] == [2, 2, 1]
+    assert [item["id"] for page in pages for item in page["items"]] == [entry["id"] for entry in reversed(entries)]
+    assert all(item["markdown"] is None for page in pages for item in page["items"])
+    assert invalid.status_code == 400
+    assert detail.json()["markdown"] == "# ruleset"
+    assert missing.status_code == 404
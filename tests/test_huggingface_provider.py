@@ -0,0 +1,166 @@
+"""
+Hugging Face provider: TGI / OpenAI-uyumlu stub transport ile istek gövdesi, batch'leme ve hata sınıflandırması
+"""
+import asyncio
+import json
+from typing import Any, Callable, Dict, List
+import httpx
+import pytest
+from app.core.config import settings
+from app.services.ai_provider import ProviderFatal, ProviderRateLimited, ProviderTimeout, ProviderTransient
+from app.services.huggingface_provider import HuggingFaceProvider
+
+@pytest.fixture
+def make_provider(monkeypatch):
+    def make(handler: Callable[[httpx.Request], httpx.Response], api_style: str = "tgi", batch_size: int = 1) -> HuggingFaceProvider:
+        monkeypatch.setattr(settings, "HUGGINGFACE_API_STYLE", api_style)
+        monkeypatch.setattr(settings, "HUGGINGFACE_BATCH_SIZE", batch_size)
+        monkeypatch.setattr(settings, "HUGGINGFACE_BATCH_WINDOW_MS", 50.0)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://tgi")
+        return HuggingFaceProvider(client=client)
+    return make
+
+def body(request: httpx.Request) -> Dict[str, Any]:
+    return json.loads(request.content)
+
+def sse(*events: Any) -> bytes:
+    return "".join(f"data: {event if isinstance(event, str) else json.dumps(event)}\n\n" for event in events).encode()
+
+def collect(provider: HuggingFaceProvider, prompt: str = "prompt") -> List[str]:
+    async def scenario():
+        return [chunk async for chunk in provider.generate_content_stream(prompt)]
+    return asyncio.run(scenario())
+
+def test_tgi_generate_payload_and_response(make_provider):
+    requests: List[httpx.Request] = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"generated_text": "# kurallar"})
+    
+    provider = make_provider(handler)
+    assert asyncio.run(provider.generate_content("prompt", max_tokens=512)) == "# kurallar"
+    (request,) = requests
+    assert request.url.path == "/generate"
+    assert body(request) == {
+        "inputs": "prompt",
+        "parameters": {"max_new_tokens": 512, "temperature": 0.7, "return_full_text": False}
+    }
+
+def test_tgi_stream_skips_special_tokens(make_provider):
+    events = [
+        {"token": {"text": "# ", "special": False}},
+        {"token": {"text": "kurallar", "special": False}},
+        {"token": {"text": "</s>", "special": True}, "generated_text": "# kurallar"}
+    ]
+    paths: List[str] = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, content=b":keep-alive\n\n" + sse(*events))
+    
+    assert collect(make_provider(handler)) == ["# ", "kurallar"]
+    assert paths == ["/generate_stream"]
+
+def test_openai_generate_payload_and_response(make_provider):
+    requests: List[httpx.Request] = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"choices": [{"index": 0, "text": "# kurallar"}]})
+    
+    provider = make_provider(handler, api_style="openai")
+    assert asyncio.run(provider.generate_content("prompt")) == "# kurallar"
+    (request,) = requests
+    assert request.url.path == "/v1/completions"
+    assert body(request) == {
+        "model": settings.HUGGINGFACE_MODEL,
+        "prompt": ["prompt"],
+        "max_tokens": settings.HUGGINGFACE_MAX_NEW_TOKENS,
+        "temperature": 0.7,
+        "stream": False
+    }
+
+def test_openai_stream_stops_at_done(make_provider):
+    events = [
+        {"choices": [{"index": 0, "text": "# "}]},
+        {"choices": []},
+        {"choices": [{"index": 0, "text": "kurallar"}]},
+        "[DONE]",
+        {"choices": [{"index": 0, "text": "sonrası okunmaz"}]}
+    ]
+    requests: List[httpx.Request] = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=sse(*events))
+    
+    assert collect(make_provider(handler, api_style="openai")) == ["# ", "kurallar"]
+    assert body(requests[0])["stream"] is True and body(requests[0])["prompt"] == "prompt"
+
+def test_openai_concurrent_prompts_share_one_request(make_provider):
+    requests: List[httpx.Request] = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        prompts = body(request)["prompt"]
+        # Sunucu choices'ı sırasız döndürebilir; index ile eşlenir
+        choices = [{"index": index, "text": f"yanıt: {prompt}"} for index, prompt in enumerate(prompts)]
+        return httpx.Response(200, json={"choices": list(reversed(choices))})
+    
+    provider = make_provider(handler, api_style="openai", batch_size=3)
+    
+    async def scenario():
+        return await asyncio.gather(
+            provider.generate_content("a", max_tokens=100),
+            provider.generate_content("b"),
+            provider.generate_content("c", max_tokens=300)
+        )
+    
+    assert asyncio.run(scenario()) == ["yanıt: a", "yanıt: b", "yanıt: c"]
+    (request,) = requests
+    # Batch içindeki en yüksek limit tüm prompt'lar için kullanılır
+    assert body(request)["prompt"] == ["a", "b", "c"] and body(request)["max_tokens"] == 300
+
+def test_openai_batch_error_reaches_every_caller(make_provider):
+    provider = make_provider(lambda request: httpx.Response(503), api_style="openai", batch_size=2)
+    
+    async def scenario():
+        return await asyncio.gather(
+            provider.generate_content("a"), provider.generate_content("b"), return_exceptions=True
+        )
+    
+    assert [type(error) for error in asyncio.run(scenario())] == [ProviderTransient, ProviderTransient]
+
+def raise_timeout(request: httpx.Request) -> httpx.Response:
+    raise httpx.ReadTimeout("timed out", request=request)
+
+ERROR_CASES = [
+    (raise_timeout, ProviderTimeout, None),
+    (lambda request: httpx.Response(429, headers={"Retry-After": "12"}), ProviderRateLimited, 12.0),
+    (lambda request: httpx.Response(503, headers={"Retry-After": "2"}), ProviderTransient, 2.0),
+    (lambda request: httpx.Response(500), ProviderTransient, None),
+    (lambda request: httpx.Response(401, json={"error": "unauthorized"}), ProviderFatal, None),
+    (lambda request: httpx.Response(422, json={"error": "inputs too long"}), ProviderFatal, None)
+]
+
+@pytest.mark.parametrize("api_style", ["tgi", "openai"])
+@pytest.mark.parametrize("handler, error_type, retry_after", ERROR_CASES)
+def test_errors_map_to_provider_error_kinds(make_provider, api_style, handler, error_type, retry_after):
+    provider = make_provider(handler, api_style=api_style)
+    with pytest.raises(error_type) as raised:
+        asyncio.run(provider.generate_content("prompt"))
+    assert type(raised.value) is error_type
+    assert raised.value.retry_after == retry_after
+
+@pytest.mark.parametrize("handler, error_type, retry_after", ERROR_CASES)
+def test_stream_errors_map_to_provider_error_kinds(make_provider, handler, error_type, retry_after):
+    with pytest.raises(error_type) as raised:
+        collect(make_provider(handler))
+    assert type(raised.value) is error_type
+    assert raised.value.retry_after == retry_after
+
+def test_stream_error_event_is_fatal(make_provider):
+    provider = make_provider(lambda request: httpx.Response(200, content=sse({"error": "Input validation error"})))
+    with pytest.raises(ProviderFatal, match="Input validation error"):
+        collect(provider)
@@ -0,0 +1,136 @@
+"""
+Job kuyruğu: atomik sahiplenme, stale job'ların yeniden kuyruğa alınması ve worker dayanıklılığı
+"""
+import asyncio
+import time
+from app.models.schemas import ProjectInfo
+from app.services.job_service import JobQueue, JobStatus, MemoryJobStore, QueueFullError, SQLiteJobStore
+
+SPEC = ProjectInfo(project_category="backend", project_type="API/Microservice", backend_framework="FastAPI")
+
+def make_queue(store, **kwargs) -> JobQueue:
+    return JobQueue(store, workers=2, max_size=10, result_ttl=3600, **kwargs)
+
+async def wait_finished(queue: JobQueue, job_id: str) -> dict:
+    job = await queue.get(job_id, wait=5)
+    assert job["status"] in JobStatus.FINISHED
+    return job
+
+def test_claim_is_atomic(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    first, second = SQLiteJobStore(path), SQLiteJobStore(path)
+    
+    async def scenario():
+        job = {"id": "job-1", "status": JobStatus.QUEUED, "project_info": SPEC.model_dump(), "result": None,
+               "error": None, "created_at": time.time(), "updated_at": time.time()}
+        await first.create(job)
+        claims = [await first.claim("job-1", "worker-a"), await second.claim("job-1", "worker-b")]
+        # Sahibi olmayan process sonucu yazamaz
+        assert not await second.finish("job-1", "worker-b", status=JobStatus.FAILED, error="x")
+        assert await first.finish("job-1", "worker-a", status=JobStatus.SUCCEEDED)
+        return claims, await second.get("job-1")
+    
+    claims, job = asyncio.run(scenario())
+    assert claims[0]["status"] == JobStatus.RUNNING
+    assert claims[1] is None
+    assert job["status"] == JobStatus.SUCCEEDED
+
+def test_booting_worker_does_not_rerun_live_job(tmp_path, provider_pool, fake_provider):
+    (provider,) = provider_pool(fake_provider(latency_ms=300))
+    path = str(tmp_path / "jobs.db")
+    
+    async def scenario():
+        running = make_queue(SQLiteJobStore(path), heartbeat_interval=0.05, stale_after=0.2)
+        job = await running.submit(SPEC)
+        await asyncio.sleep(0.1)
+        # İkinci worker (ör. gunicorn recycle) job çalışırken açılır; heartbeat taze olduğu için almaz
+        booted = make_queue(SQLiteJobStore(path), heartbeat_interval=0.05, stale_after=0.2)
+        await booted.start()
+        finished = await wait_finished(running, job["id"])
+        await running.stop()
+        await booted.stop()
+        return finished, booted
+    
+    job, booted = asyncio.run(scenario())
+    assert job["status"] == JobStatus.SUCCEEDED
+    assert provider.calls == 1
+    assert booted.requeued == 0
+
+def test_stale_running_job_is_requeued(tmp_path, provider_pool, fake_provider):
+    (provider,) = provider_pool(fake_provider())
+    path = str(tmp_path / "jobs.db")
+    
+    async def scenario():
+        store = SQLiteJobStore(path)
+        now = time.time()
+        await store.create({"id": "orphan", "status": JobStatus.QUEUED, "project_info": SPEC.model_dump(), "result": None,
+                            "error": None, "created_at": now, "updated_at": now})
+        # Process'i ölmüş bir worker'ın sahiplendiği, heartbeat'i kesilmiş job
+        await store.claim("orphan", "dead-worker")
+        store._conn.execute("UPDATE jobs SET updated_at = ? WHERE id = ?", (now - 120, "orphan"))
+        store._conn.commit()
+        
+        queue = make_queue(SQLiteJobStore(path), stale_after=60)
+        await queue.start()
+        job = await wait_finished(queue, "orphan")
+        await queue.stop()
+        return job, queue
+    
+    job, queue = asyncio.run(scenario())
+    assert job["status"] == JobStatus.SUCCEEDED
+    assert queue.requeued == 1
+    assert provider.calls == 1
+
+def test_worker_survives_store_errors(provider_pool, fake_provider):
+    provider_pool(fake_provider())
+    
+    class FlakyStore(MemoryJobStore):
+        failures = 1
+        
+        async def claim(self, job_id, owner):
+            if self.failures:
+                self.failures -= 1
+                raise OSError("disk I/O error")
+            return await super().claim(job_id, owner)
+    
+    async def scenario():
+        queue = JobQueue(FlakyStore(), workers=1, max_size=10, result_ttl=3600)
+        lost = await queue.submit(SPEC)
+        job = await queue.submit(SPEC)
+        finished = await wait_finished(queue, job["id"])
+        alive = all(not worker.done() for worker in queue._workers)
+        await queue.stop()
+        return lost, finished, alive, queue
+    
+    lost, job, alive, queue = asyncio.run(scenario())
+    assert job["status"] == JobStatus.SUCCEEDED
+    assert alive
+    assert queue.store_errors == 1
+
+def test_concurrent_submits_never_overflow_queue():
+    release = asyncio.Event()
+    
+    class SlowStore(MemoryJobStore):
+        async def create(self, job):
+            # SQLite'taki to_thread gibi: create beklenirken diğer submit'ler çalışır
+            await asyncio.sleep(0.01)
+            await super().create(job)
+        
+        async def claim(self, job_id, owner):
+            await release.wait()
+            return await super().claim(job_id, owner)
+    
+    async def scenario():
+        store = SlowStore()
+        queue = JobQueue(store, workers=1, max_size=2, result_ttl=3600)
+        results = await asyncio.gather(*(queue.submit(SPEC) for _ in range(10)), return_exceptions=True)
+        release.set()
+        await queue.stop()
+        return results, store
+    
+    results, store = asyncio.run(scenario())
+    accepted = [result for result in results if isinstance(result, dict)]
+    assert all(isinstance(result, QueueFullError) for result in results if not isinstance(result, dict))
+    assert len(accepted) == 2
+    # Reddedilen submit'ler store'da sahipsiz queued kayıt bırakmaz
+    assert sorted(store._jobs) == sorted(job["id"] for job in accepted)
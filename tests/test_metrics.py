@@ -0,0 +1,45 @@
+"""
+HTTP metrikleri: route şablonu, method ve status etiketleri
+"""
+import asyncio
+import httpx
+import main
+from app.services.metrics_service import http_request_duration_seconds, http_requests_total
+
+def request_all(requests):
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return [(await client.request(method, path)).status_code for method, path in requests]
+    return asyncio.run(scenario())
+
+def count(*labels: str) -> float:
+    return http_requests_total._values.get(labels, 0)
+
+def test_requests_are_labelled_by_route_template():
+    before = {
+        "catalog": count("/project-types", "GET", "200"),
+        "job": count("/jobs/{job_id}", "GET", "404"),
+        "unmatched": count("unmatched", "GET", "404"),
+        "not_allowed": count("/project-types", "DELETE", "405")
+    }
+    statuses = request_all([
+        ("GET", "/project-types"),
+        ("GET", "/jobs/missing-1"),
+        ("GET", "/jobs/missing-2"),
+        ("GET", "/no-such-path"),
+        ("DELETE", "/project-types")
+    ])
+    assert statuses == [200, 404, 404, 404, 405]
+    assert count("/project-types", "GET", "200") == before["catalog"] + 1
+    # Path parametreleri tek seride toplanır
+    assert count("/jobs/{job_id}", "GET", "404") == before["job"] + 2
+    assert count("unmatched", "GET", "404") == before["unmatched"] + 1
+    # Yalnızca method'u uymayan istek route'un şablonuyla etiketlenir
+    assert count("/project-types", "DELETE", "405") == before["not_allowed"] + 1
+
+def test_duration_is_observed_per_route():
+    request_all([("GET", "/project-types")])
+    assert 'http_request_duration_seconds_count{route="/project-types",method="GET"}' in "\n".join(
+        http_request_duration_seconds.render()
+    )
@@ -0,0 +1,116 @@
+"""
+Ollama provider: stub transport üzerinden istek gövdesi, yanıt ayrıştırma ve hata sınıflandırması
+"""
+import asyncio
+import json
+from typing import Any, Callable, Dict, List
+import httpx
+import pytest
+from app.core.config import settings
+from app.services.ai_provider import ProviderFatal, ProviderRateLimited, ProviderTimeout, ProviderTransient
+from app.services.ollama_provider import OllamaProvider
+
+def make_provider(handler: Callable[[httpx.Request], httpx.Response]) -> OllamaProvider:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://ollama")
+    return OllamaProvider(client=client)
+
+def recording(response: httpx.Response, requests: List[httpx.Request]) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return response
+    return handler
+
+def body(request: httpx.Request) -> Dict[str, Any]:
+    return json.loads(request.content)
+
+def test_generate_sends_model_keep_alive_and_token_limit():
+    requests: List[httpx.Request] = []
+    provider = make_provider(recording(httpx.Response(200, json={"response": "# kurallar", "done": True}), requests))
+    
+    assert asyncio.run(provider.generate_content("prompt", max_tokens=256)) == "# kurallar"
+    (request,) = requests
+    assert request.method == "POST" and request.url.path == "/api/generate"
+    assert body(request) == {
+        "model": settings.OLLAMA_MODEL,
+        "prompt": "prompt",
+        "stream": False,
+        "keep_alive": settings.OLLAMA_KEEP_ALIVE,
+        "options": {"num_predict": 256}
+    }
+
+def test_generate_without_limit_omits_options():
+    requests: List[httpx.Request] = []
+    provider = make_provider(recording(httpx.Response(200, json={"response": "ok"}), requests))
+    asyncio.run(provider.generate_content("prompt"))
+    assert "options" not in body(requests[0])
+
+def test_stream_yields_chunks_until_done():
+    lines = [
+        {"response": "# ", "done": False},
+        {"response": "", "done": False},
+        {"response": "kurallar", "done": False},
+        {"response": "", "done": True},
+        {"response": "sonrası okunmaz", "done": False}
+    ]
+    requests: List[httpx.Request] = []
+    content = "\n".join(json.dumps(line) for line in lines).encode()
+    provider = make_provider(recording(httpx.Response(200, content=content), requests))
+    
+    async def scenario():
+        return [chunk async for chunk in provider.generate_content_stream("prompt")]
+    
+    assert asyncio.run(scenario()) == ["# ", "kurallar"]
+    assert body(requests[0])["stream"] is True
+
+def test_stream_error_line_is_fatal():
+    content = json.dumps({"error": "model 'x' not found"}).encode()
+    provider = make_provider(lambda request: httpx.Response(200, content=content))
+    
+    async def scenario():
+        return [chunk async for chunk in provider.generate_content_stream("prompt")]
+    
+    with pytest.raises(ProviderFatal, match="not found"):
+        asyncio.run(scenario())
+
+def raise_timeout(request: httpx.Request) -> httpx.Response:
+    raise httpx.ReadTimeout("timed out", request=request)
+
+def raise_connect_error(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("connection refused", request=request)
+
+@pytest.mark.parametrize("handler, error_type, retry_after", [
+    (raise_timeout, ProviderTimeout, None),
+    (raise_connect_error, ProviderTransient, None),
+    (lambda request: httpx.Response(429, headers={"Retry-After": "7"}), ProviderRateLimited, 7.0),
+    (lambda request: httpx.Response(503), ProviderTransient, None),
+    (lambda request: httpx.Response(504), ProviderTimeout, None),
+    (lambda request: httpx.Response(400, json={"error": "invalid"}), ProviderFatal, None),
+    (lambda request: httpx.Response(404, json={"error": "model not found"}), ProviderFatal, None)
+])
+def test_errors_map_to_provider_error_kinds(handler, error_type, retry_after):
+    provider = make_provider(handler)
+    with pytest.raises(error_type) as raised:
+        asyncio.run(provider.generate_content("prompt"))
+    assert type(raised.value) is error_type
+    assert raised.value.retry_after == retry_after
+
+def test_stream_http_error_is_classified():
+    provider = make_provider(lambda request: httpx.Response(429, headers={"Retry-After": "3"}))
+    
+    async def scenario():
+        return [chunk async for chunk in provider.generate_content_stream("prompt")]
+    
+    with pytest.raises(ProviderRateLimited) as raised:
+        asyncio.run(scenario())
+    assert raised.value.retry_after == 3.0
+
+def test_deep_health_check_requires_configured_model(monkeypatch):
+    monkeypatch.setattr(settings, "OLLAMA_MODEL", "llama3.2")
+    tags = {"models": [{"name": "llama3.2:latest"}, {"name": "mistral:7b"}]}
+    provider = make_provider(lambda request: httpx.Response(200, json=tags))
+    assert asyncio.run(provider.check_health(deep=True))["available"] is True
+    
+    monkeypatch.setattr(settings, "OLLAMA_MODEL", "qwen2")
+    health = asyncio.run(provider.check_health(deep=True))
+    assert health["available"] is False
+    assert "qwen2" in health["error"]
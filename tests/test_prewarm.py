@@ -0,0 +1,59 @@
+"""
+Prewarm: geçmişteki kayıtlara göre atlama yalnızca güncel provider/model için geçerli
+"""
+import asyncio
+from app.services.ai_service import ProviderResult
+from app.services.cache_service import ruleset_cache
+from app.services.generation_service import generation_service
+from app.services.history_service import history_recorder
+from app.services.prewarm_service import PrewarmRunner, enumerate_specs
+from app.services.token_budget import TokenBudget
+from app.core.config import settings
+
+def test_skip_counts_only_current_provider_and_model(provider_pool, fake_provider):
+    (provider,) = provider_pool(fake_provider("primary"))
+    current, other_provider, other_model = enumerate_specs(["backend"], limit=3)
+    seeded = [
+        (current, provider.provider_name, provider.model_name),
+        (other_provider, "other", provider.model_name),
+        (other_model, provider.provider_name, "older-model")
+    ]
+    
+    async def scenario():
+        for project_info, provider_name, model_name in seeded:
+            budgeted = TokenBudget.apply(project_info, enforce=False)
+            await generation_service.store(budgeted, ProviderResult("# kayıt", provider_name, model_name))
+        await history_recorder.stop()
+        # Yalnızca geçmiş kalır (ör. CLI'nin memory cache'i kapandıktan sonraki çalıştırma)
+        await ruleset_cache.clear()
+        runner = PrewarmRunner(concurrency=1, rate_per_minute=60000, burst=10)
+        done = [
+            await runner.is_done(project_info, generation_service.spec_key(TokenBudget.apply(project_info, enforce=False)))
+            for project_info, _, _ in seeded
+        ]
+        stats = await runner.run([project_info for project_info, _, _ in seeded])
+        await history_recorder.stop()
+        return done, stats
+    
+    done, stats = asyncio.run(scenario())
+    assert done == [True, False, False]
+    assert (stats["skipped"], stats["generated"], stats["failed"]) == (1, 2, 0)
+    assert provider.calls == 2
+
+def test_expired_history_is_regenerated(provider_pool, fake_provider, monkeypatch):
+    (provider,) = provider_pool(fake_provider())
+    (project_info,) = enumerate_specs(["frontend"], limit=1)
+    
+    async def scenario():
+        await generation_service.store(
+            TokenBudget.apply(project_info, enforce=False),
+            ProviderResult("# kayıt", provider.provider_name, provider.model_name)
+        )
+        await history_recorder.stop()
+        await ruleset_cache.clear()
+        monkeypatch.setattr(settings, "RULESET_CACHE_TTL", -1)
+        stats = await PrewarmRunner(rate_per_minute=60000).run([project_info])
+        await history_recorder.stop()
+        return stats
+    
+    assert asyncio.run(scenario())["generated"] == 1
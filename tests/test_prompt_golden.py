@@ -0,0 +1,152 @@
+"""
+Derlenmiş prompt şablonlarının kayıtlı (golden) çıktılarla birebir aynı olduğunu doğrular
+
+tests/golden/prompts altındaki dosyalar ve prompt_digests.json şablonlar derlenmeden
+önceki string birleştirme implementasyonunun çıktısıdır; tests/golden/sections
+SECTION_SPECS bölüm prompt'larının kaydıdır. Prompt metni bilerek değiştirildiğinde
+UPDATE_GOLDEN=1 ile yeniden yazılır ve diff'i review edilir.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+import pytest
+from app.models.schemas import ProjectInfo
+from app.services.prompt_service import PromptService, SECTION_SPECS
+from app.services.prewarm_service import CATALOG_FIELDS
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+UPDATE_GOLDEN = os.getenv("UPDATE_GOLDEN") == "1"
+
+# mobile, büyük harfli ve boş kategori fullstack şablonuna düşer
+CATEGORIES = {
+    "frontend": "frontend",
+    "backend": "backend",
+    "fullstack": "fullstack",
+    "mobile": "mobile",
+    "mixed_case": "Frontend",
+    "empty": ""
+}
+
+FULL_FIELDS: Dict[str, Any] = {
+    "project_type": "Web Application",
+    "frontend_framework": "React",
+    "styling_approach": "Tailwind CSS",
+    "state_management": "Redux Toolkit",
+    "http_client": "Axios",
+    "ui_library": "Material-UI",
+    "build_tool": "Vite",
+    "testing_framework": "Vitest",
+    "backend_language": "Python",
+    "backend_framework": "FastAPI",
+    "database_type": "PostgreSQL",
+    "auth_method": "JWT",
+    "api_style": "GraphQL",
+    "orm_tool": "SQLAlchemy",
+    "code_style": "Prettier",
+    "testing_requirement": True,
+    "deployment_platform": "Vercel",
+    "additional_requirements": ["i18n", "Dark mode {theme}"],
+    "notes": "Monorepo, çok dilli arayüz {braces} kalmalı"
+}
+
+VARIANTS: Dict[str, Dict[str, Any]] = {
+    # Boş alanlar FIELD_DEFAULTS ile doldurulur
+    "defaults": {"project_type": "CLI Tool"},
+    "full": FULL_FIELDS,
+    # Boş string None ile aynı varsayılana düşer
+    "empty_strings": {
+        **{field: "" for field, value in FULL_FIELDS.items() if isinstance(value, str)},
+        "testing_requirement": False,
+        "additional_requirements": []
+    },
+    "partial": {
+        "project_type": "Library",
+        "frontend_framework": "Svelte",
+        "backend_framework": "Gin",
+        "database_type": "Redis",
+        "code_style": "Airbnb",
+        "additional_requirements": None
+    }
+}
+
+# /project-categories'deki her alanın tüm seçenekleri (kategoriler arası birleşim)
+CATALOG_OPTIONS: Dict[str, List[str]] = {}
+for _options in CATALOG_FIELDS.values():
+    for _field, _values in _options.items():
+        CATALOG_OPTIONS.setdefault(_field, [])
+        CATALOG_OPTIONS[_field] += [value for value in _values if value not in CATALOG_OPTIONS[_field]]
+
+PROMPT_CASES = [f"{category}-{variant}" for category in CATEGORIES for variant in VARIANTS]
+SECTION_CASES = [f"{category}-{variant}" for category in SECTION_SPECS for variant in ("defaults", "full")]
+
+def build_project_info(case: str) -> ProjectInfo:
+    """Case adından ProjectInfo oluştur (<kategori>-<varyant>)"""
+    category, variant = case.split("-", 1)
+    return ProjectInfo(project_category=CATEGORIES[category], **VARIANTS[variant])
+
+def option_cases() -> Dict[str, ProjectInfo]:
+    """Her kategori için katalogdaki her seçeneği tek tek değiştiren spec'ler"""
+    cases = {}
+    for category in CATEGORIES:
+        for field, options in CATALOG_OPTIONS.items():
+            for option in options:
+                info = {**VARIANTS["full"], field: option}
+                cases[f"{category}:{field}={option}"] = ProjectInfo(project_category=CATEGORIES[category], **info)
+    return cases
+
+def render_sections(project_info: ProjectInfo) -> str:
+    """Bölüm prompt'larını tek golden dosyasında birleştir"""
+    return "".join(
+        f"===== {title} =====\n{prompt}" for title, prompt in PromptService.section_prompts(project_info)
+    )
+
+def assert_golden(path: Path, actual: str) -> None:
+    """Çıktıyı golden dosyasıyla birebir karşılaştır (UPDATE_GOLDEN=1: dosyayı yeniden yaz)"""
+    if UPDATE_GOLDEN:
+        path.write_text(actual, encoding="utf-8", newline="")
+    expected = path.read_text(encoding="utf-8")
+    assert actual == expected
+
+@pytest.mark.parametrize("case", PROMPT_CASES)
+def test_prompt_matches_golden(case):
+    project_info = build_project_info(case)
+    prompt = PromptService.generate_ruleset_prompt(project_info)
+    assert_golden(GOLDEN_DIR / "prompts" / f"{case}.txt", prompt)
+    # Memoize edilmiş ikinci render da aynı olmalı
+    assert PromptService.generate_ruleset_prompt(project_info) == prompt
+
+def test_catalog_options_match_golden_digests():
+    digests = {
+        case: hashlib.sha256(PromptService.generate_ruleset_prompt(project_info).encode("utf-8")).hexdigest()
+        for case, project_info in option_cases().items()
+    }
+    path = GOLDEN_DIR / "prompt_digests.json"
+    if UPDATE_GOLDEN:
+        path.write_text(json.dumps(digests, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    expected = json.loads(path.read_text(encoding="utf-8"))
+    mismatched = sorted(case for case in expected if digests.get(case) != expected[case])
+    assert not mismatched
+    assert digests.keys() == expected.keys()
+
+@pytest.mark.parametrize("case", SECTION_CASES)
+def test_section_prompts_match_golden(case):
+    project_info = build_project_info(case)
+    assert_golden(GOLDEN_DIR / "sections" / f"{case}.txt", render_sections(project_info))
+
+@pytest.mark.parametrize("category", list(SECTION_SPECS))
+def test_single_prompt_lists_every_section(category):
+    prompt = PromptService.generate_ruleset_prompt(ProjectInfo(project_category=category, project_type="Web"))
+    for number, section in enumerate(SECTION_SPECS[category], 1):
+        assert f"{number}. **{section.title}** - {section.description}\n" in prompt
+
+def test_fingerprint_tracks_rendered_prompt():
+    full = build_project_info("frontend-full")
+    same = full.model_copy()
+    changed = full.model_copy(update={"notes": "farklı not"})
+    # Şablonda olmayan alan (frontend için backend_language) prompt'u ve fingerprint'i değiştirmez
+    unused = full.model_copy(update={"backend_language": "Go"})
+    assert PromptService.prompt_fingerprint(full) == PromptService.prompt_fingerprint(same)
+    assert PromptService.prompt_fingerprint(full) != PromptService.prompt_fingerprint(changed)
+    assert PromptService.prompt_fingerprint(full) == PromptService.prompt_fingerprint(unused)
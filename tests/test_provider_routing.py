@@ -0,0 +1,89 @@
+"""
+Failover havuzu: routing skoru ve çağrıya gerçekten hizmet eden provider'ın raporlanması
+"""
+import asyncio
+import httpx
+import main
+from app.models.schemas import ProjectInfo
+from app.services.ai_service import ai_service
+from app.services.cache_service import ruleset_cache
+from app.services.generation_service import generation_service
+from app.services.history_service import history_recorder
+from app.services.provider_stats import ProviderStats
+
+SPEC = {"project_category": "frontend", "project_type": "Web Application", "frontend_framework": "React"}
+
+def make_stats() -> ProviderStats:
+    return ProviderStats(alpha=0.2, failure_threshold=5, cooldown=30, failure_latency=90.0)
+
+def test_untried_provider_is_explored_first():
+    assert make_stats().score() == 0.0
+
+def test_failing_provider_sorts_after_healthy_one():
+    healthy, failing = make_stats(), make_stats()
+    healthy.record_success(2.0)
+    # Hızlı hata veren provider, gecikmesi düşük olsa da öne geçmez
+    failing.record_failure(0.01)
+    assert failing.score() > healthy.score()
+    assert failing.ewma_latency == 0.01
+
+def test_failure_latency_enters_ewma():
+    stats = make_stats()
+    stats.record_success(1.0)
+    stats.record_failure(11.0)
+    assert stats.ewma_latency == 0.2 * 11.0 + 0.8 * 1.0
+    # Hedge yüzdeliği yalnızca başarılı çağrılardan hesaplanır
+    assert list(stats.latencies) == [1.0]
+
+def test_failover_reports_serving_provider(provider_pool, fake_provider):
+    primary, backup = provider_pool(fake_provider("primary", error_rate=1.0), fake_provider("backup"))
+    
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/generate-ruleset", json=SPEC)
+        await history_recorder.stop()
+        return response
+    
+    response = asyncio.run(scenario())
+    assert response.status_code == 200
+    assert primary.calls == 1 and backup.calls == 1
+    assert response.json()["json_data"]["ai_provider"] == "backup"
+    
+    project_info = ProjectInfo(**SPEC)
+    served_key = generation_service.spec_key(project_info, "backup", backup.model_name)
+    preferred_key = generation_service.spec_key(project_info, "primary", primary.model_name)
+    assert asyncio.run(ruleset_cache.backend.get(served_key)) is not None
+    assert asyncio.run(ruleset_cache.backend.get(preferred_key)) is None
+    
+    entries = asyncio.run(history_recorder.store.list(10))
+    assert [(entry["ai_provider"], entry["spec_hash"]) for entry in entries] == [("backup", served_key)]
+
+def test_stream_failover_reports_serving_provider(provider_pool, fake_provider):
+    provider_pool(fake_provider("primary", error_rate=1.0), fake_provider("backup"))
+    
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/generate-ruleset/stream", json=SPEC)
+        await history_recorder.stop()
+        return response
+    
+    response = asyncio.run(scenario())
+    assert '"ai_provider":"backup"' in response.text.split("event: summary")[1]
+    entries = asyncio.run(history_recorder.store.list(10))
+    assert [entry["ai_provider"] for entry in entries] == ["backup"]
+
+def test_sections_record_serving_provider(provider_pool, fake_provider):
+    provider_pool(fake_provider("primary", error_rate=1.0), fake_provider("backup"))
+    
+    async def scenario():
+        result = await generation_service.generate(ProjectInfo(**SPEC), strategy="sections")
+        await history_recorder.stop()
+        return result
+    
+    result = asyncio.run(scenario())
+    assert result.ai_provider == "backup"
+    assert ai_service.provider_name == "backup"
+    entries = asyncio.run(history_recorder.store.list(10))
+    assert [(entry["ai_provider"], entry["strategy"]) for entry in entries] == [("backup", "sections")]
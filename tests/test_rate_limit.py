@@ -0,0 +1,125 @@
+"""
+Rate limiting: istemci anahtarı/IP seçimi, token bucket ve admission control
+"""
+import asyncio
+import httpx
+import pytest
+import main
+from app.services.history_service import history_recorder
+from app.services.rate_limit_service import (
+    AdmissionController,
+    MemoryRateLimitBackend,
+    OverCapacityError,
+    RateLimiter,
+    SQLiteRateLimitBackend,
+    rate_limiter
+)
+
+SPEC = {"project_category": "frontend", "project_type": "Web Application", "frontend_framework": "React"}
+
+@pytest.fixture
+def strict_limiter(monkeypatch):
+    """Global limiter'ı dakikada 1 token, burst=2 ve tek tanımlı anahtarla çalıştır"""
+    limiter = RateLimiter(MemoryRateLimitBackend(100), per_minute=1, burst=2, client_keys=["team-key"])
+    for name in ("backend", "rate", "capacity", "enabled", "client_keys"):
+        monkeypatch.setattr(rate_limiter, name, getattr(limiter, name))
+    monkeypatch.setattr(rate_limiter, "rejected", 0)
+    return rate_limiter
+
+def post_many(headers_list):
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            statuses = [
+                (await client.post("/generate-ruleset", json=SPEC, headers=headers)).status_code
+                for headers in headers_list
+            ]
+        await history_recorder.stop()
+        return statuses
+    return asyncio.run(scenario())
+
+def test_rotating_client_key_is_still_limited(strict_limiter, provider_pool, fake_provider):
+    provider_pool(fake_provider())
+    statuses = post_many([{"X-Client-Key": f"rotated-{i}"} for i in range(20)])
+    assert statuses.count(429) == 18
+    assert strict_limiter.rejected == 18
+
+def test_configured_client_key_gets_own_bucket(strict_limiter, provider_pool, fake_provider):
+    provider_pool(fake_provider())
+    statuses = post_many([{}, {}, {}, {"X-Client-Key": "team-key"}, {"X-Client-Key": "team-key"}])
+    assert statuses[2] == 429
+    assert 429 not in statuses[3:]
+
+def post_batch_then_single(size: int, singles: int):
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            batch = await client.post("/generate-ruleset/batch", json={"items": [SPEC] * size})
+            statuses = [(await client.post("/generate-ruleset", json=SPEC)).status_code for _ in range(singles)]
+        await history_recorder.stop()
+        return batch, statuses
+    return asyncio.run(scenario())
+
+def test_batch_larger_than_burst_is_rejected_without_charge(strict_limiter, provider_pool, fake_provider):
+    provider_pool(fake_provider())
+    batch, statuses = post_batch_then_single(3, 2)
+    assert batch.status_code == 413
+    # Reddedilen batch bucket'tan token harcamaz
+    assert statuses == [200, 200]
+
+def test_batch_charges_one_token_per_item(strict_limiter, provider_pool, fake_provider):
+    provider_pool(fake_provider())
+    batch, statuses = post_batch_then_single(2, 1)
+    assert batch.status_code == 200
+    assert statuses == [429]
+
+def test_memory_bucket_refills_over_time():
+    backend = MemoryRateLimitBackend(10)
+    
+    async def scenario():
+        first = [await backend.consume("ip:a", 100.0, 2, 1) for _ in range(3)]
+        await asyncio.sleep(0.02)
+        return first, await backend.consume("ip:a", 100.0, 2, 1)
+    
+    first, refilled = asyncio.run(scenario())
+    assert first[:2] == [0.0, 0.0]
+    assert first[2] > 0
+    assert refilled == 0.0
+
+def test_memory_backend_evicts_oldest_client():
+    backend = MemoryRateLimitBackend(2)
+    
+    async def scenario():
+        for key in ("ip:a", "ip:b", "ip:c"):
+            await backend.consume(key, 1.0, 1, 1)
+    
+    asyncio.run(scenario())
+    assert list(backend._buckets) == ["ip:b", "ip:c"]
+
+def test_sqlite_buckets_are_shared(tmp_path):
+    path = str(tmp_path / "rate_limit.db")
+    first, second = SQLiteRateLimitBackend(path, 100), SQLiteRateLimitBackend(path, 100)
+    
+    async def scenario():
+        # Aynı dosyayı kullanan iki worker aynı bucket'tan harcar
+        return [await first.consume("ip:a", 0.01, 2, 1), await second.consume("ip:a", 0.01, 2, 1),
+                await first.consume("ip:a", 0.01, 2, 1)]
+    
+    waits = asyncio.run(scenario())
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] > 0
+
+def test_admission_rejects_when_full():
+    controller = AdmissionController(1)
+    
+    async def scenario():
+        async with controller.slot():
+            with pytest.raises(OverCapacityError):
+                async with controller.slot():
+                    pass
+        async with controller.slot():
+            return controller.in_flight
+    
+    assert asyncio.run(scenario()) == 1
+    assert controller.rejected == 1
+    assert controller.in_flight == 0
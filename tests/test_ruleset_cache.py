@@ -0,0 +1,114 @@
+"""
+Ruleset cache: canonical anahtarlar, TTL/LRU backend'leri ve endpoint üzerinden isabet
+"""
+import asyncio
+import httpx
+import pytest
+import main
+from app.models.schemas import ProjectInfo
+from app.services.cache_service import CacheBackend, MemoryCacheBackend, RulesetCache, SQLiteCacheBackend
+from app.services.history_service import history_recorder
+from app.services.prompt_service import PromptService
+
+SPEC = {
+    "project_category": "frontend",
+    "project_type": "Web Application",
+    "frontend_framework": "React",
+    "additional_requirements": ["i18n", "Dark mode"]
+}
+
+def key_for(provider_name: str = "gemini", model_name: str = "gemini-pro", variant: str = "", **fields) -> str:
+    return RulesetCache.make_key(ProjectInfo(**{**SPEC, **fields}), provider_name, model_name, variant)
+
+def test_key_ignores_formatting_differences():
+    default_styling = PromptService.FIELD_DEFAULTS["styling_approach"]
+    assert key_for() == key_for(project_type="  web application ", frontend_framework="REACT")
+    assert key_for() == key_for(additional_requirements=["dark mode", "I18N", " "])
+    # Boş alan, şablonun kullandığı varsayılanla aynı ruleset'i üretir
+    assert key_for() == key_for(styling_approach=default_styling)
+    assert key_for() == key_for(provider_name=" Gemini", model_name="GEMINI-PRO")
+
+def test_key_separates_spec_provider_model_and_variant():
+    keys = {
+        key_for(),
+        key_for(frontend_framework="Vue"),
+        key_for(testing_requirement=True),
+        key_for(provider_name="openai"),
+        key_for(model_name="gemini-flash"),
+        key_for(variant="max_output_tokens=1024")
+    }
+    assert len(keys) == 6
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_backend(request, tmp_path):
+    def make(max_entries: int = 10, ttl: float = 60) -> CacheBackend:
+        if request.param == "memory":
+            return MemoryCacheBackend(max_entries, ttl)
+        return SQLiteCacheBackend(str(tmp_path / "cache.db"), max_entries, ttl)
+    return make
+
+def test_backend_evicts_least_recently_used(make_backend):
+    backend = make_backend(max_entries=2)
+    
+    async def scenario():
+        await backend.set("a", "A")
+        await backend.set("b", "B")
+        # a okunduğu için en son kullanılan olur; c eklenince b silinir
+        await asyncio.sleep(0.001)
+        await backend.get("a")
+        await asyncio.sleep(0.001)
+        evicted = await backend.set("c", "C")
+        return evicted, [await backend.get(key) for key in ("a", "b", "c")]
+    
+    evicted, values = asyncio.run(scenario())
+    assert evicted == 1
+    assert values == ["A", None, "C"]
+    assert backend.size() == 2
+
+def test_backend_expires_entries(make_backend):
+    backend = make_backend(ttl=-1)
+    
+    async def scenario():
+        await backend.set("a", "A")
+        return await backend.get("a")
+    
+    assert asyncio.run(scenario()) is None
+    assert backend.size() == 0
+
+def test_sqlite_backend_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    asyncio.run(SQLiteCacheBackend(path, 10, 60).set("a", "A"))
+    assert asyncio.run(SQLiteCacheBackend(path, 10, 60).get("a")) == "A"
+
+def test_cache_counts_hits_and_respects_disabled():
+    cache = RulesetCache(MemoryCacheBackend(10, 60))
+    
+    async def scenario():
+        await cache.set("a", "A")
+        values = [await cache.get("a"), await cache.get("b")]
+        cache.enabled = False
+        await cache.set("c", "C")
+        values.append(await cache.get("a"))
+        return values
+    
+    assert asyncio.run(scenario()) == ["A", None, None]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.backend.size() == 1
+
+def test_repeated_request_is_served_from_cache(provider_pool, fake_provider):
+    (provider,) = provider_pool(fake_provider())
+    variant = {**SPEC, "project_type": "web application", "additional_requirements": ["Dark mode", "i18n"]}
+    
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.post("/generate-ruleset", json=SPEC)
+            second = await client.post("/generate-ruleset", json=variant)
+        await history_recorder.stop()
+        return first.json(), second.json()
+    
+    first, second = asyncio.run(scenario())
+    assert provider.calls == 1
+    assert first["json_data"]["cache_hit"] is False
+    assert second["json_data"]["cache_hit"] is True
+    assert second["markdown"] == first["markdown"]
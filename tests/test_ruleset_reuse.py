@@ -0,0 +1,95 @@
+"""
+Cache'ten yeniden kullanım: exact isabet, benzer spec eşleşmesi ve yeni üretimin ayırt edilmesi
+"""
+import asyncio
+import httpx
+import pytest
+import main
+from app.models.schemas import ProjectInfo
+from app.services.history_service import history_recorder
+from app.services.similarity_service import SimilarityIndex
+from app.core.config import settings
+
+SPEC = {"project_category": "frontend", "project_type": "Web Application", "frontend_framework": "React"}
+# Yalnızca noktalama farkı: cache anahtarı farklı, benzerlik mesafesi 0
+SAME_STACK = {**SPEC, "project_type": "Web-Application"}
+
+def generate_all(requests):
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = [
+                (await client.post(path, json=spec)).json()["json_data"]
+                for path, spec in requests
+            ]
+        await history_recorder.stop()
+        return responses
+    return asyncio.run(scenario())
+
+def test_match_type_separates_exact_and_similar_hits(provider_pool, fake_provider):
+    (provider,) = provider_pool(fake_provider())
+    fresh, exact, similar = generate_all([
+        ("/generate-ruleset", SPEC),
+        ("/generate-ruleset", SPEC),
+        ("/generate-ruleset?reuse=similar", SAME_STACK)
+    ])
+    assert provider.calls == 1
+    assert (fresh["cache_hit"], fresh["match_type"], fresh["match_distance"]) == (False, "none", None)
+    assert (exact["cache_hit"], exact["match_type"], exact["match_distance"]) == (True, "exact", 0.0)
+    assert (similar["cache_hit"], similar["match_type"], similar["match_distance"]) == (True, "similar", 0.0)
+
+def test_exact_reuse_ignores_similar_spec(provider_pool, fake_provider):
+    (provider,) = provider_pool(fake_provider())
+    _, regenerated = generate_all([
+        ("/generate-ruleset", SPEC),
+        ("/generate-ruleset?reuse=exact", SAME_STACK)
+    ])
+    assert provider.calls == 2
+    assert regenerated["match_type"] == "none"
+
+def test_stream_summary_reports_match_type(provider_pool, fake_provider):
+    provider_pool(fake_provider())
+    
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.post("/generate-ruleset", json=SPEC)
+            response = await client.post("/generate-ruleset/stream?reuse=similar", json=SAME_STACK)
+        await history_recorder.stop()
+        return response
+    
+    summary = asyncio.run(scenario()).text.split("event: summary")[1]
+    assert '"match_type":"similar"' in summary
+
+BACKEND = {"project_category": "backend", "project_type": "API/Microservice", "backend_framework": "FastAPI",
+           "backend_language": "Python", "database_type": "PostgreSQL"}
+FRONTEND = {**SPEC, "state_management": "Redux Toolkit", "styling_approach": "Tailwind CSS"}
+
+def nearest(stored, wanted):
+    index = SimilarityIndex()
+    index.add("stored", ProjectInfo(**stored), "scope")
+    return index.find(ProjectInfo(**wanted), "scope", settings.SIMILARITY_MAX_DISTANCE)
+
+@pytest.mark.parametrize("stored, wanted", [
+    (BACKEND, {**BACKEND, "database_type": "MongoDB"}),
+    (BACKEND, {**BACKEND, "orm_tool": "SQLAlchemy"}),
+    (BACKEND, {**BACKEND, "api_style": "GraphQL"}),
+    (FRONTEND, {**FRONTEND, "state_management": "Zustand"}),
+    (FRONTEND, {**FRONTEND, "styling_approach": "Styled Components"}),
+    (FRONTEND, {**FRONTEND, "ui_library": "Material-UI"})
+])
+def test_different_stack_library_never_matches(stored, wanted):
+    assert nearest(stored, wanted) is None
+
+def test_trivia_difference_still_matches():
+    match = nearest(FRONTEND, {**FRONTEND, "code_style": "Airbnb"})
+    assert match is not None and 0 < match.distance <= settings.SIMILARITY_MAX_DISTANCE
+
+def test_similar_reuse_does_not_serve_other_database(provider_pool, fake_provider):
+    (provider,) = provider_pool(fake_provider())
+    _, other = generate_all([
+        ("/generate-ruleset", BACKEND),
+        ("/generate-ruleset?reuse=similar", {**BACKEND, "database_type": "MongoDB"})
+    ])
+    assert provider.calls == 2
+    assert other["match_type"] == "none"